@@ -3,29 +3,58 @@
 Tool to pack a directory into a .docx, .pptx, or .xlsx file with XML formatting undone.
 
 Example usage:
-    python pack.py <input_directory> <office_file> [--force]
+    python pack.py <input_directory> <office_file> [--force] [--jobs N] [--cache DIR]
+
+transform_document() edits parts of an Office file zip to zip, without unpacking:
+    transform_document("in.docx", "out.docx", {"word/comments.xml": fix_comments})
 """
 
 import argparse
-import shutil
+import hashlib
+import io
+import os
+import struct
 import subprocess
 import sys
 import tempfile
+import time
 import defusedxml.minidom
+import xml.parsers.expat
 import zipfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+from unpack import _part_matches
+
 
 def main():
     parser = argparse.ArgumentParser(description="Pack a directory into an Office file")
     parser.add_argument("input_directory", help="Unpacked Office document directory")
     parser.add_argument("output_file", help="Output Office file (.docx/.pptx/.xlsx)")
     parser.add_argument("--force", action="store_true", help="Skip validation")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for condensing XML parts (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        metavar="DIR",
+        help="Reuse condensed, compressed parts from this directory across packs",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     try:
         success = pack_document(
-            args.input_directory, args.output_file, validate=not args.force
+            args.input_directory,
+            args.output_file,
+            validate=not args.force,
+            jobs=args.jobs,
+            cache_dir=args.cache,
         )
 
         # Show warning if validation was skipped
@@ -42,13 +71,20 @@ def main():
         sys.exit(f"Error: {e}")
 
 
-def pack_document(input_dir, output_file, validate=False):
+def pack_document(input_dir, output_file, validate=False, jobs=1, cache_dir=None):
     """Pack a directory into an Office file (.docx/.pptx/.xlsx).
 
+    XML and .rels parts are condensed (see condense_xml) as they are written
+    to the archive; the input directory is not modified. With a cache_dir,
+    parts whose content was packed before are copied into the archive from
+    the cache without being condensed or compressed again.
+
     Args:
         input_dir: Path to unpacked Office document directory
         output_file: Path to output Office file
         validate: If True, validates with soffice (default: False)
+        jobs: Number of worker processes condensing XML parts (default: 1)
+        cache_dir: Directory caching packed parts by content (default: no cache)
 
     Returns:
         bool: True if successful, False if validation failed
@@ -61,32 +97,293 @@ def pack_document(input_dir, output_file, validate=False):
     if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
         raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
 
-    # Work in temporary directory to avoid modifying original
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_content_dir = Path(temp_dir) / "content"
-        shutil.copytree(input_dir, temp_content_dir)
-
-        # Process XML files to remove pretty-printing whitespace
-        for pattern in ["*.xml", "*.rels"]:
-            for xml_file in temp_content_dir.rglob(pattern):
-                condense_xml(xml_file)
-
-        # Create final Office file as zip archive
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zf:
-            for f in temp_content_dir.rglob("*"):
-                if f.is_file():
-                    zf.write(f, f.relative_to(temp_content_dir))
-
-        # Validate if requested
-        if validate:
-            if not validate_document(output_file):
-                output_file.unlink()  # Delete the corrupt file
-                return False
+    files = [f for f in input_dir.rglob("*") if f.is_file()]
+
+    # Build the archive next to the output so a failed pack leaves no partial file
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = output_file.with_name(f".{output_file.name}.partial")
+    try:
+        with zipfile.ZipFile(partial_file, "w", zipfile.ZIP_DEFLATED) as zf:
+            if cache_dir is not None:
+                _write_cached_parts(zf, input_dir, files, jobs, _PartCache(cache_dir))
+            else:
+                _write_parts(zf, input_dir, files, jobs)
+        os.replace(partial_file, output_file)
+    finally:
+        partial_file.unlink(missing_ok=True)
+
+    # Validate if requested
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()  # Delete the corrupt file
+            return False
 
     return True
 
 
+def transform_document(input_file, output_file, transforms, validate=False):
+    """Copy an Office file to a new one, rewriting only the parts with a transform.
+
+    Parts are streamed from one archive to the other without an unpacked
+    directory. Parts without a transform are copied still compressed;
+    transformed parts are stored as returned, without condensing.
+
+    Args:
+        input_file: Path to the source .docx/.pptx/.xlsx file
+        output_file: Path to the output Office file (may be input_file)
+        transforms: Mapping of part name (e.g. "word/comments.xml") or glob
+            pattern (e.g. "ppt/slides/*.xml") to a callable taking the part's
+            bytes and returning its new bytes; see tree_transform(). A part
+            uses the transform of its exact name, else of the first matching
+            pattern. Wildcards match within one path segment, so
+            "ppt/*.xml" does not match "ppt/slides/slide1.xml".
+        validate: If True, validates with soffice (default: False)
+
+    Returns:
+        bool: True if successful, False if validation failed
+    """
+    input_file = Path(input_file)
+    output_file = Path(output_file)
+    if output_file.suffix.lower() not in {".docx", ".pptx", ".xlsx"}:
+        raise ValueError(f"{output_file} must be a .docx, .pptx, or .xlsx file")
+
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    partial_file = output_file.with_name(f".{output_file.name}.partial")
+    try:
+        with zipfile.ZipFile(input_file) as source, open(input_file, "rb") as raw:
+            infos = source.infolist()
+            selected = _select_transforms([i.filename for i in infos], transforms)
+            with zipfile.ZipFile(partial_file, "w", zipfile.ZIP_DEFLATED) as zf:
+                for info in infos:
+                    transform = selected.get(info.filename)
+                    zinfo = zipfile.ZipInfo(info.filename, info.date_time)
+                    zinfo.external_attr = info.external_attr
+                    if transform is not None:
+                        zinfo.compress_type = zipfile.ZIP_DEFLATED
+                        zf.writestr(zinfo, transform(source.read(info)))
+                    else:
+                        zinfo.compress_type = info.compress_type
+                        data = _read_compressed(raw, info)
+                        _write_compressed(zf, zinfo, info.CRC, info.file_size, data)
+        os.replace(partial_file, output_file)
+    finally:
+        partial_file.unlink(missing_ok=True)
+
+    if validate:
+        if not validate_document(output_file):
+            output_file.unlink()
+            return False
+
+    return True
+
+
+def tree_transform(func):
+    """Turn a function editing a parsed XML part into a transform on bytes.
+
+    func gets the part as a minidom Document and either edits it in place and
+    returns None, or returns a replacement Document.
+    """
+
+    def transform(data):
+        dom = defusedxml.minidom.parseString(data)
+        result = func(dom)
+        return (dom if result is None else result).toxml(encoding="UTF-8")
+
+    return transform
+
+
+def _select_transforms(names, transforms):
+    """Map each part name to its transform; fail on transforms matching no part."""
+    selected = {}
+    unused = set(transforms)
+    for name in names:
+        if name in transforms:
+            selected[name] = transforms[name]
+            unused.discard(name)
+            continue
+        for pattern, transform in transforms.items():
+            if _part_matches(name, pattern):
+                selected[name] = transform
+                unused.discard(pattern)
+                break
+    if unused:
+        raise ValueError(f"No parts match: {', '.join(sorted(unused))}")
+    return selected
+
+
+def _read_compressed(f, zinfo):
+    """Read an archive member's data as stored, without decompressing it."""
+    if zinfo.flag_bits & 0x1:
+        raise ValueError(f"{zinfo.filename} is encrypted")
+    f.seek(zinfo.header_offset)
+    header = f.read(zipfile.sizeFileHeader)
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    f.seek(name_length + extra_length, os.SEEK_CUR)
+    return f.read(zinfo.compress_size)
+
+
+def _write_parts(zf, input_dir, files, jobs):
+    """Write files to the archive, condensing XML parts."""
+    xml_files = [f for f in files if _is_xml_part(f)]
+    condensed = _condense_parts(xml_files, jobs) if jobs > 1 else None
+    for f in files:
+        arcname = f.relative_to(input_dir)
+        if _is_xml_part(f):
+            zinfo = _zip_info(f, arcname)
+            if condensed is not None:
+                zf.writestr(zinfo, next(condensed))
+            else:
+                with zf.open(zinfo, "w") as dest:
+                    write_condensed_xml(f, dest)
+        else:
+            zf.write(f, arcname)
+
+
+def _write_cached_parts(zf, input_dir, files, jobs, cache):
+    """Write files to the archive, packing only parts that are not in the cache."""
+    keys = [cache.key(f) for f in files]
+    missing = [f for f, key in zip(files, keys) if not cache.contains(key)]
+    packed = _pack_parts(missing, jobs)
+    missing = set(missing)
+    for f, key in zip(files, keys):
+        if f in missing:
+            entry = next(packed)
+            cache.store(key, entry)
+        else:
+            # Another pack sharing the cache may have removed the entry since
+            entry = cache.load(key) or _packed_part(f)
+        _write_compressed(zf, _zip_info(f, f.relative_to(input_dir)), *entry)
+
+
+def _is_xml_part(path):
+    return path.name.endswith((".xml", ".rels"))
+
+
+def _zip_info(path, arcname):
+    """Return the ZipInfo a file is added to the archive with."""
+    if _is_xml_part(path):
+        # Stamped like a file rewritten now, as when condensing in place
+        zinfo = zipfile.ZipInfo(str(arcname), time.localtime()[:6])
+        zinfo.external_attr = (path.stat().st_mode & 0xFFFF) << 16
+    else:
+        zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    return zinfo
+
+
+# ZipFile attributes _write_compressed() uses like ZipFile.open(zinfo, "w") does
+_ZIPFILE_INTERNALS = ("_lock", "_writing", "_writecheck", "_didModify", "start_dir")
+
+
+def _write_compressed(zf, zinfo, crc, file_size, data):
+    """Add an archive member from already deflated data.
+
+    ZipFile has no public API for this, so this does what ZipFile.open(zinfo,
+    "w") and closing the member do, minus the compression. If ZipFile lacks
+    the internals this relies on, or a member is open for writing, the data
+    is decompressed and added with writestr() instead.
+    """
+    if not all(hasattr(zf, name) for name in _ZIPFILE_INTERNALS) or zf._writing:
+        if zinfo.compress_type != zipfile.ZIP_STORED:
+            data = zlib.decompress(data, -15)
+        zf.writestr(zinfo, data)
+        return
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = len(data)
+    zinfo.flag_bits = 0
+    zip64 = file_size * 1.05 > zipfile.ZIP64_LIMIT
+    with zf._lock:
+        zf.fp.seek(zf.start_dir)
+        zinfo.header_offset = zf.fp.tell()
+        zf._writecheck(zinfo)
+        zf._didModify = True
+        zf.fp.write(zinfo.FileHeader(zip64))
+        zf.fp.write(data)
+        zf.start_dir = zf.fp.tell()
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+
+
+def _packed_part(path):
+    """Return (CRC-32, size, deflated data) of a file's content in the archive."""
+    content = condensed_xml(path) if _is_xml_part(path) else path.read_bytes()
+    # Same settings as ZipFile uses for ZIP_DEFLATED
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    data = compressor.compress(content) + compressor.flush()
+    return zlib.crc32(content), len(content), data
+
+
+def _pack_parts(files, jobs):
+    """Yield _packed_part() of each file in order, using jobs processes."""
+    if jobs == 1 or len(files) < 2:
+        yield from map(_packed_part, files)
+        return
+    workers = min(jobs, len(files))
+    chunksize = max(1, len(files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(_packed_part, files, chunksize=chunksize)
+
+
+class _PartCache:
+    """Packed parts stored on disk under a hash of the file content.
+
+    Entries are written atomically, so several packs can share a directory.
+    Nothing is ever evicted; the directory can be deleted at any time.
+    """
+
+    # Bump when the condensed output or the entry format changes
+    VERSION = 1
+    _HEADER = struct.Struct("<LQ")  # CRC-32, uncompressed size
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def key(self, path):
+        digest = hashlib.sha256(
+            f"{self.VERSION} {zlib.ZLIB_RUNTIME_VERSION} "
+            f"{_is_xml_part(path)}\n".encode()
+        )
+        with open(path, "rb") as f:
+            while chunk := f.read(1024 * 1024):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return self.directory / key[:2] / key
+
+    def contains(self, key):
+        return self._path(key).is_file()
+
+    def load(self, key):
+        """Return the (CRC-32, size, deflated data) stored under key, or None."""
+        try:
+            data = self._path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        crc, file_size = self._HEADER.unpack_from(data)
+        return crc, file_size, data[self._HEADER.size :]
+
+    def store(self, key, entry):
+        crc, file_size, data = entry
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f".{key}.", delete=False
+        ) as f:
+            f.write(self._HEADER.pack(crc, file_size))
+            f.write(data)
+        os.replace(f.name, path)
+
+
+def _condense_parts(xml_files, jobs):
+    """Yield the condensed content of each XML file in order, using jobs processes."""
+    workers = max(1, min(jobs, len(xml_files)))
+    chunksize = max(1, len(xml_files) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(condensed_xml, xml_files, chunksize=chunksize)
+
+
 def validate_document(doc_path):
     """Validate document by converting to HTML with soffice."""
     # Determine the correct filter based on file extension
@@ -132,27 +429,243 @@ def validate_document(doc_path):
 
 def condense_xml(xml_file):
     """Strip unnecessary whitespace and remove comments."""
+    content = condensed_xml(xml_file)
+    with open(xml_file, "wb") as f:
+        f.write(content)
+
+
+def condensed_xml(xml_file):
+    """Return an XML file's content without pretty-printing whitespace and comments."""
+    output = io.BytesIO()
+    write_condensed_xml(xml_file, output)
+    return output.getvalue()
+
+
+def write_condensed_xml(xml_file, output):
+    """Write an XML file's content without pretty-printing whitespace and comments.
+
+    Removes whitespace-only text and comments from all elements except *:t
+    elements in one streaming pass, so memory does not grow with the file size.
+    On Python 3.12 and earlier, the result is the same as parsing with minidom,
+    removing those nodes and writing toxml(encoding="UTF-8"), except that
+    newlines, carriage returns and tabs in attribute values are written as
+    &#10;, &#13; and &#9; so that they survive being parsed again. Python 3.13's
+    minidom escapes attribute values that way too but no longer escapes " in
+    text, which is still written as &quot;. Files with a DOCTYPE are parsed with
+    minidom and written with the same escaping.
+
+    Args:
+        xml_file: Path to the XML file
+        output: Binary file object to write the condensed XML to
+    """
     with open(xml_file, "r", encoding="utf-8") as f:
-        dom = defusedxml.minidom.parse(f)
+        try:
+            _StreamingCondenser(output).condense(f)
+        except _NeedsDom:
+            f.seek(0)
+            _StreamingCondenser(output).condense_dom(defusedxml.minidom.parse(f))
 
-    # Process each element to remove whitespace and comments
-    for element in dom.getElementsByTagName("*"):
-        # Skip w:t elements and their processing
-        if element.tagName.endswith(":t"):
-            continue
 
-        # Remove whitespace-only text nodes and comment nodes
-        for child in list(element.childNodes):
-            if (
-                child.nodeType == child.TEXT_NODE
-                and child.nodeValue
-                and child.nodeValue.strip() == ""
-            ) or child.nodeType == child.COMMENT_NODE:
-                element.removeChild(child)
+class _NeedsDom(Exception):
+    """Raised when a file uses markup that _StreamingCondenser does not reproduce."""
 
-    # Write back the condensed XML
-    with open(xml_file, "wb") as f:
-        f.write(dom.toxml(encoding="UTF-8"))
+
+class _StreamingCondenser:
+    """expat handlers that write condensed XML as minidom's toxml() would.
+
+    Character data is collected until the next markup event, matching how
+    minidom's builder merges it into text nodes, and dropped if whitespace-only
+    outside *:t elements. Start tags stay open until the element gets content,
+    so elements left without children are written as <tag/>.
+    """
+
+    # Pending output strings collected before they are encoded and written
+    FLUSH_PARTS = 8192
+
+    def __init__(self, output):
+        self._output = output
+        self._parts = []
+        self._text = []  # character data since the last markup event
+        self._cdata = None  # character data of the open CDATA section
+        self._namespaces = []  # xmlns attributes for the next start tag
+        self._stack = []  # [tag, keeps whitespace and comments, start tag open]
+        self._in_root = False
+
+    def condense(self, f):
+        parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+        parser.namespace_prefixes = True
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        # Entity declarations need a DOCTYPE, so they only reach defusedxml
+        parser.StartDoctypeDeclHandler = self._start_doctype
+        parser.StartNamespaceDeclHandler = self._start_namespace
+        parser.StartElementHandler = self._start_element
+        parser.EndElementHandler = self._end_element
+        parser.CharacterDataHandler = self._character_data
+        parser.CommentHandler = self._comment
+        parser.ProcessingInstructionHandler = self._processing_instruction
+        parser.StartCdataSectionHandler = self._start_cdata
+        parser.EndCdataSectionHandler = self._end_cdata
+
+        self._parts.append('<?xml version="1.0" encoding="UTF-8"?>')
+        while True:
+            chunk = f.read(64 * 1024)
+            if not chunk:
+                break
+            parser.Parse(chunk, False)
+        parser.Parse("", True)
+        self._flush()
+
+    def condense_dom(self, dom):
+        """Write a parsed minidom Document as condense() writes its file."""
+        self._parts.append('<?xml version="1.0" encoding="UTF-8"?>')
+        for node in dom.childNodes:
+            self._replay(node)
+        self._flush()
+
+    def _replay(self, node):
+        """Feed a minidom node and its descendants to the expat handlers."""
+        if node.nodeType == node.ELEMENT_NODE:
+            attributes = []
+            for name, value in node.attributes.items():
+                attributes += [name, value]
+            self._start_element(node.tagName, attributes)
+            for child in node.childNodes:
+                self._replay(child)
+            self._end_element(node.tagName)
+        elif node.nodeType == node.TEXT_NODE:
+            self._character_data(node.data)
+        elif node.nodeType == node.CDATA_SECTION_NODE:
+            self._start_cdata()
+            self._character_data(node.data)
+            self._end_cdata()
+        elif node.nodeType == node.COMMENT_NODE:
+            self._comment(node.data)
+        elif node.nodeType == node.PROCESSING_INSTRUCTION_NODE:
+            self._processing_instruction(node.target, node.data)
+        elif node.nodeType == node.DOCUMENT_TYPE_NODE:
+            self._write(node.toxml())
+
+    def _write(self, text):
+        self._parts.append(text)
+        # Output before the root element is held back in case a DOCTYPE follows
+        if self._in_root and len(self._parts) >= self.FLUSH_PARTS:
+            self._flush()
+
+    def _flush(self):
+        data = "".join(self._parts)
+        self._parts = []
+        self._output.write(data.encode("utf-8", "xmlcharrefreplace"))
+
+    def _open_parent(self):
+        """Close the current element's start tag before writing its first child."""
+        if self._stack and self._stack[-1][2]:
+            self._write(">")
+            self._stack[-1][2] = False
+
+    def _write_text(self):
+        if not self._text:
+            return
+        text = "".join(self._text)
+        self._text = []
+        if text.strip() == "" and not self._stack[-1][1]:
+            return
+        self._open_parent()
+        self._write(_escape_text(text))
+
+    def _start_doctype(self, *args):
+        raise _NeedsDom
+
+    def _start_namespace(self, prefix, uri):
+        name = f"xmlns:{prefix}" if prefix else "xmlns"
+        self._namespaces.append(f' {name}="{_escape_attribute(uri or "")}"')
+
+    def _start_element(self, name, attributes):
+        self._write_text()
+        self._open_parent()
+        self._in_root = True
+        tag = _qualified_name(name)
+        self._write(f"<{tag}")
+        if self._namespaces:
+            self._write("".join(self._namespaces))
+            self._namespaces = []
+        for i in range(0, len(attributes), 2):
+            self._write(
+                f' {_qualified_name(attributes[i])}="{_escape_attribute(attributes[i + 1])}"'
+            )
+        self._stack.append([tag, tag.endswith(":t"), True])
+
+    def _end_element(self, name):
+        self._write_text()
+        tag, _, start_open = self._stack.pop()
+        self._write("/>" if start_open else f"</{tag}>")
+
+    def _character_data(self, data):
+        if self._cdata is not None:
+            self._cdata.append(data)
+        else:
+            self._text.append(data)
+
+    def _comment(self, data):
+        self._write_text()
+        if self._stack and not self._stack[-1][1]:
+            return
+        self._open_parent()
+        self._write(f"<!--{data}-->")
+
+    def _processing_instruction(self, target, data):
+        self._write_text()
+        self._open_parent()
+        self._write(f"<?{target} {data}?>")
+
+    def _start_cdata(self):
+        self._cdata = []
+
+    def _end_cdata(self):
+        data = "".join(self._cdata)
+        self._cdata = None
+        # minidom creates no node for an empty CDATA section, so text around
+        # it stays one text node
+        if data:
+            self._write_text()
+            self._open_parent()
+            self._write(f"<![CDATA[{data}]]>")
+
+
+def _qualified_name(name):
+    """Turn an expat "uri localname prefix" name back into prefix:localname."""
+    parts = name.split(" ")
+    if len(parts) == 3:
+        return f"{parts[2]}:{parts[1]}"
+    if len(parts) == 2:
+        return parts[1]
+    if len(parts) == 1:
+        return name
+    raise ValueError(f"Unsupported syntax: spaces in URIs not supported: {name!r}")
+
+
+def _escape_text(data):
+    """Escape character data as minidom does when writing, up to Python 3.12."""
+    return (
+        data.replace("&", "&amp;")
+        .replace("<", "&lt;")
+        .replace('"', "&quot;")
+        .replace(">", "&gt;")
+    )
+
+
+def _escape_attribute(data):
+    """Escape an attribute value so that parsing it again gives the same value.
+
+    Newlines, carriage returns and tabs are written as character references;
+    written as is, they would be normalized to spaces when the file is parsed.
+    """
+    return (
+        _escape_text(data)
+        .replace("\n", "&#10;")
+        .replace("\r", "&#13;")
+        .replace("\t", "&#9;")
+    )
 
 
 if __name__ == "__main__":
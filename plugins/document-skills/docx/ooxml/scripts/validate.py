@@ -3,14 +3,19 @@
 Command line tool to validate Office document XML files against XSD schemas and tracked changes.
 
 Usage:
-    python validate.py <dir> --original <original_file>
+    python validate.py <dir> --original <original_file> [--jobs N] [--manifest FILE]
 """
 
 import argparse
 import sys
 from pathlib import Path
 
-from validation import DOCXSchemaValidator, PPTXSchemaValidator, RedliningValidator
+from validation import (
+    DOCXSchemaValidator,
+    PPTXSchemaValidator,
+    RedliningValidator,
+    ValidationManifest,
+)
 
 
 def main():
@@ -30,7 +35,21 @@ def main():
         action="store_true",
         help="Enable verbose output",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for XSD validation of parts (default: 1)",
+    )
+    parser.add_argument(
+        "--manifest",
+        metavar="FILE",
+        help="Reuse check results of parts unchanged since the run that wrote FILE,"
+        " then update it",
+    )
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
 
     # Validate paths
     unpacked_dir = Path(args.unpacked_dir)
@@ -53,11 +72,19 @@ def main():
             sys.exit(1)
 
     # Run validators
+    manifest = ValidationManifest.load(args.manifest) if args.manifest else None
     success = True
     for V in validators:
-        validator = V(unpacked_dir, original_file, verbose=args.verbose)
+        options = (
+            {}
+            if V is RedliningValidator
+            else {"workers": args.jobs, "manifest": manifest}
+        )
+        validator = V(unpacked_dir, original_file, verbose=args.verbose, **options)
         if not validator.validate():
             success = False
+    if manifest is not None:
+        manifest.save(args.manifest)
 
     if success:
         print("All validations PASSED!")
@@ -76,37 +76,10 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_uuid_ids(self):
         """Validate that ID attributes that look like UUIDs contain only hex values."""
-        import lxml.etree
-
         errors = []
-        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
-        uuid_pattern = re.compile(
-            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
-        )
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Check all elements for ID attributes
-                for elem in root.iter():
-                    for attr, value in elem.attrib.items():
-                        # Check if this is an ID attribute
-                        attr_name = attr.split("}")[-1].lower()
-                        if attr_name == "id" or attr_name.endswith("id"):
-                            # Check if value looks like a UUID (has the right length and pattern structure)
-                            if self._looks_like_uuid(value):
-                                # Validate that it contains only hex characters in the right positions
-                                if not uuid_pattern.match(value):
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
-                                    )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
+            errors.extend(self._part_result("uuid_ids", xml_file, self._uuid_id_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} UUID ID validation errors:")
@@ -118,6 +91,38 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All UUID-like IDs contain valid hex values")
             return True
 
+    def _uuid_id_errors(self, xml_file):
+        """Return the errors of UUID-like IDs with invalid hex values in a file."""
+        import lxml.etree
+
+        errors = []
+        # UUID pattern: 8-4-4-4-12 hex digits with optional braces/hyphens
+        uuid_pattern = re.compile(
+            r"^[\{\(]?[0-9A-Fa-f]{8}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{4}-?[0-9A-Fa-f]{12}[\}\)]?$"
+        )
+
+        try:
+            root = self._parse(xml_file).getroot()
+
+            # Check all elements for ID attributes
+            for elem in root.iter():
+                for attr, value in elem.attrib.items():
+                    # Check if this is an ID attribute
+                    attr_name = attr.split("}")[-1].lower()
+                    if attr_name == "id" or attr_name.endswith("id"):
+                        # Check if value looks like a UUID (has the right length and pattern structure)
+                        if self._looks_like_uuid(value):
+                            # Validate that it contains only hex characters in the right positions
+                            if not uuid_pattern.match(value):
+                                errors.append(
+                                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                    f"Line {elem.sourceline}: ID '{value}' appears to be a UUID but contains invalid hex characters"
+                                )
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}")
+        return errors
+
     def _looks_like_uuid(self, value):
         """Check if a value has the general structure of a UUID."""
         # Remove common UUID delimiters
@@ -127,8 +132,6 @@ class PPTXSchemaValidator(BaseSchemaValidator):
 
     def validate_slide_layout_ids(self):
         """Validate that sldLayoutId elements in slide masters reference valid slide layouts."""
-        import lxml.etree
-
         errors = []
 
         # Find all slide master files
@@ -140,52 +143,16 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             return True
 
         for slide_master in slide_masters:
-            try:
-                # Parse the slide master file
-                root = lxml.etree.parse(str(slide_master)).getroot()
-
-                # Find the corresponding _rels file for this slide master
-                rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
-
-                if not rels_file.exists():
-                    errors.append(
-                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                        f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
-                    )
-                    continue
-
-                # Parse the relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Build a set of valid relationship IDs that point to slide layouts
-                valid_layout_rids = set()
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "slideLayout" in rel_type:
-                        valid_layout_rids.add(rel.get("Id"))
-
-                # Find all sldLayoutId elements in the slide master
-                for sld_layout_id in root.findall(
-                    f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"
-                ):
-                    r_id = sld_layout_id.get(
-                        f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id"
-                    )
-                    layout_id = sld_layout_id.get("id")
-
-                    if r_id and r_id not in valid_layout_rids:
-                        errors.append(
-                            f"  {slide_master.relative_to(self.unpacked_dir)}: "
-                            f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
-                            f"references r:id='{r_id}' which is not found in slide layout relationships"
-                        )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+            # Find the corresponding _rels file for this slide master
+            rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
+            errors.extend(
+                self._part_result(
+                    "slide_layout_ids",
+                    slide_master,
+                    self._slide_layout_id_errors,
+                    depends_on=(self._content_hash(rels_file),),
                 )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} slide layout ID validation errors:")
@@ -200,35 +167,68 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slide layout IDs reference valid slide layouts")
             return True
 
-    def validate_no_duplicate_slide_layouts(self):
-        """Validate that each slide has exactly one slideLayout reference."""
+    def _slide_layout_id_errors(self, slide_master):
+        """Return the errors of a slide master's sldLayoutId references."""
         import lxml.etree
 
         errors = []
-        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+        try:
+            # Parse the slide master file
+            root = self._parse(slide_master).getroot()
 
-        for rels_file in slide_rels_files:
-            try:
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all slideLayout relationships
-                layout_rels = [
-                    rel
-                    for rel in root.findall(
-                        f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                    )
-                    if "slideLayout" in rel.get("Type", "")
-                ]
+            # Find the corresponding _rels file for this slide master
+            rels_file = slide_master.parent / "_rels" / f"{slide_master.name}.rels"
 
-                if len(layout_rels) > 1:
+            if not rels_file.exists():
+                errors.append(
+                    f"  {slide_master.relative_to(self.unpacked_dir)}: "
+                    f"Missing relationships file: {rels_file.relative_to(self.unpacked_dir)}"
+                )
+                return errors
+
+            # Parse the relationships file
+            rels_root = self._parse(rels_file).getroot()
+
+            # Build a set of valid relationship IDs that point to slide layouts
+            valid_layout_rids = set()
+            for rel in rels_root.findall(
+                f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                rel_type = rel.get("Type", "")
+                if "slideLayout" in rel_type:
+                    valid_layout_rids.add(rel.get("Id"))
+
+            # Find all sldLayoutId elements in the slide master
+            for sld_layout_id in root.findall(
+                f".//{{{self.PRESENTATIONML_NAMESPACE}}}sldLayoutId"
+            ):
+                r_id = sld_layout_id.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                layout_id = sld_layout_id.get("id")
+
+                if r_id and r_id not in valid_layout_rids:
                     errors.append(
-                        f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                        f"  {slide_master.relative_to(self.unpacked_dir)}: "
+                        f"Line {sld_layout_id.sourceline}: sldLayoutId with id='{layout_id}' "
+                        f"references r:id='{r_id}' which is not found in slide layout relationships"
                     )
 
-            except Exception as e:
-                errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            errors.append(
+                f"  {slide_master.relative_to(self.unpacked_dir)}: Error: {e}"
+            )
+        return errors
+
+    def validate_no_duplicate_slide_layouts(self):
+        """Validate that each slide has exactly one slideLayout reference."""
+        errors = []
+        slide_rels_files = list(self.unpacked_dir.glob("ppt/slides/_rels/*.xml.rels"))
+
+        for rels_file in slide_rels_files:
+            errors.extend(
+                self._part_result(
+                    "slide_layouts", rels_file, self._duplicate_slide_layout_errors
                 )
+            )
 
         if errors:
             print("FAILED - Found slides with duplicate slideLayout references:")
@@ -240,10 +240,32 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All slides have exactly one slideLayout reference")
             return True
 
+    def _duplicate_slide_layout_errors(self, rels_file):
+        """Return an error if a slide's .rels file has several slideLayout targets."""
+        errors = []
+        try:
+            root = self._parse(rels_file).getroot()
+
+            # Find all slideLayout relationships
+            layout_rels = [
+                rel
+                for rel in root.findall(
+                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+                )
+                if "slideLayout" in rel.get("Type", "")
+            ]
+
+            if len(layout_rels) > 1:
+                errors.append(
+                    f"  {rels_file.relative_to(self.unpacked_dir)}: has {len(layout_rels)} slideLayout references"
+                )
+
+        except Exception as e:
+            errors.append(f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}")
+        return errors
+
     def validate_notes_slide_references(self):
         """Validate that each notesSlide file is referenced by only one slide."""
-        import lxml.etree
-
         errors = []
         notes_slide_references = {}  # Track which slides reference each notesSlide
 
@@ -256,35 +278,23 @@ class PPTXSchemaValidator(BaseSchemaValidator):
             return True
 
         for rels_file in slide_rels_files:
-            try:
-                # Parse the relationships file
-                root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Find all notesSlide relationships
-                for rel in root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rel_type = rel.get("Type", "")
-                    if "notesSlide" in rel_type:
-                        target = rel.get("Target", "")
-                        if target:
-                            # Normalize the target path to handle relative paths
-                            normalized_target = target.replace("../", "")
-
-                            # Track which slide references this notesSlide
-                            slide_name = rels_file.stem.replace(
-                                ".xml", ""
-                            )  # e.g., "slide1"
-
-                            if normalized_target not in notes_slide_references:
-                                notes_slide_references[normalized_target] = []
-                            notes_slide_references[normalized_target].append(
-                                (slide_name, rels_file)
-                            )
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
+            error, targets = self._part_result(
+                "notes_slides", rels_file, self._notes_slide_targets
+            )
+            if error is not None:
                 errors.append(
-                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {e}"
+                    f"  {rels_file.relative_to(self.unpacked_dir)}: Error: {error}"
+                )
+                continue
+
+            for normalized_target in targets:
+                # Track which slide references this notesSlide
+                slide_name = rels_file.stem.replace(".xml", "")  # e.g., "slide1"
+
+                if normalized_target not in notes_slide_references:
+                    notes_slide_references[normalized_target] = []
+                notes_slide_references[normalized_target].append(
+                    (slide_name, rels_file)
                 )
 
         # Check for duplicate references
@@ -310,6 +320,27 @@ class PPTXSchemaValidator(BaseSchemaValidator):
                 print("PASSED - All notes slide references are unique")
             return True
 
+    def _notes_slide_targets(self, rels_file):
+        """Return [parse error or None, notesSlide targets] of a slide's .rels file."""
+        try:
+            # Parse the relationships file
+            root = self._parse(rels_file).getroot()
+        except Exception as e:
+            return [str(e), []]
+
+        # Find all notesSlide relationships
+        targets = []
+        for rel in root.findall(
+            f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+        ):
+            rel_type = rel.get("Type", "")
+            if "notesSlide" in rel_type:
+                target = rel.get("Target", "")
+                if target:
+                    # Normalize the target path to handle relative paths
+                    targets.append(target.replace("../", ""))
+        return [None, targets]
+
 
 if __name__ == "__main__":
     raise RuntimeError("This module should not be run directly.")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Compare the minidom and lxml editor backends on a Word document part.
+
+Each backend runs in its own subprocess so peak memory is measured independently.
+Reports parse time, peak memory growth, node lookup latency, edit and save time.
+
+Example usage (from the docx skill root):
+    python -m scripts.benchmark unpacked/word/document.xml
+    python -m scripts.benchmark --paragraphs 50000
+"""
+
+import argparse
+import json
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKENDS = ("minidom", "lxml")
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def synthesize_document(path, paragraphs):
+    """Write a document.xml with the given number of paragraphs and some tracked changes."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n')
+        f.write(f'<w:document xmlns:w="{W_NAMESPACE}">\n<w:body>\n')
+        for i in range(paragraphs):
+            f.write(f'<w:p w:rsidR="00AB{i % 10000:04d}">\n')
+            f.write(f"  <w:r><w:t>Paragraph {i} of the benchmark text.</w:t></w:r>\n")
+            if i % 10 == 0:
+                f.write(
+                    f'  <w:ins w:id="{i}" w:author="Jane"><w:r><w:t>ins{i}</w:t></w:r></w:ins>\n'
+                )
+            f.write("</w:p>\n")
+        f.write("</w:body>\n</w:document>\n")
+
+
+def _peak_rss_kib():
+    """Peak resident set size of this process in KiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _timed(func, repeat=1):
+    """Return (result of the last call, mean seconds per call)."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def run_backend(backend, xml_path):
+    """Benchmark one backend against a scratch copy of xml_path and return the results."""
+    from .document import EDITOR_BACKENDS
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_path = Path(temp_dir) / Path(xml_path).name
+        shutil.copy2(xml_path, work_path)
+        editor_class = EDITOR_BACKENDS[backend]
+
+        rss_before = _peak_rss_kib()
+        editor, parse_seconds = _timed(
+            lambda: editor_class(work_path, rsid="00000000", author="Benchmark")
+        )
+        rss_growth = _peak_rss_kib() - rss_before
+
+        paragraphs = editor.get_nodes("w:p")
+        middle = max(len(paragraphs) // 2, 1) - 1
+        target = paragraphs[middle] if paragraphs else None
+
+        _, attr_seconds = _timed(
+            lambda: editor.get_nodes("w:ins", attrs={"w:author": "Jane"}), repeat=5
+        )
+        line_seconds = None
+        if target is not None:
+            line = (
+                target.sourceline
+                if backend == "lxml"
+                else target.parse_position[0]  # type: ignore
+            )
+            _, line_seconds = _timed(
+                lambda: editor.get_nodes("w:p", line_number=line), repeat=5
+            )
+        _, contains_seconds = _timed(
+            lambda: editor.get_nodes("w:r", contains=f"Paragraph {middle} "), repeat=5
+        )
+
+        body = editor.get_nodes("w:body")[0]
+        _, edit_seconds = _timed(
+            lambda: editor.append_to(body, "<w:p><w:r><w:t>Added</w:t></w:r></w:p>"),
+            repeat=20,
+        )
+        _, save_seconds = _timed(editor.save)
+
+    return {
+        "backend": backend,
+        "paragraphs": len(paragraphs),
+        "parse_s": parse_seconds,
+        "peak_rss_growth_kib": rss_growth,
+        "lookup_attr_s": attr_seconds,
+        "lookup_line_s": line_seconds,
+        "lookup_contains_s": contains_seconds,
+        "append_s": edit_seconds,
+        "save_s": save_seconds,
+    }
+
+
+def format_results(results):
+    """Format benchmark results as an aligned text table."""
+    columns = [key for key in results[0] if key != "backend"]
+    lines = [f"{'metric':<22}" + "".join(f"{r['backend']:>14}" for r in results)]
+    for column in columns:
+        cells = []
+        for result in results:
+            value = result[column]
+            if value is None:
+                cells.append(f"{'-':>14}")
+            elif isinstance(value, float):
+                cells.append(f"{value * 1000:>12.2f}ms")
+            else:
+                cells.append(f"{value:>14}")
+        lines.append(f"{column:<22}" + "".join(cells))
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark XML editor backends")
+    parser.add_argument("xml_file", nargs="?", help="Word XML part, e.g. word/document.xml")
+    parser.add_argument(
+        "--paragraphs",
+        type=int,
+        help="Synthesize a document.xml with this many paragraphs instead",
+    )
+    parser.add_argument(
+        "--backend", choices=BACKENDS, action="append", help="Backend(s) to run"
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--worker", nargs=2, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        backend, xml_path = args.worker
+        print(json.dumps(run_backend(backend, xml_path)))
+        return
+
+    if not args.xml_file and not args.paragraphs:
+        parser.error("provide an XML file or --paragraphs")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        xml_path = args.xml_file
+        if args.paragraphs:
+            xml_path = str(Path(temp_dir) / "document.xml")
+            synthesize_document(xml_path, args.paragraphs)
+        elif not Path(xml_path).is_file():
+            print(f"Error: {xml_path} not found", file=sys.stderr)
+            sys.exit(1)
+        xml_path = str(Path(xml_path).resolve())
+
+        results = []
+        for backend in args.backend or BACKENDS:
+            proc = subprocess.run(
+                [sys.executable, "-m", __spec__.name, "--worker", backend, xml_path],
+                capture_output=True,
+                text=True,
+                cwd=Path(__file__).resolve().parent.parent,
+            )
+            if proc.returncode != 0:
+                print(f"Error: {backend} backend failed:\n{proc.stderr}", file=sys.stderr)
+                sys.exit(1)
+            results.append(json.loads(proc.stdout))
+
+    print(json.dumps(results, indent=2) if args.json else format_results(results))
+
+
+if __name__ == "__main__":
+    main()
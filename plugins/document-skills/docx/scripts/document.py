@@ -8,6 +8,7 @@ Usage:
     # Initialize
     doc = Document('workspace/unpacked')
     doc = Document('workspace/unpacked', author="John Doe", initials="JD")
+    doc = Document('workspace/unpacked', backend="lxml")  # Large documents
 
     # Find nodes
     node = doc["word/document.xml"].get_node(tag="w:del", attrs={"w:id": "1"})
@@ -26,19 +27,26 @@ Usage:
     doc.save()
 """
 
+import copy
+import errno
 import html
+import os
 import random
+import re
 import shutil
 import tempfile
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
 
+import lxml.etree
 from defusedxml import minidom
-from ooxml.scripts.pack import pack_document
+from ooxml.scripts.validation.base import ValidationManifest
 from ooxml.scripts.validation.docx import DOCXSchemaValidator
 from ooxml.scripts.validation.redlining import RedliningValidator
 
-from .utilities import XMLEditor
+from .utilities import LxmlXMLEditor, XMLEditor, _replacing_file
 
 # Path to template files
 TEMPLATE_DIR = Path(__file__).parent / "templates"
@@ -57,7 +65,12 @@ class DocxXMLEditor(XMLEditor):
     """
 
     def __init__(
-        self, xml_path, rsid: str, author: str = "Claude", initials: str = "C"
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        change_ids=None,
     ):
         """Initialize with required RSID and optional author.
 
@@ -66,17 +79,32 @@ class DocxXMLEditor(XMLEditor):
             rsid: RSID to automatically apply to new elements
             author: Author name for tracked changes and comments (default: "Claude")
             initials: Author initials (default: "C")
+            change_ids: ChangeIdCounter shared with other parts of the same document
+                (default: a new counter for this part only)
         """
         super().__init__(xml_path)
         self.rsid = rsid
         self.author = author
         self.initials = initials
+        self._change_ids = change_ids if change_ids is not None else ChangeIdCounter()
+        self._change_ids_seeded = False
+
+    def _allocate_change_id(self):
+        """Return a new tracked change ID, unique across the counter's parts.
+
+        This part's existing IDs are scanned once, on first use; afterwards
+        IDs come from the counter without rescanning the DOM.
+        """
+        if not self._change_ids_seeded:
+            self._change_ids.observe(self._get_next_change_id() - 1)
+            self._change_ids_seeded = True
+        return self._change_ids.allocate()
 
     def _get_next_change_id(self):
         """Get the next available change ID by checking all tracked change elements."""
         max_id = -1
         for tag in ("w:ins", "w:del"):
-            elements = self.dom.getElementsByTagName(tag)
+            elements = self._dom.getElementsByTagName(tag)
             for elem in elements:
                 change_id = elem.getAttribute("w:id")
                 if change_id:
@@ -88,30 +116,36 @@ class DocxXMLEditor(XMLEditor):
 
     def _ensure_w16du_namespace(self):
         """Ensure w16du namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16du"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w16du",
                 "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
             )
+            self._index.add([root], deep=False)
+            self._on_namespaces_changed()
 
     def _ensure_w16cex_namespace(self):
         """Ensure w16cex namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w16cex"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w16cex",
                 "http://schemas.microsoft.com/office/word/2018/wordml/cex",
             )
+            self._index.add([root], deep=False)
+            self._on_namespaces_changed()
 
     def _ensure_w14_namespace(self):
         """Ensure w14 namespace is declared on the root element."""
-        root = self.dom.documentElement
+        root = self._dom.documentElement
         if not root.hasAttribute("xmlns:w14"):  # type: ignore
             root.setAttribute(  # type: ignore
                 "xmlns:w14",
                 "http://schemas.microsoft.com/office/word/2010/wordml",
             )
+            self._index.add([root], deep=False)
+            self._on_namespaces_changed()
 
     def _inject_attributes_to_nodes(self, nodes):
         """Inject RSID, author, and date attributes into DOM nodes where applicable.
@@ -127,10 +161,21 @@ class DocxXMLEditor(XMLEditor):
         Args:
             nodes: List of DOM nodes to process
         """
-        from datetime import datetime, timezone
-
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
+        # Each namespace declaration is checked at most once per call
+        ensure_namespace = {
+            "w14": self._ensure_w14_namespace,
+            "w16du": self._ensure_w16du_namespace,
+            "w16cex": self._ensure_w16cex_namespace,
+        }
+        declared = set()
+
+        def declare(prefix):
+            if prefix not in declared:
+                ensure_namespace[prefix]()
+                declared.add(prefix)
+
         def is_inside_deletion(elem):
             """Check if element is inside a w:del element."""
             parent = elem.parentNode
@@ -149,34 +194,25 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidP", self.rsid)
             # Add w14:paraId and w14:textId if not present
             if not elem.hasAttribute("w14:paraId"):
-                self._ensure_w14_namespace()
+                declare("w14")
                 elem.setAttribute("w14:paraId", _generate_hex_id())
             if not elem.hasAttribute("w14:textId"):
-                self._ensure_w14_namespace()
+                declare("w14")
                 elem.setAttribute("w14:textId", _generate_hex_id())
 
-        def add_rsid_to_r(elem):
-            # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
-            if is_inside_deletion(elem):
-                if not elem.hasAttribute("w:rsidDel"):
-                    elem.setAttribute("w:rsidDel", self.rsid)
-            else:
-                if not elem.hasAttribute("w:rsidR"):
-                    elem.setAttribute("w:rsidR", self.rsid)
-
         def add_tracked_change_attrs(elem):
-            # Auto-assign w:id if not present
+            # Auto-assign w:id if not present; keep the counter above given IDs
             if not elem.hasAttribute("w:id"):
-                elem.setAttribute("w:id", str(self._get_next_change_id()))
+                elem.setAttribute("w:id", str(self._allocate_change_id()))
+            else:
+                self._change_ids.observe(elem.getAttribute("w:id"))
             if not elem.hasAttribute("w:author"):
                 elem.setAttribute("w:author", self.author)
             if not elem.hasAttribute("w:date"):
                 elem.setAttribute("w:date", timestamp)
             # Add w16du:dateUtc for tracked changes (same as w:date since we generate UTC timestamps)
-            if elem.tagName in ("w:ins", "w:del") and not elem.hasAttribute(
-                "w16du:dateUtc"
-            ):
-                self._ensure_w16du_namespace()
+            if not elem.hasAttribute("w16du:dateUtc"):
+                declare("w16du")
                 elem.setAttribute("w16du:dateUtc", timestamp)
 
         def add_comment_attrs(elem):
@@ -190,7 +226,7 @@ class DocxXMLEditor(XMLEditor):
         def add_comment_extensible_date(elem):
             # Add w16cex:dateUtc for comment extensible elements
             if not elem.hasAttribute("w16cex:dateUtc"):
-                self._ensure_w16cex_namespace()
+                declare("w16cex")
                 elem.setAttribute("w16cex:dateUtc", timestamp)
 
         def add_xml_space_to_t(elem):
@@ -204,62 +240,48 @@ class DocxXMLEditor(XMLEditor):
                     if not elem.hasAttribute("xml:space"):
                         elem.setAttribute("xml:space", "preserve")
 
+        handlers = {
+            "w:p": add_rsid_to_p,
+            "w:t": add_xml_space_to_t,
+            "w:ins": add_tracked_change_attrs,
+            "w:del": add_tracked_change_attrs,
+            "w:comment": add_comment_attrs,
+            "w16cex:commentExtensible": add_comment_extensible_date,
+        }
+
         for node in nodes:
             if node.nodeType != node.ELEMENT_NODE:
                 continue
 
-            # Handle the node itself
-            if node.tagName == "w:p":
-                add_rsid_to_p(node)
-            elif node.tagName == "w:r":
-                add_rsid_to_r(node)
-            elif node.tagName == "w:t":
-                add_xml_space_to_t(node)
-            elif node.tagName in ("w:ins", "w:del"):
-                add_tracked_change_attrs(node)
-            elif node.tagName == "w:comment":
-                add_comment_attrs(node)
-            elif node.tagName == "w16cex:commentExtensible":
-                add_comment_extensible_date(node)
-
-            # Process descendants (getElementsByTagName doesn't return the element itself)
-            for elem in node.getElementsByTagName("w:p"):
-                add_rsid_to_p(elem)
-            for elem in node.getElementsByTagName("w:r"):
-                add_rsid_to_r(elem)
-            for elem in node.getElementsByTagName("w:t"):
-                add_xml_space_to_t(elem)
-            for tag in ("w:ins", "w:del"):
-                for elem in node.getElementsByTagName(tag):
-                    add_tracked_change_attrs(elem)
-            for elem in node.getElementsByTagName("w:comment"):
-                add_comment_attrs(elem)
-            for elem in node.getElementsByTagName("w16cex:commentExtensible"):
-                add_comment_extensible_date(elem)
-
-    def replace_node(self, elem, new_content):
-        """Replace node with automatic attribute injection."""
-        nodes = super().replace_node(elem, new_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
-
-    def insert_after(self, elem, xml_content):
-        """Insert after with automatic attribute injection."""
-        nodes = super().insert_after(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+            # Walk the subtree once in document order, carrying whether the
+            # current element is inside a w:del instead of looking it up per run
+            stack = [(node, is_inside_deletion(node))]
+            while stack:
+                elem, in_deletion = stack.pop()
+                tag = elem.tagName
+                if tag == "w:r":
+                    # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+                    rsid_attr = "w:rsidDel" if in_deletion else "w:rsidR"
+                    if not elem.hasAttribute(rsid_attr):
+                        elem.setAttribute(rsid_attr, self.rsid)
+                elif tag in handlers:
+                    handlers[tag](elem)
+
+                in_deletion = in_deletion or tag == "w:del"
+                stack.extend(
+                    (child, in_deletion)
+                    for child in reversed(elem.childNodes)
+                    if child.nodeType == child.ELEMENT_NODE
+                )
 
-    def insert_before(self, elem, xml_content):
-        """Insert before with automatic attribute injection."""
-        nodes = super().insert_before(elem, xml_content)
-        self._inject_attributes_to_nodes(nodes)
-        return nodes
+    def _on_insert(self, nodes):
+        """Inject attributes into inserted nodes before they are indexed.
 
-    def append_to(self, elem, xml_content):
-        """Append to with automatic attribute injection."""
-        nodes = super().append_to(elem, xml_content)
+        Runs for every replace_node, insert_after, insert_before and append_to call,
+        or once for all nodes inserted by a batch().
+        """
         self._inject_attributes_to_nodes(nodes)
-        return nodes
+        super()._on_insert(nodes)
 
     def revert_insertion(self, elem):
         """Reject an insertion by wrapping its content in a deletion.
@@ -300,43 +322,7 @@ class DocxXMLEditor(XMLEditor):
             )
 
         # Process all insertions - wrap all children in w:del
-        for ins_elem in ins_elements:
-            runs = list(ins_elem.getElementsByTagName("w:r"))
-            if not runs:
-                continue
-
-            # Create deletion wrapper
-            del_wrapper = self.dom.createElement("w:del")
-
-            # Process each run
-            for run in runs:
-                # Convert w:t → w:delText and w:rsidR → w:rsidDel
-                if run.hasAttribute("w:rsidR"):
-                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
-                    run.removeAttribute("w:rsidR")
-                elif not run.hasAttribute("w:rsidDel"):
-                    run.setAttribute("w:rsidDel", self.rsid)
-
-                for t_elem in list(run.getElementsByTagName("w:t")):
-                    del_text = self.dom.createElement("w:delText")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while t_elem.firstChild:
-                        del_text.appendChild(t_elem.firstChild)
-                    for i in range(t_elem.attributes.length):
-                        attr = t_elem.attributes.item(i)
-                        del_text.setAttribute(attr.name, attr.value)
-                    t_elem.parentNode.replaceChild(del_text, t_elem)
-
-            # Move all children from ins to del wrapper
-            while ins_elem.firstChild:
-                del_wrapper.appendChild(ins_elem.firstChild)
-
-            # Add del wrapper back to ins
-            ins_elem.appendChild(del_wrapper)
-
-            # Inject attributes to the deletion wrapper
-            self._inject_attributes_to_nodes([del_wrapper])
-
+        self._reject_insertions(ins_elements)
         return [elem]
 
     def revert_deletion(self, elem):
@@ -380,33 +366,167 @@ class DocxXMLEditor(XMLEditor):
                 f"The provided element <{elem.tagName}> contains no deletions. "
             )
 
-        # Track created insertion (only relevant if elem is a single w:del)
-        created_insertion = None
-
         # Process all deletions - create insertions that copy the deleted content
+        # (immediately, even inside batch(), so the insertion can be returned)
+        created = self._reject_deletions(del_elements)
+
+        # Return based on input type
+        if is_single_del and created[0] is not None:
+            return [elem, created[0]]
+        else:
+            return [elem]
+
+    def accept_changes(self, elem=None, author=None, since=None, until=None):
+        """Accept tracked changes in bulk with one pass over the tree.
+
+        Matching insertions are unwrapped, keeping their content, and matching
+        deletions are removed with their content. Accepting is not tracked.
+        Paragraph mark changes (w:ins/w:del inside w:rPr) are left as they are.
+
+        Args:
+            elem: Element to process (default: the whole part)
+            author: Only accept changes by this w:author
+            since: Only accept changes with a w:date at or after this ISO 8601
+                date or timestamp, e.g. "2025-01-31"
+            until: Only accept changes with a w:date before this ISO 8601 date or timestamp
+
+        Returns:
+            dict: {"insertions": int, "deletions": int, "seconds": float}
+
+        Example:
+            doc["word/document.xml"].accept_changes(author="Jane Smith")
+        """
+        started = time.perf_counter()
+        insertions, deletions = self._find_changes(elem, author, since, until)
+
+        changed = {}
+        for change in insertions + deletions:
+            parent = change.parentNode
+            if parent is None:
+                continue  # Removed with an enclosing deletion
+            if change.tagName == "w:ins":
+                while change.firstChild:
+                    parent.insertBefore(change.firstChild, change)
+            parent.removeChild(change)
+            changed[parent] = None
+        if changed:
+            self._on_change(list(changed))
+
+        return {
+            "insertions": len(insertions),
+            "deletions": len(deletions),
+            "seconds": time.perf_counter() - started,
+        }
+
+    def reject_changes(self, elem=None, author=None, since=None, until=None):
+        """Reject tracked changes in bulk with one pass over the tree.
+
+        The rejection is itself tracked, as with revert_insertion() and
+        revert_deletion(): matching insertions get their content wrapped in a
+        w:del, and each matching deletion is followed by a w:ins restoring its
+        content. Paragraph mark changes (w:ins/w:del inside w:rPr) are left as they are.
+
+        Args:
+            elem: Element to process (default: the whole part)
+            author: Only reject changes by this w:author
+            since: Only reject changes with a w:date at or after this ISO 8601
+                date or timestamp, e.g. "2025-01-31"
+            until: Only reject changes with a w:date before this ISO 8601 date or timestamp
+
+        Returns:
+            dict: {"insertions": int, "deletions": int, "seconds": float}
+
+        Example:
+            doc["word/document.xml"].reject_changes(author="Jane Smith", since="2025-01-01")
+        """
+        started = time.perf_counter()
+        insertions, deletions = self._find_changes(elem, author, since, until)
+        self._reject_insertions(insertions)
+        self._reject_deletions(deletions)
+        return {
+            "insertions": len(insertions),
+            "deletions": len(deletions),
+            "seconds": time.perf_counter() - started,
+        }
+
+    def _find_changes(self, elem, author, since, until):
+        """Return the (w:ins, w:del) elements in elem matching the filters, in document order."""
+        root = elem if elem is not None else self._dom.documentElement
+        insertions, deletions = [], []
+        for node in [root, *root.getElementsByTagName("*")]:
+            if node.tagName == "w:ins":
+                changes = insertions
+            elif node.tagName == "w:del":
+                changes = deletions
+            else:
+                continue
+            parent = node.parentNode
+            if parent.nodeType == parent.ELEMENT_NODE and parent.tagName == "w:rPr":
+                continue
+            if _change_matches(
+                node.getAttribute("w:author"),
+                node.getAttribute("w:date"),
+                author,
+                since,
+                until,
+            ):
+                changes.append(node)
+        return insertions, deletions
+
+    def _reject_insertions(self, ins_elements):
+        """Wrap the content of each w:ins in a w:del, converting w:t to w:delText in place."""
+        wrappers = []
+        changed = []
+        for ins_elem in ins_elements:
+            runs = ins_elem.getElementsByTagName("w:r")
+            if not runs:
+                continue
+
+            for run in runs:
+                # Convert w:t → w:delText and w:rsidR → w:rsidDel
+                if run.hasAttribute("w:rsidR"):
+                    run.setAttribute("w:rsidDel", run.getAttribute("w:rsidR"))
+                    run.removeAttribute("w:rsidR")
+                elif not run.hasAttribute("w:rsidDel"):
+                    run.setAttribute("w:rsidDel", self.rsid)
+                for t_elem in run.getElementsByTagName("w:t"):
+                    self._dom.renameNode(t_elem, t_elem.namespaceURI, "w:delText")
+
+            # Move all children from ins to a del wrapper inside it
+            del_wrapper = self._dom.createElement("w:del")
+            while ins_elem.firstChild:
+                del_wrapper.appendChild(ins_elem.firstChild)
+            ins_elem.appendChild(del_wrapper)
+            wrappers.append(del_wrapper)
+            changed.append(ins_elem)
+
+        # Inject attributes to the deletion wrappers
+        if wrappers:
+            self._inject_attributes_to_nodes(wrappers)
+            self._on_change(changed)
+
+    def _reject_deletions(self, del_elements):
+        """
+        Insert a w:ins restoring the content of each w:del right after it.
+
+        Returns:
+            list: The created w:ins for each deletion, None where it had no runs
+        """
+        created = []
         for del_elem in del_elements:
             # Clone the deleted runs and convert them to insertions
-            runs = list(del_elem.getElementsByTagName("w:r"))
+            runs = del_elem.getElementsByTagName("w:r")
             if not runs:
+                created.append(None)
                 continue
 
-            # Create insertion wrapper
-            ins_elem = self.dom.createElement("w:ins")
-
+            ins_elem = self._dom.createElement("w:ins")
             for run in runs:
-                # Clone the run
                 new_run = run.cloneNode(True)
 
                 # Convert w:delText → w:t
-                for del_text in list(new_run.getElementsByTagName("w:delText")):
-                    t_elem = self.dom.createElement("w:t")
-                    # Copy ALL child nodes (not just firstChild) to handle entities
-                    while del_text.firstChild:
-                        t_elem.appendChild(del_text.firstChild)
-                    for i in range(del_text.attributes.length):
-                        attr = del_text.attributes.item(i)
-                        t_elem.setAttribute(attr.name, attr.value)
-                    del_text.parentNode.replaceChild(t_elem, del_text)
+                for del_text in new_run.getElementsByTagName("w:delText"):
+                    self._dom.renameNode(del_text, del_text.namespaceURI, "w:t")
 
                 # Update run attributes: w:rsidDel → w:rsidR
                 if new_run.hasAttribute("w:rsidDel"):
@@ -417,18 +537,13 @@ class DocxXMLEditor(XMLEditor):
 
                 ins_elem.appendChild(new_run)
 
-            # Insert the new insertion after the deletion
-            nodes = self.insert_after(del_elem, ins_elem.toxml())
+            del_elem.parentNode.insertBefore(ins_elem, del_elem.nextSibling)
+            created.append(ins_elem)
 
-            # If processing a single w:del, track the created insertion
-            if is_single_del and nodes:
-                created_insertion = nodes[0]
-
-        # Return based on input type
-        if is_single_del and created_insertion:
-            return [elem, created_insertion]
-        else:
-            return [elem]
+        inserted = [node for node in created if node is not None]
+        if inserted:
+            self._on_insert(inserted)
+        return created
 
     @staticmethod
     def suggest_paragraph(xml_content: str) -> str:
@@ -502,7 +617,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Convert w:t → w:delText
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -520,7 +635,7 @@ class DocxXMLEditor(XMLEditor):
                 elem.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap in w:del
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             parent = elem.parentNode
             parent.insertBefore(del_wrapper, elem)
             parent.removeChild(elem)
@@ -528,6 +643,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._on_change([del_wrapper])
 
             return del_wrapper
 
@@ -546,20 +662,20 @@ class DocxXMLEditor(XMLEditor):
                 rPr_list = pPr.getElementsByTagName("w:rPr")
 
                 if not rPr_list:
-                    rPr = self.dom.createElement("w:rPr")
+                    rPr = self._dom.createElement("w:rPr")
                     pPr.appendChild(rPr)
                 else:
                     rPr = rPr_list[0]
 
                 # Add <w:del/> marker
-                del_marker = self.dom.createElement("w:del")
+                del_marker = self._dom.createElement("w:del")
                 rPr.insertBefore(
                     del_marker, rPr.firstChild
                 ) if rPr.firstChild else rPr.appendChild(del_marker)
 
             # Convert w:t → w:delText in all runs
             for t_elem in list(elem.getElementsByTagName("w:t")):
-                del_text = self.dom.createElement("w:delText")
+                del_text = self._dom.createElement("w:delText")
                 # Copy ALL child nodes (not just firstChild) to handle entities
                 while t_elem.firstChild:
                     del_text.appendChild(t_elem.firstChild)
@@ -578,7 +694,7 @@ class DocxXMLEditor(XMLEditor):
                     run.setAttribute("w:rsidDel", self.rsid)
 
             # Wrap all non-pPr children in <w:del>
-            del_wrapper = self.dom.createElement("w:del")
+            del_wrapper = self._dom.createElement("w:del")
             for child in [c for c in elem.childNodes if c.nodeName != "w:pPr"]:
                 elem.removeChild(child)
                 del_wrapper.appendChild(child)
@@ -586,6 +702,7 @@ class DocxXMLEditor(XMLEditor):
 
             # Inject attributes to the deletion wrapper
             self._inject_attributes_to_nodes([del_wrapper])
+            self._on_change([elem])
 
             return elem
 
@@ -593,6 +710,464 @@ class DocxXMLEditor(XMLEditor):
             raise ValueError(f"Element must be w:r or w:p, got {elem.nodeName}")
 
 
+class LxmlDocxXMLEditor(LxmlXMLEditor):
+    """DocxXMLEditor counterpart backed by lxml.etree.
+
+    Applies the same RSID, author, date and ID attributes to inserted content
+    and offers the same tracked change helpers as DocxXMLEditor, but works on
+    lxml elements. Selected with Document(..., backend="lxml").
+
+    Attributes:
+        tree (lxml.etree._ElementTree): The parsed tree for direct manipulation
+    """
+
+    # Namespaces that injected attributes may need, declared on Word part roots at load
+    NAMESPACES = {
+        "w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main",
+        "w14": "http://schemas.microsoft.com/office/word/2010/wordml",
+        "w16du": "http://schemas.microsoft.com/office/word/2023/wordml/word16du",
+        "w16cex": "http://schemas.microsoft.com/office/word/2018/wordml/cex",
+    }
+
+    suggest_paragraph = staticmethod(DocxXMLEditor.suggest_paragraph)
+    _allocate_change_id = DocxXMLEditor._allocate_change_id
+
+    def __init__(
+        self,
+        xml_path,
+        rsid: str,
+        author: str = "Claude",
+        initials: str = "C",
+        change_ids=None,
+    ):
+        """Initialize with required RSID and optional author.
+
+        Args:
+            xml_path: Path to XML file to edit
+            rsid: RSID to automatically apply to new elements
+            author: Author name for tracked changes and comments (default: "Claude")
+            initials: Author initials (default: "C")
+            change_ids: ChangeIdCounter shared with other parts of the same document
+                (default: a new counter for this part only)
+        """
+        super().__init__(xml_path)
+        self.rsid = rsid
+        self.author = author
+        self.initials = initials
+        self._change_ids = change_ids if change_ids is not None else ChangeIdCounter()
+        self._change_ids_seeded = False
+        self._ensure_namespaces()
+
+    def _ensure_namespaces(self):
+        """Declare the w14, w16du and w16cex namespaces on Word part roots.
+
+        lxml cannot add a namespace declaration to an existing element, so they are
+        declared through cleanup_namespaces, keeping every prefix the root already
+        declares (mc:Ignorable refers to prefixes that may otherwise look unused).
+        """
+        root = self._tree.getroot()
+        if lxml.etree.QName(root).namespace != self.NAMESPACES["w"]:
+            return
+        declared = set(root.nsmap.values())
+        missing = {
+            prefix: uri
+            for prefix, uri in self.NAMESPACES.items()
+            if uri not in declared and prefix not in root.nsmap
+        }
+        if not missing:
+            return
+
+        lxml.etree.cleanup_namespaces(
+            self._tree,
+            top_nsmap=missing,
+            keep_ns_prefixes=[p for p in root.nsmap if p] + list(missing),
+        )
+
+    def _w(self, name):
+        """Return the {namespace}local form of a prefixed Word name like "w:ins"."""
+        prefix, local_name = name.split(":", 1)
+        uri = self._namespaces.get(prefix) or self.NAMESPACES[prefix]
+        return f"{{{uri}}}{local_name}"
+
+    def _get_next_change_id(self):
+        """Get the next available change ID by checking all tracked change elements."""
+        max_id = -1
+        id_attr = self._w("w:id")
+        for elem in self._tree.getroot().iter(self._w("w:ins"), self._w("w:del")):
+            change_id = elem.get(id_attr)
+            if change_id:
+                try:
+                    max_id = max(max_id, int(change_id))
+                except ValueError:
+                    pass
+        return max_id + 1
+
+    def _inject_attributes_to_nodes(self, nodes):
+        """Inject RSID, author, and date attributes into lxml nodes where applicable.
+
+        Applies the same rules as DocxXMLEditor._inject_attributes_to_nodes.
+
+        Args:
+            nodes: List of lxml elements to process
+        """
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        w = self._w
+        p_tag, r_tag, t_tag = w("w:p"), w("w:r"), w("w:t")
+        ins_tag, del_tag = w("w:ins"), w("w:del")
+        comment_tag = w("w:comment")
+        comment_ext_tag = w("w16cex:commentExtensible")
+        xml_space = "{http://www.w3.org/XML/1998/namespace}space"
+
+        def set_default(elem, name, value):
+            if elem.get(name) is None:
+                elem.set(name, value)
+
+        for node in nodes:
+            if not isinstance(node.tag, str):
+                continue
+            for elem in node.iter(
+                p_tag, r_tag, t_tag, ins_tag, del_tag, comment_tag, comment_ext_tag
+            ):
+                if elem.tag == p_tag:
+                    set_default(elem, w("w:rsidR"), self.rsid)
+                    set_default(elem, w("w:rsidRDefault"), self.rsid)
+                    set_default(elem, w("w:rsidP"), self.rsid)
+                    set_default(elem, w("w14:paraId"), _generate_hex_id())
+                    set_default(elem, w("w14:textId"), _generate_hex_id())
+                elif elem.tag == r_tag:
+                    # Use w:rsidDel for <w:r> inside <w:del>, otherwise w:rsidR
+                    if next(elem.iterancestors(del_tag), None) is not None:
+                        set_default(elem, w("w:rsidDel"), self.rsid)
+                    else:
+                        set_default(elem, w("w:rsidR"), self.rsid)
+                elif elem.tag == t_tag:
+                    text = elem.text
+                    if text and (text[0].isspace() or text[-1].isspace()):
+                        set_default(elem, xml_space, "preserve")
+                elif elem.tag in (ins_tag, del_tag):
+                    if elem.get(w("w:id")) is None:
+                        elem.set(w("w:id"), str(self._allocate_change_id()))
+                    else:
+                        self._change_ids.observe(elem.get(w("w:id")))
+                    set_default(elem, w("w:author"), self.author)
+                    set_default(elem, w("w:date"), timestamp)
+                    set_default(elem, w("w16du:dateUtc"), timestamp)
+                elif elem.tag == comment_tag:
+                    set_default(elem, w("w:author"), self.author)
+                    set_default(elem, w("w:date"), timestamp)
+                    set_default(elem, w("w:initials"), self.initials)
+                else:
+                    set_default(elem, w("w16cex:dateUtc"), timestamp)
+
+    def _on_insert(self, nodes):
+        """Inject attributes into inserted nodes."""
+        self._inject_attributes_to_nodes(nodes)
+        super()._on_insert(nodes)
+
+    def _swap_run_rsid(self, run, from_attr, to_attr):
+        """Move a run's RSID from one attribute to another (e.g. w:rsidR to w:rsidDel)."""
+        from_name, to_name = self._w(from_attr), self._w(to_attr)
+        if run.get(from_name) is not None:
+            run.set(to_name, run.attrib.pop(from_name))
+        elif run.get(to_name) is None:
+            run.set(to_name, self.rsid)
+
+    def _wrap_children(self, elem, wrapper_tag, keep=()):
+        """Move elem's children (except tags in keep) into a new wrapper appended to elem."""
+        wrapper = elem.makeelement(self._w(wrapper_tag))
+        for child in [c for c in elem if c.tag not in keep]:
+            wrapper.append(child)
+        elem.append(wrapper)
+        return wrapper
+
+    def revert_insertion(self, elem):
+        """Reject an insertion by wrapping its content in a deletion.
+
+        See DocxXMLEditor.revert_insertion.
+
+        Raises:
+            ValueError: If the element contains no w:ins elements
+        """
+        ins_tag = self._w("w:ins")
+        ins_elements = [elem] if elem.tag == ins_tag else list(elem.iter(ins_tag))
+
+        if not ins_elements:
+            raise ValueError(
+                f"revert_insertion requires w:ins elements. "
+                f"The provided element <{self.get_tag(elem)}> contains no insertions. "
+            )
+
+        self._reject_insertions(ins_elements)
+        return [elem]
+
+    def revert_deletion(self, elem):
+        """Reject a deletion by re-inserting the deleted content.
+
+        See DocxXMLEditor.revert_deletion.
+
+        Raises:
+            ValueError: If the element contains no w:del elements
+        """
+        del_tag = self._w("w:del")
+        is_single_del = elem.tag == del_tag
+        del_elements = [elem] if is_single_del else list(elem.iter(del_tag))
+
+        if not del_elements:
+            raise ValueError(
+                f"revert_deletion requires w:del elements. "
+                f"The provided element <{self.get_tag(elem)}> contains no deletions. "
+            )
+
+        created = self._reject_deletions(del_elements)
+        if is_single_del and created[0] is not None:
+            return [elem, created[0]]
+        return [elem]
+
+    def accept_changes(self, elem=None, author=None, since=None, until=None):
+        """Accept tracked changes in bulk with one pass over the tree.
+
+        See DocxXMLEditor.accept_changes.
+        """
+        started = time.perf_counter()
+        insertions, deletions = self._find_changes(elem, author, since, until)
+        insertions_set = set(insertions)
+
+        changed = {}
+        for change in insertions + deletions:
+            parent = change.getparent()
+            if parent is None:
+                continue  # Removed with an enclosing deletion
+            if change in insertions_set:
+                _move_text_before(change, change.text)
+                for child in list(change):
+                    change.addprevious(child)
+            _remove_keeping_tail(change)
+            changed[parent] = None
+        if changed:
+            self._on_change(list(changed))
+
+        return {
+            "insertions": len(insertions),
+            "deletions": len(deletions),
+            "seconds": time.perf_counter() - started,
+        }
+
+    def reject_changes(self, elem=None, author=None, since=None, until=None):
+        """Reject tracked changes in bulk with one pass over the tree.
+
+        See DocxXMLEditor.reject_changes.
+        """
+        started = time.perf_counter()
+        insertions, deletions = self._find_changes(elem, author, since, until)
+        self._reject_insertions(insertions)
+        self._reject_deletions(deletions)
+        return {
+            "insertions": len(insertions),
+            "deletions": len(deletions),
+            "seconds": time.perf_counter() - started,
+        }
+
+    def _find_changes(self, elem, author, since, until):
+        """Return the (w:ins, w:del) elements in elem matching the filters, in document order."""
+        root = elem if elem is not None else self._tree.getroot()
+        ins_tag, del_tag, rpr_tag = self._w("w:ins"), self._w("w:del"), self._w("w:rPr")
+        author_attr, date_attr = self._w("w:author"), self._w("w:date")
+        insertions, deletions = [], []
+        for node in root.iter(ins_tag, del_tag):
+            parent = node.getparent()
+            if parent is not None and parent.tag == rpr_tag:
+                continue
+            if _change_matches(
+                node.get(author_attr, ""), node.get(date_attr, ""), author, since, until
+            ):
+                (insertions if node.tag == ins_tag else deletions).append(node)
+        return insertions, deletions
+
+    def _reject_insertions(self, ins_elements):
+        """Wrap the content of each w:ins in a w:del, converting w:t to w:delText in place."""
+        r_tag, t_tag, del_text_tag = self._w("w:r"), self._w("w:t"), self._w("w:delText")
+        wrappers = []
+        for ins_elem in ins_elements:
+            runs = list(ins_elem.iter(r_tag))
+            if not runs:
+                continue
+
+            for run in runs:
+                # Convert w:t → w:delText and w:rsidR → w:rsidDel
+                self._swap_run_rsid(run, "w:rsidR", "w:rsidDel")
+                for t_elem in list(run.iter(t_tag)):
+                    t_elem.tag = del_text_tag
+
+            ins_elem.text = None
+            wrappers.append(self._wrap_children(ins_elem, "w:del"))
+
+        if wrappers:
+            self._inject_attributes_to_nodes(wrappers)
+            self._on_change(ins_elements)
+
+    def _reject_deletions(self, del_elements):
+        """
+        Insert a w:ins restoring the content of each w:del right after it.
+
+        Returns:
+            list: The created w:ins for each deletion, None where it had no runs
+        """
+        r_tag, t_tag, del_text_tag = self._w("w:r"), self._w("w:t"), self._w("w:delText")
+        created = []
+        for del_elem in del_elements:
+            runs = list(del_elem.iter(r_tag))
+            if not runs:
+                created.append(None)
+                continue
+
+            ins_elem = del_elem.makeelement(self._w("w:ins"))
+            for run in runs:
+                new_run = copy.deepcopy(run)
+                new_run.tail = None
+                # Convert w:delText → w:t and w:rsidDel → w:rsidR
+                for del_text in list(new_run.iter(del_text_tag)):
+                    del_text.tag = t_tag
+                self._swap_run_rsid(new_run, "w:rsidDel", "w:rsidR")
+                ins_elem.append(new_run)
+
+            del_elem.addnext(ins_elem)
+            created.append(ins_elem)
+
+        inserted = [node for node in created if node is not None]
+        if inserted:
+            self._on_insert(inserted)
+        return created
+
+    def suggest_deletion(self, elem):
+        """Mark a w:r or w:p element as deleted with tracked changes (in-place).
+
+        See DocxXMLEditor.suggest_deletion.
+
+        Raises:
+            ValueError: If element has existing tracked changes or invalid structure
+        """
+        w = self._w
+        tag = self.get_tag(elem)
+
+        if elem.tag == w("w:r"):
+            if next(elem.iter(w("w:delText")), None) is not None:
+                raise ValueError("w:r element already contains w:delText")
+
+            for t_elem in list(elem.iter(w("w:t"))):
+                t_elem.tag = w("w:delText")
+            self._swap_run_rsid(elem, "w:rsidR", "w:rsidDel")
+
+            # Wrap in w:del, keeping the run's trailing whitespace outside
+            del_wrapper = elem.makeelement(w("w:del"))
+            elem.addprevious(del_wrapper)
+            del_wrapper.tail, elem.tail = elem.tail, None
+            del_wrapper.append(elem)
+            self._inject_attributes_to_nodes([del_wrapper])
+            self._on_change([del_wrapper])
+            return del_wrapper
+
+        elif elem.tag == w("w:p"):
+            if (
+                next(elem.iter(w("w:ins")), None) is not None
+                or next(elem.iter(w("w:del")), None) is not None
+            ):
+                raise ValueError("w:p element already contains tracked changes")
+
+            pPr = next(elem.iter(w("w:pPr")), None)
+            if pPr is not None and next(pPr.iter(w("w:numPr")), None) is not None:
+                # Add <w:del/> marker to w:rPr in w:pPr
+                rPr = next(pPr.iter(w("w:rPr")), None)
+                if rPr is None:
+                    rPr = lxml.etree.SubElement(pPr, w("w:rPr"))
+                rPr.insert(0, rPr.makeelement(w("w:del")))
+
+            for t_elem in list(elem.iter(w("w:t"))):
+                t_elem.tag = w("w:delText")
+            for run in elem.iter(w("w:r")):
+                self._swap_run_rsid(run, "w:rsidR", "w:rsidDel")
+
+            del_wrapper = self._wrap_children(elem, "w:del", keep=(w("w:pPr"),))
+            self._inject_attributes_to_nodes([del_wrapper])
+            self._on_change([elem])
+            return elem
+
+        else:
+            raise ValueError(f"Element must be w:r or w:p, got {tag}")
+
+
+class ChangeIdCounter:
+    """Allocates tracked change IDs (w:id of w:ins and w:del) without rescanning.
+
+    Keeps the next free ID above every ID observed. Document shares one counter
+    between all its editors, so IDs stay unique across parts (document.xml,
+    footnotes, headers, ...).
+
+    Example:
+        change_ids = ChangeIdCounter.from_parts(Path("unpacked/word"))
+        editor = DocxXMLEditor(path, rsid="00AB12CD", change_ids=change_ids)
+    """
+
+    # Tracked change start tags with an ID, as written by Word
+    _CHANGE_ID_PATTERN = re.compile(rb'<w:(?:ins|del)\b[^>]*?\sw:id="(\d+)"')
+
+    def __init__(self, next_id: int = 0):
+        self.next_id = next_id
+
+    @classmethod
+    def from_parts(cls, part_dir):
+        """Create a counter above every tracked change ID in the XML files under part_dir."""
+        counter = cls()
+        for xml_file in Path(part_dir).rglob("*.xml"):
+            for match in cls._CHANGE_ID_PATTERN.finditer(xml_file.read_bytes()):
+                counter.observe(match.group(1))
+        return counter
+
+    def allocate(self) -> int:
+        """Return the next free ID."""
+        change_id = self.next_id
+        self.next_id += 1
+        return change_id
+
+    def observe(self, change_id):
+        """Record an ID in use (int or str; non-numeric values are ignored)."""
+        try:
+            self.next_id = max(self.next_id, int(change_id) + 1)
+        except ValueError:
+            pass
+
+
+def _change_matches(change_author, change_date, author, since, until):
+    """Check a tracked change's w:author and w:date against accept/reject_changes() filters.
+
+    Dates are ISO 8601 strings, so they compare correctly as text.
+    """
+    if author is not None and change_author != author:
+        return False
+    if since is not None and not (change_date and change_date >= since):
+        return False
+    if until is not None and not (change_date and change_date < until):
+        return False
+    return True
+
+
+def _move_text_before(elem, text):
+    """Append text to the content just before elem (previous sibling's tail or parent's text)."""
+    if not text:
+        return
+    previous = elem.getprevious()
+    if previous is not None:
+        previous.tail = (previous.tail or "") + text
+    else:
+        parent = elem.getparent()
+        parent.text = (parent.text or "") + text
+
+
+def _remove_keeping_tail(elem):
+    """Remove an lxml element, keeping the text that follows it."""
+    _move_text_before(elem, elem.tail)
+    elem.getparent().remove(elem)
+
+
 def _generate_hex_id() -> str:
     """Generate random 8-character hex ID for para/durable IDs.
 
@@ -604,11 +1179,104 @@ def _generate_hex_id() -> str:
     return f"{random.randint(1, 0x7FFFFFFE):08X}"
 
 
+def _generate_hex_ids(count) -> list:
+    """Generate count distinct IDs with _generate_hex_id()."""
+    ids = {}
+    while len(ids) < count:
+        ids[_generate_hex_id()] = None
+    return list(ids)
+
+
 def _generate_rsid() -> str:
     """Generate random 8-character hex RSID."""
     return "".join(random.choices("0123456789ABCDEF", k=8))
 
 
+def _file_signature(path):
+    """Identify a file's content by inode, size and modification time."""
+    stat = path.stat()
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def _working_tree_dir(source):
+    """
+    Create the temporary directory for a hard-linked mirror of source.
+
+    The system temp directory is used unless it is on another filesystem than
+    source, which hard links cannot cross; then a hidden .docx_* directory is
+    created next to source instead.
+
+    Args:
+        source: Directory that will be mirrored (see _link_tree)
+
+    Returns:
+        str: Path of the new directory
+    """
+    temp_dir = tempfile.mkdtemp(prefix="docx_")
+    probe = next((path for path in source.rglob("*") if path.is_file()), None)
+    if probe is None:
+        return temp_dir
+    link = Path(temp_dir) / probe.name
+    try:
+        os.link(probe, link)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            # No hard links at all: _link_tree warns and copies
+            return temp_dir
+        try:
+            sibling_dir = tempfile.mkdtemp(
+                prefix=".docx_", dir=source.resolve().parent
+            )
+        except OSError:
+            return temp_dir
+        os.rmdir(temp_dir)
+        return sibling_dir
+    link.unlink()
+    return temp_dir
+
+
+def _link_tree(source, target):
+    """
+    Mirror a directory with hard links, copying the files if linking fails.
+
+    Linking fails across filesystems and on filesystems without hard links; a
+    warning is printed once and the remaining files are copied.
+
+    Args:
+        source: Directory to mirror
+        target: Directory to create
+
+    Returns:
+        dict: Path relative to target -> _file_signature() of each file
+    """
+    snapshot = {}
+    link = True
+    target.mkdir(parents=True)
+    for dir_path, dir_names, file_names in os.walk(source):
+        relative_dir = Path(dir_path).relative_to(source)
+        for name in dir_names:
+            (target / relative_dir / name).mkdir()
+        for name in file_names:
+            relative_path = relative_dir / name
+            if link:
+                try:
+                    os.link(Path(dir_path) / name, target / relative_path)
+                except OSError as e:
+                    print(
+                        f"Warning: cannot hard link {source} into {target} "
+                        f"({e.strerror}); copying all files instead"
+                    )
+                    link = False
+            if not link:
+                shutil.copy2(Path(dir_path) / name, target / relative_path)
+            snapshot[relative_path] = _file_signature(target / relative_path)
+    return snapshot
+
+
+# Editor classes selectable with Document(..., backend=...)
+EDITOR_BACKENDS = {"minidom": DocxXMLEditor, "lxml": LxmlDocxXMLEditor}
+
+
 class Document:
     """Manages comments in unpacked Word documents."""
 
@@ -619,6 +1287,7 @@ class Document:
         track_revisions=False,
         author="Claude",
         initials="C",
+        backend="minidom",
     ):
         """
         Initialize with path to unpacked Word document directory.
@@ -630,20 +1299,35 @@ class Document:
             track_revisions: If True, enables track revisions in settings.xml (default: False)
             author: Default author name for comments (default: "Claude")
             initials: Default author initials for comments (default: "C")
+            backend: XML engine for editors: "minidom" (default) or "lxml". lxml parses
+                large parts faster with much less memory; nodes are then lxml elements.
         """
         self.original_path = Path(unpacked_dir)
 
         if not self.original_path.exists() or not self.original_path.is_dir():
             raise ValueError(f"Directory not found: {unpacked_dir}")
-
-        # Create temporary directory with subdirectories for unpacked content and baseline
-        self.temp_dir = tempfile.mkdtemp(prefix="docx_")
+        if backend not in EDITOR_BACKENDS:
+            raise ValueError(
+                f"Unknown backend: {backend} (expected one of {', '.join(EDITOR_BACKENDS)})"
+            )
+        self.backend = backend
+
+        # Working tree of hard links to the original files. Editors replace files
+        # when saving instead of writing into them, so only edited parts get
+        # their own copy. The snapshot records what each file looked like.
+        self.temp_dir = _working_tree_dir(self.original_path)
+        # Removed when the Document is garbage collected or at interpreter exit
+        self._cleanup = weakref.finalize(
+            self, shutil.rmtree, self.temp_dir, ignore_errors=True
+        )
         self.unpacked_path = Path(self.temp_dir) / "unpacked"
-        shutil.copytree(self.original_path, self.unpacked_path)
+        self._snapshot = _link_tree(self.original_path, self.unpacked_path)
 
-        # Pack original directory into temporary .docx for validation baseline (outside unpacked dir)
-        self.original_docx = Path(self.temp_dir) / "original.docx"
-        pack_document(self.original_path, self.original_docx, validate=False)
+        # Validation baseline, read on first use (see original_parts)
+        self._original_parts = None
+        # Check results of validated parts, so validate() only checks parts
+        # that changed since the last validation
+        self._validation_manifest = ValidationManifest()
 
         self.word_path = self.unpacked_path / "word"
 
@@ -658,6 +1342,9 @@ class Document:
         # Cache for lazy-loaded editors
         self._editors = {}
 
+        # Tracked change IDs shared by all editors, above those in any part
+        self._change_ids = ChangeIdCounter.from_parts(self.word_path)
+
         # Comment file paths
         self.comments_path = self.word_path / "comments.xml"
         self.comments_extended_path = self.word_path / "commentsExtended.xml"
@@ -677,7 +1364,7 @@ class Document:
         # Add author to people.xml
         self._add_author_to_people(author)
 
-    def __getitem__(self, xml_path: str) -> DocxXMLEditor:
+    def __getitem__(self, xml_path: str):
         """
         Get or create a DocxXMLEditor for the specified XML file.
 
@@ -688,7 +1375,7 @@ class Document:
             xml_path: Relative path to XML file (e.g., "word/document.xml", "word/comments.xml")
 
         Returns:
-            DocxXMLEditor instance for the specified file
+            DocxXMLEditor (or LxmlDocxXMLEditor) instance for the specified file
 
         Raises:
             ValueError: If the file does not exist
@@ -705,8 +1392,13 @@ class Document:
             if not file_path.exists():
                 raise ValueError(f"XML file not found: {xml_path}")
             # Use DocxXMLEditor with RSID, author, and initials for all editors
-            self._editors[xml_path] = DocxXMLEditor(
-                file_path, rsid=self.rsid, author=self.author, initials=self.initials
+            editor_class = EDITOR_BACKENDS[self.backend]
+            self._editors[xml_path] = editor_class(
+                file_path,
+                rsid=self.rsid,
+                author=self.author,
+                initials=self.initials,
+                change_ids=self._change_ids,
             )
         return self._editors[xml_path]
 
@@ -727,40 +1419,73 @@ class Document:
             end_node = cm.get_document_node(tag="w:ins", id="2")
             cm.add_comment(start=start_node, end=end_node, text="Explanation")
         """
-        comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        return self.add_comments([(start, end, text)])[0]
 
-        # Add comment ranges to document.xml immediately
-        self._document.insert_before(start, self._comment_range_start_xml(comment_id))
+    def add_comments(self, comments) -> list:
+        """
+        Add many comments at once.
 
-        # If end node is a paragraph, append comment markup inside it
-        # Otherwise insert after it (for run-level anchors)
-        if end.tagName == "w:p":
-            self._document.append_to(end, self._comment_range_end_xml(comment_id))
-        else:
-            self._document.insert_after(end, self._comment_range_end_xml(comment_id))
+        Much faster than calling add_comment() in a loop: comment ranges are
+        inserted into document.xml in one batch, and each comment part gets all
+        new entries in a single append.
 
-        # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        Args:
+            comments: Iterable of (start, end, text) tuples, as for add_comment()
 
-        # Add to commentsExtended.xml immediately
-        self._add_to_comments_extended_xml(para_id, parent_para_id=None)
+        Returns:
+            List of the comment IDs that were created, in order
 
-        # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        Example:
+            paras = doc["word/document.xml"].get_nodes(tag="w:p", contains="ACME")
+            doc.add_comments((p, p, "Check the party name") for p in paras)
+        """
+        comments = list(comments)
+        if not comments:
+            return []
+        comment_ids = list(
+            range(self.next_comment_id, self.next_comment_id + len(comments))
+        )
+        para_ids = _generate_hex_ids(len(comments))
+        durable_ids = _generate_hex_ids(len(comments))
+
+        # Add comment ranges to document.xml
+        with self._document.batch():
+            for comment_id, (start, end, _) in zip(comment_ids, comments):
+                self._document.insert_before(
+                    start, self._comment_range_start_xml(comment_id)
+                )
 
-        # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+                # If end node is a paragraph, append comment markup inside it
+                # Otherwise insert after it (for run-level anchors)
+                if self._document.get_tag(end) == "w:p":
+                    self._document.append_to(
+                        end, self._comment_range_end_xml(comment_id)
+                    )
+                else:
+                    self._document.insert_after(
+                        end, self._comment_range_end_xml(comment_id)
+                    )
+
+        # Add to comments.xml, commentsExtended.xml, commentsIds.xml and
+        # commentsExtensible.xml, one append per part
+        self._add_to_comments_xml(
+            [
+                (comment_id, para_id, text)
+                for comment_id, para_id, (_, _, text) in zip(
+                    comment_ids, para_ids, comments
+                )
+            ]
+        )
+        self._add_to_comments_extended_xml([(para_id, None) for para_id in para_ids])
+        self._add_to_comments_ids_xml(list(zip(para_ids, durable_ids)))
+        self._add_to_comments_extensible_xml(durable_ids)
 
         # Update existing_comments so replies work
-        self.existing_comments[comment_id] = {"para_id": para_id}
+        for comment_id, para_id in zip(comment_ids, para_ids):
+            self.existing_comments[comment_id] = {"para_id": para_id}
 
-        self.next_comment_id += 1
-        return comment_id
+        self.next_comment_id += len(comments)
+        return comment_ids
 
     def reply_to_comment(
         self,
@@ -785,22 +1510,20 @@ class Document:
 
         parent_info = self.existing_comments[parent_comment_id]
         comment_id = self.next_comment_id
-        para_id = _generate_hex_id()
-        durable_id = _generate_hex_id()
-        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+        para_id, durable_id = _generate_hex_ids(2)
 
         # Add comment ranges to document.xml immediately
-        parent_start_elem = self._document.get_node(
+        parent_start_elem = self._document._find_node(
             tag="w:commentRangeStart", attrs={"w:id": str(parent_comment_id)}
         )
-        parent_ref_elem = self._document.get_node(
+        parent_ref_elem = self._document._find_node(
             tag="w:commentReference", attrs={"w:id": str(parent_comment_id)}
         )
 
         self._document.insert_after(
             parent_start_elem, self._comment_range_start_xml(comment_id)
         )
-        parent_ref_run = parent_ref_elem.parentNode
+        parent_ref_run = self._document.get_parent(parent_ref_elem)
         self._document.insert_after(
             parent_ref_run, f'<w:commentRangeEnd w:id="{comment_id}"/>'
         )
@@ -809,20 +1532,16 @@ class Document:
         )
 
         # Add to comments.xml immediately
-        self._add_to_comments_xml(
-            comment_id, para_id, text, self.author, self.initials, timestamp
-        )
+        self._add_to_comments_xml([(comment_id, para_id, text)])
 
         # Add to commentsExtended.xml immediately (with parent)
-        self._add_to_comments_extended_xml(
-            para_id, parent_para_id=parent_info["para_id"]
-        )
+        self._add_to_comments_extended_xml([(para_id, parent_info["para_id"])])
 
         # Add to commentsIds.xml immediately
-        self._add_to_comments_ids_xml(para_id, durable_id)
+        self._add_to_comments_ids_xml([(para_id, durable_id)])
 
         # Add to commentsExtensible.xml immediately
-        self._add_to_comments_extensible_xml(durable_id)
+        self._add_to_comments_extensible_xml([durable_id])
 
         # Update existing_comments so replies work
         self.existing_comments[comment_id] = {"para_id": para_id}
@@ -830,10 +1549,25 @@ class Document:
         self.next_comment_id += 1
         return comment_id
 
-    def __del__(self):
-        """Clean up temporary directory on deletion."""
-        if hasattr(self, "temp_dir") and Path(self.temp_dir).exists():
-            shutil.rmtree(self.temp_dir)
+    @property
+    def original_parts(self):
+        """
+        Part name -> bytes of the original XML and .rels parts, the validation baseline.
+
+        Read from the original directory on first use; validators take the map
+        directly instead of a packed .docx.
+        """
+        self._load_original_parts()
+        return self._original_parts
+
+    def _load_original_parts(self):
+        """Read the validation baseline from the original directory, once."""
+        if self._original_parts is None:
+            self._original_parts = {
+                path.relative_to(self.original_path).as_posix(): path.read_bytes()
+                for pattern in ("*.xml", "*.rels")
+                for path in self.original_path.rglob(pattern)
+            }
 
     def validate(self) -> None:
         """
@@ -844,10 +1578,13 @@ class Document:
         """
         # Create validators with current state
         schema_validator = DOCXSchemaValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path,
+            self.original_parts,
+            verbose=False,
+            manifest=self._validation_manifest,
         )
         redlining_validator = RedliningValidator(
-            self.unpacked_path, self.original_docx, verbose=False
+            self.unpacked_path, self.original_parts, verbose=False
         )
 
         # Run validations
@@ -861,6 +1598,8 @@ class Document:
         Save all modified XML files to disk and copy to destination directory.
 
         This persists all changes made via add_comment() and reply_to_comment().
+        When saving back to the original directory, only files that were added
+        or changed are written, each replaced atomically.
 
         Args:
             destination: Optional path to save to. If None, saves back to original directory.
@@ -879,9 +1618,34 @@ class Document:
         if validate:
             self.validate()
 
-        # Copy contents from temp directory to destination (or original directory)
         target_path = Path(destination) if destination else self.original_path
-        shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+        if target_path.resolve() != self.original_path.resolve():
+            shutil.copytree(self.unpacked_path, target_path, dirs_exist_ok=True)
+            return
+
+        # Keep the validation baseline from before the original changes
+        self._load_original_parts()
+        for relative_path, signature in self._changed_files():
+            source = self.unpacked_path / relative_path
+            target = target_path / relative_path
+            if target.exists():
+                with open(source, "rb") as src, _replacing_file(target) as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(source, target)
+            self._snapshot[relative_path] = signature
+
+    def _changed_files(self):
+        """Return (relative path, signature) of working tree files added or changed since init or the last save."""
+        changed = []
+        for path in self.unpacked_path.rglob("*"):
+            if path.is_file():
+                relative_path = path.relative_to(self.unpacked_path)
+                signature = _file_signature(path)
+                if self._snapshot.get(relative_path) != signature:
+                    changed.append((relative_path, signature))
+        return changed
 
     # ==================== Private: Initialization ====================
 
@@ -892,8 +1656,8 @@ class Document:
 
         editor = self["word/comments.xml"]
         max_id = -1
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor._find_nodes("w:comment"):
+            comment_id = editor.get_attribute(comment_elem, "w:id")
             if comment_id:
                 try:
                     max_id = max(max_id, int(comment_id))
@@ -909,15 +1673,15 @@ class Document:
         editor = self["word/comments.xml"]
         existing = {}
 
-        for comment_elem in editor.dom.getElementsByTagName("w:comment"):
-            comment_id = comment_elem.getAttribute("w:id")
+        for comment_elem in editor._find_nodes("w:comment"):
+            comment_id = editor.get_attribute(comment_elem, "w:id")
             if not comment_id:
                 continue
 
             # Find para_id from the w:p element within the comment
             para_id = None
-            for p_elem in comment_elem.getElementsByTagName("w:p"):
-                para_id = p_elem.getAttribute("w14:paraId")
+            for p_elem in editor._find_descendants(comment_elem, "w:p"):
+                para_id = editor.get_attribute(p_elem, "w14:paraId")
                 if para_id:
                     break
 
@@ -965,7 +1729,7 @@ class Document:
             return
 
         # Add Override element
-        root = editor.dom.documentElement
+        root = editor._find_root()
         override_xml = '<Override PartName="/word/people.xml" ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.people+xml"/>'
         editor.append_to(root, override_xml)
 
@@ -976,8 +1740,8 @@ class Document:
         if self._has_relationship(editor, "people.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor._find_root()
+        root_tag = editor.get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid = editor.get_next_rid()
 
@@ -997,14 +1761,14 @@ class Document:
         - rsids: late (after compat)
         """
         editor = self["word/settings.xml"]
-        root = editor.get_node(tag="w:settings")
-        prefix = root.tagName.split(":")[0] if ":" in root.tagName else "w"
+        root = editor._find_node(tag="w:settings")
+        root_tag = editor.get_tag(root)
+        prefix = root_tag.split(":")[0] if ":" in root_tag else "w"
 
         # Conditionally add trackRevisions if requested
         if track_revisions:
-            track_revisions_exists = any(
-                elem.tagName == f"{prefix}:trackRevisions"
-                for elem in editor.dom.getElementsByTagName(f"{prefix}:trackRevisions")
+            track_revisions_exists = bool(
+                editor._find_nodes(f"{prefix}:trackRevisions")
             )
 
             if not track_revisions_exists:
@@ -1012,20 +1776,21 @@ class Document:
                 # Try to insert before documentProtection, defaultTabStop, or at start
                 inserted = False
                 for tag in [f"{prefix}:documentProtection", f"{prefix}:defaultTabStop"]:
-                    elements = editor.dom.getElementsByTagName(tag)
+                    elements = editor._find_nodes(tag)
                     if elements:
                         editor.insert_before(elements[0], track_rev_xml)
                         inserted = True
                         break
                 if not inserted:
                     # Insert as first child of settings
-                    if root.firstChild:
-                        editor.insert_before(root.firstChild, track_rev_xml)
+                    children = editor._find_descendants(root, "*")
+                    if children:
+                        editor.insert_before(children[0], track_rev_xml)
                     else:
                         editor.append_to(root, track_rev_xml)
 
         # Always check if rsids section exists
-        rsids_elements = editor.dom.getElementsByTagName(f"{prefix}:rsids")
+        rsids_elements = editor._find_nodes(f"{prefix}:rsids")
 
         if not rsids_elements:
             # Add new rsids section
@@ -1036,15 +1801,13 @@ class Document:
 
             # Try to insert after compat, before clrSchemeMapping, or before closing tag
             inserted = False
-            compat_elements = editor.dom.getElementsByTagName(f"{prefix}:compat")
+            compat_elements = editor._find_nodes(f"{prefix}:compat")
             if compat_elements:
                 editor.insert_after(compat_elements[0], rsids_xml)
                 inserted = True
 
             if not inserted:
-                clr_elements = editor.dom.getElementsByTagName(
-                    f"{prefix}:clrSchemeMapping"
-                )
+                clr_elements = editor._find_nodes(f"{prefix}:clrSchemeMapping")
                 if clr_elements:
                     editor.insert_before(clr_elements[0], rsids_xml)
                     inserted = True
@@ -1055,8 +1818,8 @@ class Document:
             # Check if this rsid already exists
             rsids_elem = rsids_elements[0]
             rsid_exists = any(
-                elem.getAttribute(f"{prefix}:val") == self.rsid
-                for elem in rsids_elem.getElementsByTagName(f"{prefix}:rsid")
+                editor.get_attribute(elem, f"{prefix}:val") == self.rsid
+                for elem in editor._find_descendants(rsids_elem, f"{prefix}:rsid")
             )
 
             if not rsid_exists:
@@ -1065,67 +1828,93 @@ class Document:
 
     # ==================== Private: XML File Creation ====================
 
-    def _add_to_comments_xml(
-        self, comment_id, para_id, text, author, initials, timestamp
-    ):
-        """Add a single comment to comments.xml."""
+    def _add_to_comments_xml(self, comments):
+        """Add comments to comments.xml.
+
+        Args:
+            comments: List of (comment_id, para_id, text) tuples
+        """
         if not self.comments_path.exists():
             shutil.copy(TEMPLATE_DIR / "comments.xml", self.comments_path)
 
         editor = self["word/comments.xml"]
-        root = editor.get_node(tag="w:comments")
+        root = editor._find_node(tag="w:comments")
 
-        escaped_text = (
-            text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
-        )
         # Note: w:rsidR, w:rsidRDefault, w:rsidP on w:p, w:rsidR on w:r,
         # and w:author, w:date, w:initials on w:comment are automatically added by DocxXMLEditor
-        comment_xml = f'''<w:comment w:id="{comment_id}">
+        entries = []
+        for comment_id, para_id, text in comments:
+            escaped_text = (
+                text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+            )
+            entries.append(f'''<w:comment w:id="{comment_id}">
   <w:p w14:paraId="{para_id}" w14:textId="77777777">
     <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:annotationRef/></w:r>
     <w:r><w:rPr><w:color w:val="000000"/><w:sz w:val="20"/><w:szCs w:val="20"/></w:rPr><w:t>{escaped_text}</w:t></w:r>
   </w:p>
-</w:comment>'''
-        editor.append_to(root, comment_xml)
+</w:comment>''')
+        editor.append_to(root, "".join(entries))
+
+    def _add_to_comments_extended_xml(self, comments):
+        """Add comments to commentsExtended.xml.
 
-    def _add_to_comments_extended_xml(self, para_id, parent_para_id):
-        """Add a single comment to commentsExtended.xml."""
+        Args:
+            comments: List of (para_id, parent_para_id) tuples; parent_para_id is None for top-level comments
+        """
         if not self.comments_extended_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtended.xml", self.comments_extended_path
             )
 
         editor = self["word/commentsExtended.xml"]
-        root = editor.get_node(tag="w15:commentsEx")
+        root = editor._find_node(tag="w15:commentsEx")
 
-        if parent_para_id:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
-        else:
-            xml = f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>'
-        editor.append_to(root, xml)
+        entries = []
+        for para_id, parent_para_id in comments:
+            if parent_para_id:
+                entries.append(
+                    f'<w15:commentEx w15:paraId="{para_id}" w15:paraIdParent="{parent_para_id}" w15:done="0"/>'
+                )
+            else:
+                entries.append(f'<w15:commentEx w15:paraId="{para_id}" w15:done="0"/>')
+        editor.append_to(root, "".join(entries))
+
+    def _add_to_comments_ids_xml(self, comments):
+        """Add comments to commentsIds.xml.
 
-    def _add_to_comments_ids_xml(self, para_id, durable_id):
-        """Add a single comment to commentsIds.xml."""
+        Args:
+            comments: List of (para_id, durable_id) tuples
+        """
         if not self.comments_ids_path.exists():
             shutil.copy(TEMPLATE_DIR / "commentsIds.xml", self.comments_ids_path)
 
         editor = self["word/commentsIds.xml"]
-        root = editor.get_node(tag="w16cid:commentsIds")
+        root = editor._find_node(tag="w16cid:commentsIds")
 
-        xml = f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cid:commentId w16cid:paraId="{para_id}" w16cid:durableId="{durable_id}"/>'
+            for para_id, durable_id in comments
+        )
         editor.append_to(root, xml)
 
-    def _add_to_comments_extensible_xml(self, durable_id):
-        """Add a single comment to commentsExtensible.xml."""
+    def _add_to_comments_extensible_xml(self, durable_ids):
+        """Add comments to commentsExtensible.xml.
+
+        Args:
+            durable_ids: List of the comments' durable IDs
+        """
         if not self.comments_extensible_path.exists():
             shutil.copy(
                 TEMPLATE_DIR / "commentsExtensible.xml", self.comments_extensible_path
             )
 
         editor = self["word/commentsExtensible.xml"]
-        root = editor.get_node(tag="w16cex:commentsExtensible")
+        root = editor._find_node(tag="w16cex:commentsExtensible")
 
-        xml = f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+        xml = "".join(
+            f'<w16cex:commentExtensible w16cex:durableId="{durable_id}"/>'
+            for durable_id in durable_ids
+        )
         editor.append_to(root, xml)
 
     # ==================== Private: XML Fragments ====================
@@ -1159,24 +1948,15 @@ class Document:
 
     def _has_relationship(self, editor, target):
         """Check if a relationship with given target exists."""
-        for rel_elem in editor.dom.getElementsByTagName("Relationship"):
-            if rel_elem.getAttribute("Target") == target:
-                return True
-        return False
+        return bool(editor._find_nodes("Relationship", attrs={"Target": target}))
 
     def _has_override(self, editor, part_name):
         """Check if an override with given part name exists."""
-        for override_elem in editor.dom.getElementsByTagName("Override"):
-            if override_elem.getAttribute("PartName") == part_name:
-                return True
-        return False
+        return bool(editor._find_nodes("Override", attrs={"PartName": part_name}))
 
     def _has_author(self, editor, author):
         """Check if an author already exists in people.xml."""
-        for person_elem in editor.dom.getElementsByTagName("w15:person"):
-            if person_elem.getAttribute("w15:author") == author:
-                return True
-        return False
+        return bool(editor._find_nodes("w15:person", attrs={"w15:author": author}))
 
     def _add_author_to_people(self, author):
         """Add author to people.xml (called during initialization)."""
@@ -1187,7 +1967,7 @@ class Document:
             raise ValueError("people.xml should exist after _setup_tracking")
 
         editor = self["word/people.xml"]
-        root = editor.get_node(tag="w15:people")
+        root = editor._find_node(tag="w15:people")
 
         # Check if author already exists
         if self._has_author(editor, author):
@@ -1207,8 +1987,8 @@ class Document:
         if self._has_relationship(editor, "comments.xml"):
             return
 
-        root = editor.dom.documentElement
-        root_tag = root.tagName  # type: ignore
+        root = editor._find_root()
+        root_tag = editor.get_tag(root)
         prefix = root_tag.split(":")[0] + ":" if ":" in root_tag else ""
         next_rid_num = int(editor.get_next_rid()[3:])
 
@@ -1247,7 +2027,7 @@ class Document:
         if self._has_override(editor, "/word/comments.xml"):
             return
 
-        root = editor.dom.documentElement
+        root = editor._find_root()
 
         # Add Override elements
         overrides = [
@@ -0,0 +1,294 @@
+import contextlib
+import errno
+import gc
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import lxml.etree
+
+from scripts.document import EDITOR_BACKENDS, Document
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def make_unpacked_document(path, body):
+    """Write an unpacked .docx with the given document.xml body markup."""
+    parts = {
+        "[Content_Types].xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+            '  <Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\n'
+            '  <Default Extension="xml" ContentType="application/xml"/>\n'
+            "</Types>\n"
+        ),
+        "_rels/.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+            f'  <Relationship Id="rId1" Type="{RELATIONSHIPS}/officeDocument" Target="word/document.xml"/>\n'
+            "</Relationships>\n"
+        ),
+        "word/_rels/document.xml.rels": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">\n'
+            f'  <Relationship Id="rId1" Type="{RELATIONSHIPS}/settings" Target="settings.xml"/>\n'
+            "</Relationships>\n"
+        ),
+        "word/settings.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:settings xmlns:w="{W_NAMESPACE}">\n'
+            "  <w:compat/>\n"
+            "</w:settings>\n"
+        ),
+        "word/document.xml": (
+            '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            f'<w:document xmlns:w="{W_NAMESPACE}">\n'
+            f"  <w:body>\n{body}  </w:body>\n"
+            "</w:document>\n"
+        ),
+    }
+    for name, content in parts.items():
+        part = Path(path) / name
+        part.parent.mkdir(parents=True, exist_ok=True)
+        part.write_text(content, encoding="utf-8")
+
+# Jane inserted "alpha " and Bob deleted "beta"; Bob inserted "gamma" and "delta",
+# and Jane deleted "delta" from Bob's insertion
+TRACKED_CHANGES_BODY = """\
+    <w:p>
+      <w:ins w:id="1" w:author="Jane" w:date="2024-01-10T00:00:00Z">
+        <w:r><w:t xml:space="preserve">alpha </w:t></w:r>
+      </w:ins>
+      <w:del w:id="2" w:author="Bob" w:date="2024-03-01T00:00:00Z">
+        <w:r><w:delText>beta</w:delText></w:r>
+      </w:del>
+    </w:p>
+    <w:p>
+      <w:ins w:id="3" w:author="Bob" w:date="2024-02-01T00:00:00Z">
+        <w:r><w:t>gamma</w:t></w:r>
+        <w:del w:id="4" w:author="Jane" w:date="2024-02-05T00:00:00Z">
+          <w:r><w:delText>delta</w:delText></w:r>
+        </w:del>
+      </w:ins>
+    </w:p>
+"""
+
+
+class TestDocumentSave(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.unpacked = Path(self.temp_dir) / "unpacked"
+        make_unpacked_document(
+            self.unpacked,
+            "".join(
+                f"    <w:p>\n      <w:r>\n        <w:t>Clause {i}</w:t>\n"
+                "      </w:r>\n    </w:p>\n"
+                for i in range(5)
+            ),
+        )
+        self.document_xml = self.unpacked / "word" / "document.xml"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def open_document(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Document(self.unpacked, rsid="00AB12CD")
+
+    def test_read_only_lookup_does_not_rewrite_part(self):
+        """A part only read through get_node is left untouched by save()"""
+        before = self.document_xml.stat()
+        content = self.document_xml.read_bytes()
+
+        doc = self.open_document()
+        doc["word/document.xml"].get_node(tag="w:p", contains="Clause 3")
+        doc["word/document.xml"].get_nodes(tag="w:r")
+        doc.save(validate=False)
+
+        after = self.document_xml.stat()
+        self.assertEqual(after.st_ino, before.st_ino)
+        self.assertEqual(after.st_mtime_ns, before.st_mtime_ns)
+        self.assertEqual(self.document_xml.read_bytes(), content)
+
+    def test_direct_dom_change_is_saved(self):
+        """A change made with DOM methods on a returned node is saved"""
+        doc = self.open_document()
+        run = doc["word/document.xml"].get_node(tag="w:r", contains="Clause 3")
+        run.setAttribute("w:rsidR", "00AB12CD")
+        doc.save(validate=False)
+
+        self.assertIn('w:rsidR="00AB12CD"', self.document_xml.read_text())
+
+
+class TestDocumentWorkingTree(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.unpacked = Path(self.temp_dir) / "unpacked"
+        make_unpacked_document(self.unpacked, "    <w:p/>\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def open_document(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return Document(self.unpacked, rsid="00AB12CD")
+
+    def test_working_tree_in_system_temp_dir(self):
+        """The working tree is hard linked from the system temp directory"""
+        doc = self.open_document()
+        working_tree = Path(doc.temp_dir)
+
+        self.assertEqual(working_tree.parent, Path(tempfile.gettempdir()))
+        self.assertEqual(
+            (doc.unpacked_path / "word" / "document.xml").stat().st_ino,
+            (self.unpacked / "word" / "document.xml").stat().st_ino,
+        )
+        self.assertEqual(os.listdir(self.temp_dir), ["unpacked"])
+
+        del doc
+        gc.collect()
+        self.assertFalse(working_tree.exists())
+
+    def test_working_tree_next_to_original_across_filesystems(self):
+        """EXDEV from the temp directory moves the working tree next to the original"""
+        link = os.link
+        calls = []
+
+        def link_once_across_devices(source, target):
+            calls.append(target)
+            if len(calls) == 1:
+                raise OSError(errno.EXDEV, os.strerror(errno.EXDEV))
+            link(source, target)
+
+        with mock.patch("os.link", link_once_across_devices):
+            doc = self.open_document()
+        working_tree = Path(doc.temp_dir)
+
+        self.assertEqual(working_tree.parent, Path(self.temp_dir))
+        self.assertTrue(working_tree.name.startswith(".docx_"))
+        self.assertFalse(Path(calls[0]).parent.exists())
+        self.assertEqual(
+            (doc.unpacked_path / "word" / "document.xml").stat().st_ino,
+            (self.unpacked / "word" / "document.xml").stat().st_ino,
+        )
+
+        del doc
+        gc.collect()
+        self.assertFalse(working_tree.exists())
+
+
+class TestBulkChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        make_unpacked_document(self.temp_dir, TRACKED_CHANGES_BODY)
+        self.document_xml = Path(self.temp_dir) / "word" / "document.xml"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def editors(self):
+        """Return (backend, editor) for each backend, each on the unchanged file."""
+        return [
+            (backend, editor_class(self.document_xml, rsid="00AB12CD"))
+            for backend, editor_class in EDITOR_BACKENDS.items()
+        ]
+
+    def text(self, editor, tag, inside_deletion):
+        """Join the text of tag elements that are (or are not) inside a w:del."""
+        parts = []
+        root = editor.get_root()
+        for elem in editor.get_descendants(root, tag):
+            parent = editor.get_parent(elem)
+            deleted = False
+            while parent is not root:
+                deleted = deleted or editor.get_tag(parent) == "w:del"
+                parent = editor.get_parent(parent)
+            if deleted == inside_deletion:
+                if isinstance(elem, lxml.etree._Element):
+                    parts.append(elem.text or "")
+                else:
+                    parts.append("".join(n.data for n in elem.childNodes))
+        return "".join(parts)
+
+    def visible_text(self, editor):
+        return self.text(editor, "w:t", inside_deletion=False)
+
+    def authors(self, editor, tag):
+        return [
+            editor.get_attribute(elem, "w:author")
+            for elem in editor.get_descendants(editor.get_root(), tag)
+        ]
+
+    def test_accept_all(self):
+        """Accepting keeps inserted text and drops deleted text, nested or not"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.accept_changes()
+                self.assertEqual((result["insertions"], result["deletions"]), (2, 2))
+                self.assertEqual(self.visible_text(editor), "alpha gamma")
+                self.assertEqual(self.authors(editor, "w:ins"), [])
+                self.assertEqual(self.authors(editor, "w:del"), [])
+                self.assertEqual(self.text(editor, "w:delText", True), "")
+
+    def test_accept_by_author(self):
+        """Only the given author's changes are accepted, including a nested deletion"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.accept_changes(author="Jane")
+                self.assertEqual((result["insertions"], result["deletions"]), (1, 1))
+                self.assertEqual(self.visible_text(editor), "alpha gamma")
+                self.assertEqual(self.authors(editor, "w:ins"), ["Bob"])
+                self.assertEqual(self.authors(editor, "w:del"), ["Bob"])
+                self.assertEqual(self.text(editor, "w:delText", True), "beta")
+
+    def test_accept_by_date(self):
+        """since is inclusive and until exclusive"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.accept_changes(since="2024-02-01", until="2024-03-01")
+                self.assertEqual((result["insertions"], result["deletions"]), (1, 1))
+                self.assertEqual(self.authors(editor, "w:ins"), ["Jane"])
+                self.assertEqual(self.authors(editor, "w:del"), ["Bob"])
+                self.assertEqual(self.text(editor, "w:delText", True), "beta")
+
+    def test_reject_all(self):
+        """Rejecting restores the original text as tracked changes"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.reject_changes()
+                self.assertEqual((result["insertions"], result["deletions"]), (2, 2))
+                self.assertEqual(self.visible_text(editor), "beta")
+                self.assertIn("Claude", self.authors(editor, "w:del"))
+                self.assertIn("Claude", self.authors(editor, "w:ins"))
+
+    def test_reject_by_author(self):
+        """Rejecting a deletion inside another author's insertion restores its text"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.reject_changes(author="Jane")
+                self.assertEqual((result["insertions"], result["deletions"]), (1, 1))
+                self.assertEqual(self.visible_text(editor), "gammadelta")
+                self.assertEqual(
+                    self.text(editor, "w:delText", True), "alpha betadelta"
+                )
+
+    def test_reject_by_date(self):
+        """Only changes dated before until are rejected"""
+        for backend, editor in self.editors():
+            with self.subTest(backend=backend):
+                result = editor.reject_changes(until="2024-02-01")
+                self.assertEqual((result["insertions"], result["deletions"]), (1, 0))
+                self.assertEqual(self.visible_text(editor), "gamma")
+                self.assertEqual(self.authors(editor, "w:ins"), ["Jane", "Bob"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Keep Document sessions open across edits and serve them over stdin/stdout.
+
+Each line on stdin is a JSON-RPC 2.0 request; each response is written as one
+line to stdout. Opened documents and their parsed XML parts stay in memory, so
+a sequence of small edits does not re-parse the document or redo comment and
+tracking setup for every edit. Sessions are closed least recently used first
+when more than --max-sessions are open, and after --idle-timeout seconds
+without requests. Unsaved changes of an evicted session are lost.
+
+Example usage (from the docx skill root):
+    python -m scripts.session_server --max-sessions 4
+
+    {"jsonrpc": "2.0", "id": 1, "method": "open", "params": {"path": "unpacked"}}
+    {"jsonrpc": "2.0", "id": 2, "method": "replace_node", "params": {
+        "session": "<id>", "target": {"tag": "w:r", "contains": "old text"},
+        "xml": "<w:r><w:t>new text</w:t></w:r>"}}
+    {"jsonrpc": "2.0", "id": 3, "method": "save", "params": {"session": "<id>"}}
+
+Nodes are addressed by selectors with the get_node() arguments ("tag", "attrs",
+"line_number", "contains") and an optional "part" (default: word/document.xml).
+"""
+
+import argparse
+import inspect
+import json
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from pathlib import Path
+
+import lxml.etree
+
+from .document import Document
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+
+class RpcError(Exception):
+    """Error returned to the client as a JSON-RPC error object."""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class SessionServer:
+    """Open Document sessions with least-recently-used eviction."""
+
+    def __init__(self, max_sessions=8, idle_timeout=None):
+        """
+        Args:
+            max_sessions: Maximum number of open sessions
+            idle_timeout: Seconds after which an unused session is closed (None: never)
+        """
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        # session id -> (Document, time of last use, open() options), least
+        # recently used first
+        self._sessions = OrderedDict()
+        self._methods = {
+            "open": self.open,
+            "close": self.close,
+            "list": self.list_sessions,
+            "get_node": self.get_node,
+            "replace_node": self.replace_node,
+            "insert_after": self.insert_after,
+            "insert_before": self.insert_before,
+            "append_to": self.append_to,
+            "suggest_deletion": self.suggest_deletion,
+            "revert_insertion": self.revert_insertion,
+            "revert_deletion": self.revert_deletion,
+            "add_comment": self.add_comment,
+            "reply_to_comment": self.reply_to_comment,
+            "save": self.save,
+        }
+
+    # ==================== Requests ====================
+
+    def handle(self, request):
+        """
+        Process one decoded JSON-RPC request.
+
+        Returns:
+            dict: The response object, or None for notifications (no "id")
+        """
+        request_id = request.get("id") if isinstance(request, dict) else None
+        response = self._dispatch(request, request_id)
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+
+    def _dispatch(self, request, request_id):
+        try:
+            if (
+                not isinstance(request, dict)
+                or request.get("jsonrpc") != "2.0"
+                or not isinstance(request.get("method"), str)
+            ):
+                raise RpcError(INVALID_REQUEST, "Invalid JSON-RPC 2.0 request")
+            method = self._methods.get(request["method"])
+            if method is None:
+                raise RpcError(METHOD_NOT_FOUND, f"Unknown method: {request['method']}")
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_PARAMS, "params must be an object")
+            try:
+                inspect.signature(method).bind(**params)
+            except TypeError as e:
+                raise RpcError(INVALID_PARAMS, str(e))
+
+            self._evict_idle()
+            # Document prints progress messages; keep stdout for responses
+            with redirect_stdout(sys.stderr):
+                result = method(**params)
+        except RpcError as e:
+            return self._response(
+                request_id, error={"code": e.code, "message": e.message}
+            )
+        except Exception as e:
+            return self._response(
+                request_id,
+                error={"code": SERVER_ERROR, "message": f"{type(e).__name__}: {e}"},
+            )
+        return self._response(request_id, result=result)
+
+    @staticmethod
+    def _response(request_id, result=None, error=None):
+        response = {"jsonrpc": "2.0", "id": request_id}
+        if error is not None:
+            response["error"] = error
+        else:
+            response["result"] = result
+        return response
+
+    def serve(self, infile, outfile):
+        """Answer newline-delimited requests from infile until it is closed."""
+        for line in infile:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except json.JSONDecodeError as e:
+                response = self._response(
+                    None, error={"code": PARSE_ERROR, "message": str(e)}
+                )
+            else:
+                response = self.handle(request)
+            if response is not None:
+                outfile.write(json.dumps(response) + "\n")
+                outfile.flush()
+        self.close_all()
+
+    # ==================== Sessions ====================
+
+    def open(
+        self,
+        path,
+        rsid=None,
+        track_revisions=False,
+        author="Claude",
+        initials="C",
+        backend="minidom",
+    ):
+        """
+        Open an unpacked document, or return the session that already has it open.
+
+        A session is only reused if it was opened with the same author, initials,
+        track_revisions and backend, and with the same rsid unless rsid is None;
+        opening a document that is open with other options is an error.
+        """
+        options = {
+            "author": author,
+            "initials": initials,
+            "track_revisions": track_revisions,
+            "backend": backend,
+        }
+        resolved = Path(path).resolve()
+        for session_id, (doc, _, open_options) in self._sessions.items():
+            if doc.original_path.resolve() != resolved:
+                continue
+            different = [
+                name for name, value in options.items() if open_options[name] != value
+            ]
+            if rsid is not None and rsid != doc.rsid:
+                different.append("rsid")
+            if different:
+                raise RpcError(
+                    INVALID_PARAMS,
+                    f"{path} is already open in session {session_id} with a "
+                    f"different {', '.join(different)}; close that session first",
+                )
+            self._touch(session_id)
+            return {"session": session_id, "reused": True}
+
+        doc = Document(
+            path,
+            rsid=rsid,
+            track_revisions=track_revisions,
+            author=author,
+            initials=initials,
+            backend=backend,
+        )
+        session_id = uuid.uuid4().hex[:12]
+        self._sessions[session_id] = (doc, time.monotonic(), options)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+        return {"session": session_id, "reused": False}
+
+    def close(self, session):
+        """Close a session without saving."""
+        self._document(session)
+        del self._sessions[session]
+        return {"closed": session}
+
+    def close_all(self):
+        """Close all sessions without saving."""
+        self._sessions.clear()
+
+    def list_sessions(self):
+        """List open sessions, least recently used first."""
+        now = time.monotonic()
+        return [
+            {
+                "session": session_id,
+                "path": str(doc.original_path),
+                "idle_seconds": round(now - last_used, 3),
+            }
+            for session_id, (doc, last_used, _) in self._sessions.items()
+        ]
+
+    def _document(self, session):
+        """Return the Document of a session and mark the session as used."""
+        if session not in self._sessions:
+            raise RpcError(INVALID_PARAMS, f"Unknown or evicted session: {session}")
+        self._touch(session)
+        return self._sessions[session][0]
+
+    def _touch(self, session):
+        doc, _, options = self._sessions[session]
+        self._sessions[session] = (doc, time.monotonic(), options)
+        self._sessions.move_to_end(session)
+
+    def _evict_idle(self):
+        """Close sessions unused for longer than idle_timeout."""
+        if self.idle_timeout is None:
+            return
+        deadline = time.monotonic() - self.idle_timeout
+        while self._sessions:
+            session_id, (_, last_used, _) = next(iter(self._sessions.items()))
+            if last_used > deadline:
+                break
+            del self._sessions[session_id]
+
+    # ==================== Nodes and edits ====================
+
+    def _find(self, doc, selector):
+        """Return (editor, node) for a selector object."""
+        if not isinstance(selector, dict):
+            raise RpcError(INVALID_PARAMS, "node selector must be an object")
+        selector = dict(selector)
+        editor = doc[selector.pop("part", "word/document.xml")]
+        line_number = selector.get("line_number")
+        if isinstance(line_number, list) and len(line_number) == 2:
+            # [start, stop] selects a range of lines
+            selector["line_number"] = range(*line_number)
+        return editor, editor.get_node(**selector)
+
+    def get_node(self, session, **selector):
+        """Return the XML and tag of the node matching the selector."""
+        editor, node = self._find(self._document(session), selector)
+        return {"tag": editor.get_tag(node), "xml": _node_xml(node)}
+
+    def replace_node(self, session, target, xml):
+        return self._edit(session, target, "replace_node", xml)
+
+    def insert_after(self, session, target, xml):
+        return self._edit(session, target, "insert_after", xml)
+
+    def insert_before(self, session, target, xml):
+        return self._edit(session, target, "insert_before", xml)
+
+    def append_to(self, session, target, xml):
+        return self._edit(session, target, "append_to", xml)
+
+    def suggest_deletion(self, session, target):
+        return self._edit(session, target, "suggest_deletion")
+
+    def revert_insertion(self, session, target):
+        return self._edit(session, target, "revert_insertion")
+
+    def revert_deletion(self, session, target):
+        return self._edit(session, target, "revert_deletion")
+
+    def _edit(self, session, target, method, *args):
+        """Apply an editor method to the target node and return the resulting nodes as XML."""
+        editor, node = self._find(self._document(session), target)
+        result = getattr(editor, method)(node, *args)
+        nodes = result if isinstance(result, list) else [result]
+        return {"nodes": [_node_xml(node) for node in nodes]}
+
+    def add_comment(self, session, start, text, end=None):
+        """Add a comment from start to end (default: start); returns the comment ID."""
+        doc = self._document(session)
+        _, start_node = self._find(doc, start)
+        end_node = self._find(doc, end)[1] if end is not None else start_node
+        return {"comment_id": doc.add_comment(start_node, end_node, text)}
+
+    def reply_to_comment(self, session, parent_comment_id, text):
+        doc = self._document(session)
+        return {"comment_id": doc.reply_to_comment(parent_comment_id, text)}
+
+    def save(self, session, destination=None, validate=True):
+        """Save a session's document; the session stays open."""
+        self._document(session).save(destination=destination, validate=validate)
+        return {"saved": True}
+
+
+def _node_xml(node):
+    """Serialize a minidom or lxml node."""
+    if isinstance(node, lxml.etree._Element):
+        return lxml.etree.tostring(node, encoding="unicode", with_tail=False)
+    return node.toxml()
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve Document sessions as JSON-RPC over stdin/stdout"
+    )
+    parser.add_argument(
+        "--max-sessions",
+        type=int,
+        default=8,
+        help="Open sessions kept in memory before the least recently used is closed",
+    )
+    parser.add_argument(
+        "--idle-timeout",
+        type=float,
+        help="Close sessions unused for this many seconds (default: never)",
+    )
+    args = parser.parse_args()
+    if args.max_sessions < 1:
+        parser.error("--max-sessions must be at least 1")
+
+    server = SessionServer(max_sessions=args.max_sessions, idle_timeout=args.idle_timeout)
+    server.serve(sys.stdin, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
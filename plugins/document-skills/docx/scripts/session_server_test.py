@@ -0,0 +1,121 @@
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts.document_test import make_unpacked_document
+from scripts.session_server import (
+    INVALID_PARAMS,
+    INVALID_REQUEST,
+    METHOD_NOT_FOUND,
+    SessionServer,
+)
+
+
+class TestSessionServer(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.paths = []
+        for name in ("a", "b", "c"):
+            path = Path(self.temp_dir) / name
+            make_unpacked_document(
+                path, "    <w:p><w:r><w:t>Clause</w:t></w:r></w:p>\n"
+            )
+            self.paths.append(str(path))
+        self.server = SessionServer(max_sessions=2, idle_timeout=60)
+        self.next_id = 0
+
+    def tearDown(self):
+        self.server.close_all()
+        shutil.rmtree(self.temp_dir)
+
+    def call(self, method, notification=False, **params):
+        """Send a request and return the response; Document output is discarded."""
+        request = {"jsonrpc": "2.0", "method": method, "params": params}
+        if not notification:
+            self.next_id += 1
+            request["id"] = self.next_id
+        with contextlib.redirect_stderr(io.StringIO()):
+            return self.server.handle(request)
+
+    def open(self, path, **options):
+        response = self.call("open", path=path, **options)
+        self.assertNotIn("error", response)
+        return response["result"]
+
+    def open_sessions(self):
+        return [s["session"] for s in self.call("list")["result"]]
+
+    def test_reopen_with_same_options_reuses_session(self):
+        """Opening a path again with the same options returns its session"""
+        first = self.open(self.paths[0], author="Alice", rsid="00AB12CD")
+        again = self.open(self.paths[0], author="Alice")
+
+        self.assertFalse(first["reused"])
+        self.assertEqual(again, {"session": first["session"], "reused": True})
+        self.assertEqual(self.open_sessions(), [first["session"]])
+
+    def test_reopen_with_other_options_is_rejected(self):
+        """Opening a path open with other options fails until it is closed"""
+        session = self.open(self.paths[0], author="Alice", rsid="00AB12CD")["session"]
+
+        for options in (
+            {"author": "Bob"},
+            {"author": "Alice", "track_revisions": True},
+            {"author": "Alice", "rsid": "00FF00FF"},
+        ):
+            with self.subTest(options=options):
+                response = self.call("open", path=self.paths[0], **options)
+                self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+                self.assertIn(session, response["error"]["message"])
+
+        self.call("close", session=session)
+        self.assertFalse(self.open(self.paths[0], author="Bob")["reused"])
+
+    def test_least_recently_used_session_is_evicted(self):
+        """Beyond max_sessions, the least recently used session is closed"""
+        a = self.open(self.paths[0])["session"]
+        b = self.open(self.paths[1])["session"]
+        self.call("get_node", session=a, tag="w:t")
+        c = self.open(self.paths[2])["session"]
+
+        self.assertEqual(self.open_sessions(), [a, c])
+        response = self.call("get_node", session=b, tag="w:t")
+        self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+
+    def test_idle_session_is_evicted(self):
+        """Sessions unused for longer than idle_timeout are closed"""
+        self.open(self.paths[0])
+        now = time.monotonic()
+
+        with mock.patch("time.monotonic", return_value=now + 30):
+            self.assertEqual(len(self.open_sessions()), 1)
+        with mock.patch("time.monotonic", return_value=now + 120):
+            self.assertEqual(self.open_sessions(), [])
+
+    def test_invalid_requests(self):
+        """Unknown methods and bad params return JSON-RPC errors"""
+        self.assertEqual(self.call("no_such_method")["error"]["code"], METHOD_NOT_FOUND)
+        self.assertEqual(
+            self.call("open", no_such_param=1)["error"]["code"], INVALID_PARAMS
+        )
+        response = self.server.handle(
+            {"jsonrpc": "2.0", "id": 1, "method": "list", "params": []}
+        )
+        self.assertEqual(response["error"]["code"], INVALID_PARAMS)
+        response = self.server.handle({"id": 1, "method": "list"})
+        self.assertEqual(response["error"]["code"], INVALID_REQUEST)
+
+    def test_notification_gets_no_response(self):
+        """Requests without an id are processed without a response"""
+        self.assertIsNone(self.call("open", notification=True, path=self.paths[0]))
+        self.assertEqual(len(self.open_sessions()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
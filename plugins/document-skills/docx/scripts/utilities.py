@@ -6,6 +6,13 @@ This module provides XMLEditor, a tool for manipulating XML files with support f
 line-number-based node finding and DOM manipulation. Each element is automatically
 annotated with its original line and column position during parsing.
 
+LxmlXMLEditor offers the same API on top of lxml.etree, which parses large parts
+faster and with far less memory than minidom. Use the get_root/get_tag/get_parent/
+get_attribute/get_descendants accessors for code that should work with either.
+
+ReadOnlyXMLEditor answers the same lookups on a memory-mapped file and parses
+only the matching elements, for inspecting parts too large to load.
+
 Example usage:
     editor = XMLEditor("document.xml")
 
@@ -26,16 +33,39 @@ Example usage:
     new_elem = editor.replace_node(elem, "<w:r><w:t>new text</w:t></w:r>")
     editor.insert_after(new_elem, "<w:r><w:t>more</w:t></w:r>")
 
+    # Apply many edits together
+    with editor.batch():
+        for elem in editor.get_nodes(tag="w:r", contains="draft"):
+            editor.insert_after(elem, "<w:r><w:t>reviewed</w:t></w:r>")
+
     # Save changes
     editor.save()
 """
 
 import html
+import io
+import mmap
+import os
+import re
+import shutil
+import sys
+import tempfile
+import xml.dom.minidom
+import xml.parsers.expat
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional, Union
+from xml.parsers.expat import ExpatError
 
+import defusedxml
 import defusedxml.minidom
 import defusedxml.sax
+import lxml.etree
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
 
 
 class XMLEditor:
@@ -50,8 +80,14 @@ class XMLEditor:
         xml_path: Path to the XML file being edited
         encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
         dom: Parsed DOM tree with parse_position attributes on elements
+        modified: Whether save() needs to write the file. Set by edits, by
+            changes made with DOM methods on returned nodes, and by handing out
+            the DOM.
     """
 
+    # Number of parsed fragment templates kept for reuse by _parse_fragments
+    FRAGMENT_CACHE_SIZE = 256
+
     def __init__(self, xml_path):
         """
         Initialize with path to XML file and parse with line number tracking.
@@ -71,7 +107,43 @@ class XMLEditor:
         self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
 
         parser = _create_line_tracking_parser()
-        self.dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._dom = defusedxml.minidom.parse(str(self.xml_path), parser)
+        self._index = _NodeIndex(self._dom)
+        # Changes made through the DOM API from now on are recorded so that
+        # lookups see them (see _apply_dom_changes)
+        self._dom.track_changes()
+        self.modified = False
+        self._text_cache = {}  # element -> text, dropped when the element changes
+        self._pending_edits = None  # queued edits while inside batch()
+        self._namespace_decl = None  # root xmlns declarations for fragment wrappers
+        self._fragment_cache = OrderedDict()  # template key -> (nodes, text count)
+
+    @property
+    def dom(self):
+        """
+        The DOM document for direct manipulation; marks the file as modified.
+
+        Handing out the DOM drops the lookup index, which the next lookup
+        rebuilds from the live tree.
+        """
+        self.modified = True
+        self.refresh_index()
+        return self._dom
+
+    def refresh_index(self):
+        """
+        Drop the lookup index and cached text; the next lookup rebuilds them.
+
+        Insertions, removals, attribute and text changes made with DOM methods
+        (appendChild, setAttribute, Text.data, ...) on dom or on returned nodes
+        are picked up automatically. Call this after changing the tree in ways
+        minidom does not report, such as assigning Attr.value or entries of
+        Element.attributes directly; it also marks the file as modified.
+        """
+        self.modified = True
+        self._dom.track_changes()
+        self._index = _NodeIndex(self._dom)
+        self._text_cache = {}
 
     def get_node(
         self,
@@ -109,40 +181,13 @@ class XMLEditor:
             elem = editor.get_node(tag="w:t", contains="&#8220;Agreement")  # Entity notation
             elem = editor.get_node(tag="w:t", contains="\u201cAgreement")   # Unicode character
         """
-        matches = []
-        for elem in self.dom.getElementsByTagName(tag):
-            # Check line_number filter
-            if line_number is not None:
-                parse_pos = getattr(elem, "parse_position", (None,))
-                elem_line = parse_pos[0]
+        return self._find_node(tag, attrs, line_number, contains)
 
-                # Handle both single line number and range
-                if isinstance(line_number, range):
-                    if elem_line not in line_number:
-                        continue
-                else:
-                    if elem_line != line_number:
-                        continue
-
-            # Check attrs filter
-            if attrs is not None:
-                if not all(
-                    elem.getAttribute(attr_name) == attr_value
-                    for attr_name, attr_value in attrs.items()
-                ):
-                    continue
-
-            # Check contains filter
-            if contains is not None:
-                elem_text = self._get_element_text(elem)
-                # Normalize the search string: convert HTML entities to Unicode characters
-                # This allows searching for both "&#8220;Rowan" and ""Rowan"
-                normalized_contains = html.unescape(contains)
-                if normalized_contains not in elem_text:
-                    continue
-
-            # If all applicable filters passed, this is a match
-            matches.append(elem)
+    def _find_node(self, tag, attrs=None, line_number=None, contains=None):
+        """Implements get_node(); used directly for read-only lookups."""
+        matches = self._find_nodes(
+            tag, attrs=attrs, line_number=line_number, contains=contains
+        )
 
         if not matches:
             # Build descriptive error message
@@ -180,12 +225,143 @@ class XMLEditor:
             )
         return matches[0]
 
+    def get_nodes(
+        self,
+        tag: str,
+        attrs: Optional[dict[str, str]] = None,
+        line_number: Optional[Union[int, range]] = None,
+        contains: Optional[str] = None,
+    ):
+        """
+        Get all DOM elements matching a tag and optional filters.
+
+        Takes the same filters as get_node() but returns every match instead of
+        requiring exactly one. Candidates come from an index over the DOM, so
+        lookups by attribute, line number or words of the contained text do not
+        scan the whole document.
+
+        Args:
+            tag: The XML tag name (e.g., "w:del", "w:ins", "w:r")
+            attrs: Dictionary of attribute name-value pairs to match
+            line_number: Line number (int) or line range (range) in original XML file
+            contains: Text string that must appear within the element
+
+        Returns:
+            List[defusedxml.minidom.Element]: Matching elements (possibly empty),
+            not necessarily in document order
+
+        Example:
+            rels = editor.get_nodes(tag="Relationship", attrs={"Target": "people.xml"})
+        """
+        return self._find_nodes(tag, attrs, line_number, contains)
+
+    def _find_nodes(self, tag, attrs=None, line_number=None, contains=None):
+        """Implements get_nodes(); used directly for read-only lookups."""
+        self._apply_dom_changes()
+
+        # Normalize the search string: convert HTML entities to Unicode characters
+        # This allows searching for both "&#8220;Rowan" and ""Rowan"
+        if contains is not None:
+            contains = html.unescape(contains)
+
+        candidates = None
+        if contains is not None and not attrs and line_number is None:
+            candidates = self._index.text_candidates(
+                tag, contains, self._get_element_text
+            )
+        if candidates is None:
+            candidates = self._index.candidates(tag, attrs, line_number)
+        matches = self._filter_nodes(
+            candidates, attrs, line_number, contains, self._get_element_text
+        )
+        if matches and contains is not None:
+            # Cached text misses changes minidom does not report, so confirm
+            # the (few) matches against the live tree
+            matches = [
+                elem for elem in matches if contains in self._refresh_text(elem)
+            ]
+        return matches
+
+    def _apply_dom_changes(self):
+        """
+        Update the index and cached text for changes made through the DOM API.
+
+        Editor methods keep both up to date themselves; this covers nodes that
+        callers inserted, removed or changed with minidom methods on dom or on
+        returned nodes (see _PositionedDocument.track_changes).
+        """
+        changes = self._dom.track_changes()
+        if not changes:
+            return
+        self.modified = True
+        inserted = []
+        changed = []
+        for node, kind in changes.items():
+            if not self._index.is_attached(node):
+                continue
+            if kind & _DOM_INSERTED:
+                inserted.append(node)
+            elif kind & _DOM_ATTRIBUTES:
+                changed.append(node)
+            if kind & _DOM_CONTENT:
+                # Text of the node and its ancestors changed
+                elements = []
+                while node is not None and node.nodeType == node.ELEMENT_NODE:
+                    self._text_cache.pop(node, None)
+                    elements.append(node)
+                    node = node.parentNode
+                self._index.text_changed(elements)
+        self._index.add(inserted)
+        self._invalidate_text(inserted)
+        self._index.add(changed, deep=False)
+
+    def _filter_nodes(self, elements, attrs, line_number, contains, text_of):
+        """
+        Return the elements that pass the line_number, attrs and contains filters.
+
+        contains must already be normalized with html.unescape; text_of is the
+        function used to get an element's text.
+        """
+        matches = []
+        for elem in elements:
+            # Check line_number filter
+            if line_number is not None:
+                parse_pos = getattr(elem, "parse_position", (None,))
+                elem_line = parse_pos[0]
+
+                # Handle both single line number and range
+                if isinstance(line_number, range):
+                    if elem_line not in line_number:
+                        continue
+                else:
+                    if elem_line != line_number:
+                        continue
+
+            # Check attrs filter
+            if attrs is not None:
+                if not all(
+                    elem.getAttribute(attr_name) == attr_value
+                    for attr_name, attr_value in attrs.items()
+                ):
+                    continue
+
+            # Check contains filter
+            if contains is not None:
+                if contains not in text_of(elem):
+                    continue
+
+            # If all applicable filters passed, this is a match
+            matches.append(elem)
+        return matches
+
     def _get_element_text(self, elem):
         """
         Recursively extract all text content from an element.
 
         Skips text nodes that contain only whitespace (spaces, tabs, newlines),
         which typically represent XML formatting rather than document content.
+        Results are cached per element (including descendants visited on the
+        way) until the element is changed through this editor.
 
         Args:
             elem: defusedxml.minidom.Element to extract text from
@@ -193,16 +369,59 @@ class XMLEditor:
         Returns:
             str: Concatenated text from all non-whitespace text nodes within the element
         """
+        text = self._text_cache.get(elem)
+        if text is None:
+            text_parts = []
+            for node in elem.childNodes:
+                if node.nodeType == node.TEXT_NODE:
+                    # Skip whitespace-only text nodes (XML formatting)
+                    if node.data.strip():
+                        text_parts.append(node.data)
+                elif node.nodeType == node.ELEMENT_NODE:
+                    text_parts.append(self._get_element_text(node))
+            text = self._text_cache[elem] = "".join(text_parts)
+        return text
+
+    def _read_text(self, elem):
+        """Extract an element's text from the live tree, bypassing the cache."""
         text_parts = []
         for node in elem.childNodes:
             if node.nodeType == node.TEXT_NODE:
-                # Skip whitespace-only text nodes (XML formatting)
                 if node.data.strip():
                     text_parts.append(node.data)
             elif node.nodeType == node.ELEMENT_NODE:
-                text_parts.append(self._get_element_text(node))
+                text_parts.append(self._read_text(node))
         return "".join(text_parts)
 
+    def _refresh_text(self, elem):
+        """Re-read an element's text from the live tree and update the cache."""
+        text = self._read_text(elem)
+        if self._text_cache.get(elem) != text:
+            self._text_cache[elem] = text
+            self._index.text_changed([elem])
+        return text
+
+    def _invalidate_text(self, nodes):
+        """
+        Drop cached text for nodes whose content changed.
+
+        Covers the nodes, their descendants and all their ancestors, whose
+        concatenated text includes theirs.
+
+        Args:
+            nodes: List of defusedxml.minidom.Node objects that were inserted or
+                modified in place
+        """
+        changed = list(_iter_elements(nodes, deep=True))
+        for node in nodes:
+            parent = node.parentNode
+            while parent is not None and parent.nodeType == parent.ELEMENT_NODE:
+                changed.append(parent)
+                parent = parent.parentNode
+        for elem in changed:
+            self._text_cache.pop(elem, None)
+        self._index.text_changed(changed)
+
     def replace_node(self, elem, new_content):
         """
         Replace a DOM element with new XML content.
@@ -217,12 +436,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.replace_node(old_elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(new_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        parent.removeChild(elem)
-        return nodes
+        return self._edit("replace", elem, new_content)
 
     def insert_after(self, elem, xml_content):
         """
@@ -238,15 +452,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_after(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        next_sibling = elem.nextSibling
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            if next_sibling:
-                parent.insertBefore(node, next_sibling)
-            else:
-                parent.appendChild(node)
-        return nodes
+        return self._edit("after", elem, xml_content)
 
     def insert_before(self, elem, xml_content):
         """
@@ -262,11 +468,7 @@ class XMLEditor:
         Example:
             new_nodes = editor.insert_before(elem, "<w:r><w:t>text</w:t></w:r>")
         """
-        parent = elem.parentNode
-        nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            parent.insertBefore(node, elem)
-        return nodes
+        return self._edit("before", elem, xml_content)
 
     def append_to(self, elem, xml_content):
         """
@@ -282,15 +484,114 @@ class XMLEditor:
         Example:
             new_nodes = editor.append_to(elem, "<w:r><w:t>text</w:t></w:r>")
         """
+        return self._edit("append", elem, xml_content)
+
+    @contextmanager
+    def batch(self):
+        """
+        Queue replace_node/insert_after/insert_before/append_to calls and apply
+        them together when the block exits.
+
+        All queued fragments are parsed as one document and post-processing
+        (attribute injection in DocxXMLEditor, indexing) runs once over all
+        inserted nodes, which is much faster than separate calls for large
+        numbers of edits. Edits are applied in the order they were made.
+
+        Inside the block, edit methods return empty lists that are filled with
+        the inserted nodes when the block exits, so they cannot be used as
+        anchors for further edits in the same batch. Lookups inside the block
+        see the document as it was before the batch. If the block raises, the
+        queued edits are discarded. Nested batch() blocks join the outer batch.
+
+        Raises:
+            ValueError: If an edit targets an element (or a descendant of one)
+                replaced by an earlier edit in the same batch; no edits are applied
+
+        Example:
+            with editor.batch():
+                for elem in editor.get_nodes(tag="w:r", contains="draft"):
+                    editor.suggest_deletion(elem)  # Applied immediately
+                    editor.insert_after(elem, "<w:ins>...</w:ins>")  # Queued
+        """
+        if self._pending_edits is not None:
+            yield self
+            return
+
+        self._pending_edits = []
+        try:
+            yield self
+            edits = self._pending_edits
+        finally:
+            self._pending_edits = None
+        self._apply_edits(edits)
+
+    def _edit(self, kind, elem, xml_content):
+        """Apply an edit, or queue it while inside batch()."""
+        if self._pending_edits is not None:
+            nodes = []
+            self._pending_edits.append((kind, elem, xml_content, nodes))
+            return nodes
+        return self._edit_now(kind, elem, xml_content)
+
+    def _edit_now(self, kind, elem, xml_content):
+        """Apply an edit immediately, even inside batch()."""
         nodes = self._parse_fragment(xml_content)
-        for node in nodes:
-            elem.appendChild(node)
+        self._place_nodes(kind, elem, nodes)
+        self._on_insert(nodes)
         return nodes
 
+    def _apply_edits(self, edits):
+        """Parse the fragments of queued edits together and apply them in order."""
+        if not edits:
+            return
+
+        # Check targets up front so that a bad edit leaves the document unchanged
+        replaced = set()
+        for kind, elem, _, _ in edits:
+            node = elem
+            while node is not None:
+                if node in replaced:
+                    raise ValueError(
+                        f"Cannot apply batched edit: <{elem.nodeName}> is removed "
+                        f"by an earlier replace_node in the same batch"
+                    )
+                node = node.parentNode
+            if kind == "replace":
+                replaced.add(elem)
+
+        fragments = self._parse_fragments([content for _, _, content, _ in edits])
+        inserted = []
+        for (kind, elem, _, result), nodes in zip(edits, fragments):
+            self._place_nodes(kind, elem, nodes)
+            result.extend(nodes)
+            inserted.extend(nodes)
+        self._on_insert(inserted)
+
+    def _place_nodes(self, kind, elem, nodes):
+        """Insert parsed nodes relative to elem ("replace", "after", "before" or "append")."""
+        if kind == "append":
+            for node in nodes:
+                elem.appendChild(node)
+            return
+
+        parent = elem.parentNode
+        if kind == "after":
+            next_sibling = elem.nextSibling
+            for node in nodes:
+                if next_sibling:
+                    parent.insertBefore(node, next_sibling)
+                else:
+                    parent.appendChild(node)
+        else:
+            for node in nodes:
+                parent.insertBefore(node, elem)
+            if kind == "replace":
+                parent.removeChild(elem)
+
     def get_next_rid(self):
         """Get the next available rId for relationships files."""
         max_id = 0
-        for rel_elem in self.dom.getElementsByTagName("Relationship"):
+        for rel_elem in self._dom.getElementsByTagName("Relationship"):
             rel_id = rel_elem.getAttribute("Id")
             if rel_id.startswith("rId"):
                 try:
@@ -299,15 +600,85 @@ class XMLEditor:
                     pass
         return f"rId{max_id + 1}"
 
+    def get_root(self):
+        """Return the root element of the document."""
+        return self._find_root()
+
+    def _find_root(self):
+        """Implements get_root(); used directly for read-only lookups."""
+        return self._dom.documentElement
+
+    def get_tag(self, elem):
+        """Return the qualified tag name of an element (e.g., "w:p")."""
+        return elem.tagName
+
+    def get_parent(self, elem):
+        """Return the parent element of an element."""
+        return elem.parentNode
+
+    def get_attribute(self, elem, name):
+        """Return an attribute value by qualified name, or "" if not present."""
+        return elem.getAttribute(name)
+
+    def get_descendants(self, elem, tag):
+        """Return all descendant elements with the given tag ("*" for any), in document order."""
+        return self._find_descendants(elem, tag)
+
+    def _find_descendants(self, elem, tag):
+        """Implements get_descendants(); used directly for read-only lookups."""
+        return list(elem.getElementsByTagName(tag))
+
     def save(self):
         """
         Save the edited XML back to the file.
 
         Serializes the DOM tree and writes it back to the original file path,
-        preserving the original encoding (ascii or utf-8).
+        preserving the original encoding (ascii or utf-8). Does nothing if the
+        file was not modified. The output is streamed to the file and is
+        byte-for-byte what dom.toxml(encoding) would produce.
         """
-        content = self.dom.toxml(encoding=self.encoding)
-        self.xml_path.write_bytes(content)
+        # Pick up changes made with DOM methods since the last lookup
+        self._apply_dom_changes()
+        if not self.modified:
+            return
+        with _replacing_file(self.xml_path) as f:
+            # Same writer setup as minidom's toxml()
+            writer = io.TextIOWrapper(
+                f, encoding=self.encoding, errors="xmlcharrefreplace", newline="\n"
+            )
+            self._dom.writexml(writer, encoding=self.encoding)
+            writer.flush()
+            writer.detach()
+
+    def _on_insert(self, nodes):
+        """
+        Process nodes that were just inserted into the DOM.
+
+        Called by replace_node, insert_after, insert_before and append_to before
+        they return. Subclasses that modify inserted nodes should do so before
+        calling this implementation, which adds the nodes to the lookup index
+        and drops cached text of the elements around them.
+
+        Args:
+            nodes: List of defusedxml.minidom.Node objects that were inserted
+        """
+        self.modified = True
+        self._index.add(nodes)
+        self._invalidate_text(nodes)
+
+    def _on_change(self, nodes):
+        """
+        Process nodes that were modified in place (attributes or children changed).
+
+        Subclass helpers that restructure existing nodes call this afterwards so
+        that lookups and save() see the change.
+
+        Args:
+            nodes: List of changed nodes; their descendants are covered too
+        """
+        self.modified = True
+        self._index.add(nodes)
+        self._invalidate_text(nodes)
 
     def _parse_fragment(self, xml_content):
         """
@@ -322,34 +693,1282 @@ class XMLEditor:
         Raises:
             AssertionError: If fragment contains no element nodes
         """
-        # Extract namespace declarations from the root document element
-        root_elem = self.dom.documentElement
-        namespaces = []
-        if root_elem and root_elem.attributes:
-            for i in range(root_elem.attributes.length):
-                attr = root_elem.attributes.item(i)
-                if attr.name.startswith("xmlns"):  # type: ignore
-                    namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
-
-        ns_decl = " ".join(namespaces)
-        wrapper = f"<root {ns_decl}>{xml_content}</root>"
-        fragment_doc = defusedxml.minidom.parseString(wrapper)
-        nodes = [
-            self.dom.importNode(child, deep=True)
-            for child in fragment_doc.documentElement.childNodes  # type: ignore
-        ]
-        elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+        return self._parse_fragments([xml_content])[0]
+
+    def _parse_fragments(self, contents):
+        """
+        Parse several XML fragments in one pass and return their imported nodes.
+
+        Fragments that differ from an earlier one only in their text content are
+        cloned from a cached parse of that template and get their text filled
+        in, instead of being parsed again. The rest are parsed together in one
+        wrapper document.
+
+        Args:
+            contents: List of strings containing XML fragments
+
+        Returns:
+            List with one list of defusedxml.minidom.Node objects per fragment
+
+        Raises:
+            AssertionError: If a fragment contains no element nodes
+        """
+        fragments = [None] * len(contents)
+        to_parse = []  # (position, template key, content)
+        repeats = []  # (position, template key, texts) of uncached keys seen before
+        parsed_keys = set()
+        for i, content in enumerate(contents):
+            key, texts = _split_fragment_text(content)
+            cached = self._fragment_cache.get(key) if key is not None else None
+            if cached is not None:
+                self._fragment_cache.move_to_end(key)
+                fragments[i] = self._instantiate_template(cached[0], texts)
+            elif key is not None and key in parsed_keys:
+                repeats.append((i, key, texts))
+            else:
+                parsed_keys.add(key)
+                to_parse.append((i, key, content))
+
+        while to_parse:
+            containers = self._parse_wrapped([content for _, _, content in to_parse])
+            for (i, key, _), container in zip(to_parse, containers):
+                children = list(container.childNodes)
+                nodes = [self._dom.importNode(child, deep=True) for child in children]
+                elements = [n for n in nodes if n.nodeType == n.ELEMENT_NODE]
+                assert elements, "Fragment must contain at least one element"
+                if key is not None:
+                    self._cache_template(key, children)
+                fragments[i] = nodes
+
+            # Later fragments of a template parsed above are cloned from it
+            to_parse = []
+            for i, key, texts in repeats:
+                cached = self._fragment_cache.get(key)
+                if cached is not None:
+                    fragments[i] = self._instantiate_template(cached[0], texts)
+                else:
+                    to_parse.append((i, None, contents[i]))
+            repeats = []
+        return fragments
+
+    def _parse_wrapped(self, contents):
+        """Parse fragments in one wrapper document and return one container node per fragment."""
+        ns_decl = self._get_namespace_decl()
+        if len(contents) == 1:
+            wrapper = f"<root {ns_decl}>{contents[0]}</root>"
+        else:
+            # One child element per fragment keeps their nodes apart
+            wrapper = "".join(
+                [f"<root {ns_decl}>"]
+                + [f"<fragment>{content}</fragment>" for content in contents]
+                + ["</root>"]
+            )
+        try:
+            fragment_doc = defusedxml.minidom.parseString(wrapper)
+        except ExpatError:
+            if len(contents) > 1:
+                # Parse separately so the error position refers to the bad fragment
+                for content in contents:
+                    self._parse_wrapped([content])
+            raise
+        if len(contents) == 1:
+            return [fragment_doc.documentElement]
+        return list(fragment_doc.documentElement.childNodes)  # type: ignore
+
+    def _get_namespace_decl(self):
+        """Return the root element's xmlns declarations, computed once per editor."""
+        if self._namespace_decl is None:
+            # Extract namespace declarations from the root document element
+            root_elem = self._dom.documentElement
+            namespaces = []
+            if root_elem and root_elem.attributes:
+                for i in range(root_elem.attributes.length):
+                    attr = root_elem.attributes.item(i)
+                    if attr.name.startswith("xmlns"):  # type: ignore
+                        namespaces.append(f'{attr.name}="{attr.value}"')  # type: ignore
+            self._namespace_decl = " ".join(namespaces)
+        return self._namespace_decl
+
+    def _on_namespaces_changed(self):
+        """
+        Forget cached fragment state after namespace declarations were added to
+        the root element.
+
+        Must be called by code that adds xmlns attributes to the root element,
+        so that later fragments can use the new prefixes.
+        """
+        self._namespace_decl = None
+        self._fragment_cache.clear()
+
+    def _cache_template(self, key, nodes):
+        """Keep parsed fragment nodes for reuse by fragments with the same markup."""
+        text_count = sum(1 for _ in _iter_text_nodes(nodes))
+        if text_count != key.count(_TEXT_SLOT):
+            return  # Text did not map one-to-one onto text nodes; don't reuse
+        self._fragment_cache[key] = (nodes, text_count)
+        while len(self._fragment_cache) > self.FRAGMENT_CACHE_SIZE:
+            self._fragment_cache.popitem(last=False)
+
+    def _instantiate_template(self, template, texts):
+        """Clone cached fragment nodes into this document and fill in their text."""
+        nodes = [self._dom.importNode(node, deep=True) for node in template]
+        for text_node, text in zip(_iter_text_nodes(nodes), texts):
+            text_node.data = text
+        return nodes
+
+
+class LxmlXMLEditor(XMLEditor):
+    """
+    XMLEditor backed by lxml.etree instead of minidom.
+
+    Provides the same lookup and editing API as XMLEditor, but keeps the parsed
+    tree in libxml2 structures. On large parts this parses several times faster
+    and uses a fraction of the memory of a minidom DOM. In exchange, lookups
+    are slower: there is no lookup index or text cache, so every get_node()
+    walks the tree and contains= re-reads element text, which makes such
+    lookups several times slower than XMLEditor's. Returned nodes are
+    lxml.etree elements, so use the get_tag/get_parent/get_attribute/
+    get_descendants accessors instead of minidom methods when code must work
+    with both editors.
+
+    Line tracking uses lxml's sourceline: elem.sourceline is the line on which
+    an element starts in the original file, and None for inserted elements.
+    Tags and attribute names are given with prefixes (e.g., "w:p", "w:id"),
+    which are resolved through the namespace declarations on the root element.
+
+    Attributes:
+        xml_path: Path to the XML file being edited
+        encoding: Detected encoding of the XML file ('ascii' or 'utf-8')
+        tree: Parsed lxml.etree.ElementTree
+        modified: Whether save() needs to write the file. lxml does not report
+            changes made to returned elements, so lookups set it too, as do
+            edits and handing out the tree.
+    """
+
+    def __init__(self, xml_path):
+        """
+        Initialize with path to XML file and parse it with lxml.
+
+        Args:
+            xml_path: Path to XML file to edit (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            header = f.read(200).decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+
+        self._tree = lxml.etree.parse(str(self.xml_path), _create_lxml_parser())
+        self._namespace_decl = None  # root xmlns declarations for fragment wrappers
+        self.modified = False
+
+    @property
+    def tree(self):
+        """The parsed tree for direct manipulation; marks the file as modified."""
+        self.modified = True
+        return self._tree
+
+    @property
+    def dom(self):
+        """Not available: the parsed document is an lxml tree, see tree."""
+        raise TypeError(
+            f"{type(self).__name__} has no minidom DOM; use tree for the lxml tree"
+        )
+
+    def refresh_index(self):
+        """Mark the file as modified; lookups always scan the live tree."""
+        self.modified = True
+
+    @property
+    def _namespaces(self):
+        """Prefix to namespace URI mapping used to resolve qualified names."""
+        namespaces = dict(self._tree.getroot().nsmap)
+        namespaces["xml"] = _XML_NAMESPACE
+        return namespaces
+
+    def get_node(self, tag, attrs=None, line_number=None, contains=None):
+        """XMLEditor.get_node(); marks the file as modified (see modified)."""
+        self.modified = True
+        return self._find_node(tag, attrs, line_number, contains)
+
+    def get_nodes(self, tag, attrs=None, line_number=None, contains=None):
+        """XMLEditor.get_nodes(); marks the file as modified (see modified)."""
+        self.modified = True
+        return self._find_nodes(tag, attrs, line_number, contains)
+
+    def _find_nodes(self, tag, attrs=None, line_number=None, contains=None):
+        """
+        Get all elements matching a tag and optional filters.
+
+        Implements XMLEditor.get_nodes(). Matches are returned in document order.
+
+        Returns:
+            List[lxml.etree._Element]: Matching elements (possibly empty)
+        """
+        normalized_contains = html.unescape(contains) if contains is not None else None
+        attr_names = {
+            self._qualified_name(name, attribute=True): value
+            for name, value in (attrs or {}).items()
+        }
+
+        matches = []
+        for elem in self._iter_tag(self._tree.getroot(), tag):
+            if line_number is not None:
+                if isinstance(line_number, range):
+                    if elem.sourceline not in line_number:
+                        continue
+                elif elem.sourceline != line_number:
+                    continue
+
+            if not all(
+                elem.get(name, "") == value for name, value in attr_names.items()
+            ):
+                continue
+
+            if normalized_contains is not None:
+                if normalized_contains not in self._get_element_text(elem):
+                    continue
+
+            matches.append(elem)
+        return matches
+
+    def _get_element_text(self, elem):
+        """
+        Extract all text content from an element.
+
+        Skips whitespace-only text, which typically represents XML formatting
+        rather than document content.
+
+        Args:
+            elem: lxml.etree element to extract text from
+
+        Returns:
+            str: Concatenated text from all non-whitespace text within the element
+        """
+        return "".join(text for text in elem.itertext() if text.strip())
+
+    def replace_node(self, elem, new_content):
+        """
+        Replace an element with new XML content.
+
+        Args:
+            elem: lxml.etree element to replace
+            new_content: String containing XML to replace the node with
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        nodes = self._parse_fragment(new_content)
+        for node in nodes:
+            elem.addprevious(node)
+        # Keep the formatting whitespace that followed the replaced element
+        if elem.tail:
+            nodes[-1].tail = (nodes[-1].tail or "") + elem.tail
+        elem.getparent().remove(elem)
+        self._on_insert(nodes)
+        return nodes
+
+    def insert_after(self, elem, xml_content):
+        """
+        Insert XML content after an element.
+
+        Args:
+            elem: lxml.etree element to insert after
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        nodes = self._parse_fragment(xml_content)
+        anchor = elem
+        for node in nodes:
+            anchor.addnext(node)
+            anchor = node
+        self._on_insert(nodes)
+        return nodes
+
+    def insert_before(self, elem, xml_content):
+        """
+        Insert XML content before an element.
+
+        Args:
+            elem: lxml.etree element to insert before
+            xml_content: String containing XML to insert
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        nodes = self._parse_fragment(xml_content)
+        for node in nodes:
+            elem.addprevious(node)
+        self._on_insert(nodes)
+        return nodes
+
+    def append_to(self, elem, xml_content):
+        """
+        Append XML content as a child of an element.
+
+        Args:
+            elem: lxml.etree element to append to
+            xml_content: String containing XML to append
+
+        Returns:
+            List[lxml.etree._Element]: All inserted nodes
+        """
+        nodes = self._parse_fragment(xml_content)
+        for node in nodes:
+            elem.append(node)
+        self._on_insert(nodes)
+        return nodes
+
+    @contextmanager
+    def batch(self):
+        """
+        Group edits, for compatibility with XMLEditor.batch().
+
+        lxml edits are cheap, so they are applied immediately and the returned
+        node lists are usable as soon as each call returns.
+        """
+        yield self
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        for rel_elem in self._iter_tag(self._tree.getroot(), "Relationship"):
+            rel_id = rel_elem.get("Id", "")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def get_root(self):
+        """Return the root element of the document; marks the file as modified."""
+        self.modified = True
+        return self._find_root()
+
+    def _find_root(self):
+        """Return the root element of the document."""
+        return self._tree.getroot()
+
+    def get_tag(self, elem):
+        """Return the qualified tag name of an element (e.g., "w:p")."""
+        local_name = lxml.etree.QName(elem).localname
+        return f"{elem.prefix}:{local_name}" if elem.prefix else local_name
+
+    def get_parent(self, elem):
+        """Return the parent element of an element; marks the file as modified."""
+        self.modified = True
+        return elem.getparent()
+
+    def get_attribute(self, elem, name):
+        """Return an attribute value by qualified name, or "" if not present."""
+        return elem.get(self._qualified_name(name, attribute=True), "")
+
+    def get_descendants(self, elem, tag):
+        """XMLEditor.get_descendants(); marks the file as modified (see modified)."""
+        self.modified = True
+        return self._find_descendants(elem, tag)
+
+    def _find_descendants(self, elem, tag):
+        """Return all descendant elements with the given tag ("*" for any), in document order."""
+        return [node for node in self._iter_tag(elem, tag) if node is not elem]
+
+    def save(self):
+        """
+        Save the edited XML back to the file.
+
+        Streams the tree to the original file path, preserving the original
+        encoding (ascii or utf-8) and standalone declaration. Does nothing if
+        the file was not modified.
+        """
+        if not self.modified:
+            return
+        with _replacing_file(self.xml_path) as f:
+            self._tree.write(
+                f,
+                encoding=self.encoding,
+                xml_declaration=True,
+                standalone=self._tree.docinfo.standalone,
+            )
+
+    def _on_insert(self, nodes):
+        """
+        Process nodes that were just inserted into the tree.
+
+        Inserted elements get no line number so that line_number lookups keep
+        referring to the original file.
+
+        Args:
+            nodes: List of lxml.etree elements that were inserted
+        """
+        self.modified = True
+        for node in nodes:
+            for elem in node.iter():
+                elem.sourceline = 0
+
+    def _on_change(self, nodes):
+        """Record that nodes were modified in place."""
+        self.modified = True
+
+    def _parse_fragment(self, xml_content):
+        """
+        Parse XML fragment and return list of top-level nodes.
+
+        Args:
+            xml_content: String containing XML fragment
+
+        Returns:
+            List of lxml.etree elements (and comments) from the fragment
+
+        Raises:
+            AssertionError: If fragment contains no element nodes
+        """
+        # The root's namespaces are fixed once the tree is loaded
+        if self._namespace_decl is None:
+            self._namespace_decl = " ".join(
+                f'xmlns:{prefix}="{uri}"' if prefix else f'xmlns="{uri}"'
+                for prefix, uri in self._tree.getroot().nsmap.items()
+            )
+            self._fragment_parser = _create_lxml_parser()
+        wrapper = f"<root {self._namespace_decl}>{xml_content}</root>"
+        fragment = lxml.etree.fromstring(wrapper.encode("utf-8"), self._fragment_parser)
+        nodes = list(fragment)
+        elements = [n for n in nodes if isinstance(n.tag, str)]
         assert elements, "Fragment must contain at least one element"
         return nodes
 
+    def _qualified_name(self, name, attribute=False):
+        """
+        Convert a prefixed name (e.g., "w:id") into lxml's {namespace}local form.
+
+        Unprefixed element names use the root's default namespace; unprefixed
+        attribute names have no namespace. Unknown prefixes are returned as-is.
+        """
+        if ":" in name:
+            prefix, local_name = name.split(":", 1)
+            uri = self._namespaces.get(prefix)
+            return f"{{{uri}}}{local_name}" if uri else name
+        if attribute:
+            return name
+        uri = self._namespaces.get(None)
+        return f"{{{uri}}}{name}" if uri else name
+
+    def _iter_tag(self, elem, tag):
+        """Iterate elem and its descendants matching a prefixed tag name."""
+        if tag == "*":
+            return elem.iter(lxml.etree.Element)
+        return elem.iter(self._qualified_name(tag))
+
+
+class ReadOnlyXMLEditor(XMLEditor):
+    """
+    Look up nodes in a large XML file without parsing the whole file.
+
+    The file is memory-mapped. line_number lookups use a compact index of the
+    byte offset, line, column, tag and namespace declarations in scope of every
+    start tag (about 24 bytes per element, built by one streaming pass on first
+    use); other lookups stream
+    through the file. Only the elements that match are parsed, so memory does
+    not grow with the size of the document tree.
+
+    Returned nodes are detached minidom elements with parse_position set as in
+    XMLEditor, so get_tag/get_attribute/get_descendants work on them but
+    get_parent() of a returned node is None. Edits, batch(), dom and get_root()
+    raise ValueError, and save() does nothing.
+
+    Example:
+        with ReadOnlyXMLEditor("unpacked/word/document.xml") as reader:
+            para = reader.get_node(tag="w:p", line_number=51234)
+            print(para.toxml())
+    """
+
+    # Bytes passed to expat per call while scanning
+    CHUNK_SIZE = 1 << 20
+
+    def __init__(self, xml_path):
+        """
+        Open and memory-map an XML file; nothing is parsed until the first lookup.
+
+        Args:
+            xml_path: Path to XML file to read (str or Path)
+
+        Raises:
+            ValueError: If the XML file does not exist or is empty
+        """
+        self.xml_path = Path(xml_path)
+        if not self.xml_path.exists():
+            raise ValueError(f"XML file not found: {xml_path}")
+        if self.xml_path.stat().st_size == 0:
+            raise ValueError(f"XML file is empty: {xml_path}")
+
+        with open(self.xml_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self._mmap[:200].decode("utf-8", errors="ignore")
+        self.encoding = "ascii" if 'encoding="ascii"' in header else "utf-8"
+        self.modified = False
+        # Start tag index in document order, built on the first line_number lookup
+        self._offsets = None  # array('Q') of byte offsets
+        self._lines = None  # array('I') of line numbers
+        self._columns = None  # array('I') of column numbers
+        self._tag_ids = None  # array('I') of positions in _tag_names
+        self._tag_names = None  # tag name -> tag id
+        self._scope_ids = None  # array('I') of positions in _scopes
+        self._scopes = None  # scope id -> xmlns declarations in scope as markup
+
+    def close(self):
+        """Release the memory map."""
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def dom(self):
+        raise self._read_only_error()
+
+    def _find_nodes(self, tag, attrs=None, line_number=None, contains=None):
+        """Find and parse matching elements without loading the document tree."""
+        if contains is not None:
+            contains = html.unescape(contains)
+        if line_number is not None:
+            starts = self._starts_at_lines(tag, line_number)
+        else:
+            starts = self._scan_for_matches(tag, attrs, contains)
+        elements = [self._materialize(*start) for start in starts]
+        return self._filter_nodes(
+            elements, attrs, line_number, contains, self._read_text
+        )
+
+    def _starts_at_lines(self, tag, line_number):
+        """
+        Return (offset, line, column, namespaces) of start tags with tag on the
+        given lines, where namespaces are the xmlns declarations in scope.
+        """
+        if self._offsets is None:
+            self._build_index()
+        if isinstance(line_number, range):
+            first_line, stop_line = line_number.start, line_number.stop
+        else:
+            first_line, stop_line = line_number, line_number + 1
+        tag_id = self._tag_names.get(tag)
+        first = bisect_left(self._lines, first_line)
+        stop = bisect_left(self._lines, stop_line, first)
+        return [
+            (
+                self._offsets[i],
+                self._lines[i],
+                self._columns[i],
+                self._scopes[self._scope_ids[i]],
+            )
+            for i in range(first, stop)
+            if tag == "*" or self._tag_ids[i] == tag_id
+        ]
+
+    def _build_index(self):
+        """
+        Record the offset, line, column, tag and namespace scope of every start
+        tag in one pass.
+        """
+        offsets, lines, columns = array("Q"), array("I"), array("I")
+        tag_ids, scope_ids = array("I"), array("I")
+        tag_names = {}
+        scopes = _NamespaceScopes()
+        parser = _create_scanning_parser()
+
+        def start_element(name, attributes):
+            offsets.append(parser.CurrentByteIndex)
+            lines.append(parser.CurrentLineNumber)
+            columns.append(parser.CurrentColumnNumber)
+            tag_ids.append(tag_names.setdefault(name, len(tag_names)))
+            scope_ids.append(scopes.start(attributes))
+
+        def end_element(name):
+            scopes.end()
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        self._scan(parser)
+        self._offsets, self._lines, self._columns = offsets, lines, columns
+        self._tag_ids, self._tag_names = tag_ids, tag_names
+        self._scope_ids, self._scopes = scope_ids, scopes.markup
+
+    def _scan_for_matches(self, tag, attrs, contains):
+        """
+        Stream through the file and return (offset, line, column, namespaces) of
+        the elements with tag whose attributes and text may match, where
+        namespaces are the xmlns declarations in scope.
+
+        Text is collected the way XMLEditor's parser splits it into text nodes,
+        skipping whitespace-only pieces; the caller re-checks the parsed elements.
+        """
+        parser = _create_scanning_parser()
+        matches = []
+        # (depth, offset, line, column, namespaces, text pieces), innermost last
+        open_matches = []
+        depth = 0
+        scopes = _NamespaceScopes()
+
+        def start_element(name, attributes):
+            nonlocal depth
+            depth += 1
+            scope_id = scopes.start(attributes)
+            if (tag == "*" or name == tag) and (
+                attrs is None
+                or all(attributes.get(key, "") == value for key, value in attrs.items())
+            ):
+                open_matches.append(
+                    (
+                        depth,
+                        parser.CurrentByteIndex,
+                        parser.CurrentLineNumber,
+                        parser.CurrentColumnNumber,
+                        scopes.markup[scope_id],
+                        [],
+                    )
+                )
+
+        def end_element(name):
+            nonlocal depth
+            if open_matches and open_matches[-1][0] == depth:
+                _, offset, line, column, namespaces, pieces = open_matches.pop()
+                if contains is None or contains in "".join(pieces):
+                    matches.append((offset, line, column, namespaces))
+            scopes.end()
+            depth -= 1
+
+        def character_data(data):
+            if open_matches and data.strip():
+                for open_match in open_matches:
+                    open_match[5].append(data)
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        if contains is not None:
+            parser.CharacterDataHandler = character_data
+        self._scan(parser)
+        # Elements are completed innermost first; return them in document order
+        matches.sort()
+        return matches
+
+    def _materialize(self, offset, line, column, namespaces):
+        """
+        Parse the element whose start tag is at offset into a detached element.
+
+        namespaces are the xmlns declarations in scope at the element, which
+        may come from any of its ancestors, not just the root.
+        """
+        end = self._element_end(offset)
+        content = self._mmap[offset:end].decode("utf-8")
+        # The element starts at line 2, column 0 of the wrapper
+        fragment = defusedxml.minidom.parseString(
+            f"<root {namespaces}>\n{content}</root>",
+            _create_line_tracking_parser(),
+        )
+        fragment.shift_positions(2, line - 2, column)
+        elem = fragment.documentElement.firstChild.nextSibling
+        fragment.documentElement.removeChild(elem)
+        return elem
+
+    def _element_end(self, offset):
+        """Return the offset just past the end tag of the element starting at offset."""
+        start_tag = _TAG_BYTES_PATTERN.match(self._mmap, offset)
+        if start_tag.group().endswith(b"/>"):
+            return start_tag.end()
+
+        # expat reports end tags at their start (empty elements: after the tag)
+        parser = _create_scanning_parser()
+        depth = 0
+        end = None
+
+        def start_element(name, attributes):
+            nonlocal depth
+            depth += 1
+
+        def end_element(name):
+            nonlocal depth, end
+            depth -= 1
+            if depth == 0:
+                end_offset = offset + parser.CurrentByteIndex
+                end = _TAG_BYTES_PATTERN.match(self._mmap, end_offset).end()
+                raise _ScanComplete
+
+        parser.StartElementHandler = start_element
+        parser.EndElementHandler = end_element
+        self._scan(parser, offset)
+        return end
+
+    def _scan(self, parser, offset=0):
+        """
+        Feed the file to parser from offset on.
+
+        Handlers may raise _ScanComplete to stop early. Offsets reported by the
+        parser are relative to offset.
+        """
+        try:
+            for position in range(offset, len(self._mmap), self.CHUNK_SIZE):
+                parser.Parse(self._mmap[position : position + self.CHUNK_SIZE], False)
+            parser.Parse(b"", True)
+        except _ScanComplete:
+            pass
+
+    def get_next_rid(self):
+        """Get the next available rId for relationships files."""
+        max_id = 0
+        for rel_elem in self._find_nodes("Relationship"):
+            rel_id = rel_elem.getAttribute("Id")
+            if rel_id.startswith("rId"):
+                try:
+                    max_id = max(max_id, int(rel_id[3:]))
+                except ValueError:
+                    pass
+        return f"rId{max_id + 1}"
+
+    def batch(self):
+        raise self._read_only_error()
+
+    def _edit(self, kind, elem, xml_content):
+        raise self._read_only_error()
+
+    def _find_root(self):
+        raise self._read_only_error()
+
+    def save(self):
+        """Nothing to save; the file is opened read-only."""
+
+    def _read_only_error(self):
+        return ValueError(f"{self.xml_path.name} is opened read-only")
+
+
+class _NodeIndex:
+    """
+    Lazily built lookup tables over the elements of a DOM.
+
+    Maps tag -> elements, (tag, attribute, value) -> elements and
+    (tag, word) -> elements so that XMLEditor.get_node() does not need to scan
+    the whole document; line lookups bisect the positions recorded by the
+    parser (see _PositionedDocument). Tables are built on first use and
+    extended via add() and text_changed() as nodes are inserted or modified.
+    Entries are never removed: candidates() re-checks tag and attachment to the
+    document, and XMLEditor re-checks the filters, so stale entries for removed
+    or modified elements are never returned.
+    """
+
+    _WORD = re.compile(r"\w+")
+
+    def __init__(self, dom):
+        self.dom = dom
+        self._by_tag = None  # tag -> {element: None} (insertion-ordered set)
+        self._by_attr = {}  # tag -> attribute -> value -> {element: None}
+        self._by_word = {}  # tag -> word -> {element: None}
+        self._sorted_words = {}  # tag -> (sorted words, sorted reversed words)
+        self._stale_text = {}  # elements whose words must be re-indexed
+
+    def candidates(self, tag, attrs=None, line_number=None):
+        """
+        Return attached elements with the given tag that may match the filters.
+
+        Uses the most selective table available: the first attribute in attrs,
+        then line_number, then the tag alone. Callers must still apply the
+        remaining filters.
+        """
+        if attrs:
+            attr_name, attr_value = next(iter(attrs.items()))
+            elements = self._attr_table(tag, attr_name).get(attr_value, ())
+        elif line_number is not None:
+            elements = self._at_lines(line_number)
+        else:
+            elements = self._tag_elements(tag)
+        return [elem for elem in elements if self._is_live(elem, tag)]
+
+    def add(self, nodes, deep=True):
+        """
+        Index nodes that were inserted into the DOM or had attributes changed.
+
+        Safe to call repeatedly for the same elements.
+
+        Args:
+            nodes: Nodes to index; non-element nodes are ignored
+            deep: If True, also index all descendant elements
+        """
+        if self._by_tag is None:
+            return  # Not built yet; the first lookup will see these nodes
+        for elem in _iter_elements(nodes, deep):
+            self._by_tag.setdefault(elem.tagName, {})[elem] = None
+            for tag in (elem.tagName, "*"):
+                for attr_name, table in self._by_attr.get(tag, {}).items():
+                    value = elem.getAttribute(attr_name)
+                    table.setdefault(value, {})[elem] = None
+
+    def text_changed(self, elements):
+        """
+        Mark elements whose text changed so that their words are re-indexed.
+
+        Args:
+            elements: Elements that were inserted or whose text content changed
+        """
+        if not self._by_word:
+            return
+        for elem in elements:
+            if elem.tagName in self._by_word:
+                self._stale_text[elem] = None
+
+    def text_candidates(self, tag, contains, text_of):
+        """
+        Return attached elements with the given tag whose text may contain a string.
+
+        Each word of contains is looked up in a per-tag word table built from the
+        element text on first use. Words at the edges of contains may be cut off,
+        so the first word only has to end a word of the element, the last word
+        only has to start one, and a lone word only has to occur within one.
+        Callers must still check that the text contains the string.
+
+        Args:
+            tag: The XML tag name, or "*"
+            contains: Normalized search string
+            text_of: Function returning the text of an element
+
+        Returns:
+            List of candidate elements, or None if contains has no words to look up
+        """
+        words = list(self._WORD.finditer(contains))
+        if not words or tag == "*":
+            return None
+        self._index_words(tag, text_of)
+
+        table = self._by_word[tag]
+        result = None
+        for match in words:
+            word = match.group()
+            open_start = match.start() == 0
+            open_end = match.end() == len(contains)
+            if open_start and open_end:
+                keys = [key for key in table if word in key]
+            elif open_start:
+                keys = [key[::-1] for key in self._words_with_prefix(tag, word[::-1], 1)]
+            elif open_end:
+                keys = self._words_with_prefix(tag, word, 0)
+            else:
+                keys = [word] if word in table else []
+
+            elements = {}
+            for key in keys:
+                elements.update(table[key])
+            if result is not None:
+                elements = {elem: None for elem in result if elem in elements}
+            result = elements
+            if not result:
+                return []
+        return [elem for elem in result if self._is_live(elem, tag)]
+
+    def _index_words(self, tag, text_of):
+        """Build the word table for tag and re-index elements whose text changed."""
+        if tag not in self._by_word:
+            self._by_word[tag] = {}
+            self._stale_text.update(dict.fromkeys(self._tag_elements(tag)))
+        for elem in self._stale_text:
+            table = self._by_word.get(elem.tagName)
+            if table is None:
+                continue
+            for word in set(self._WORD.findall(text_of(elem))):
+                if word not in table:
+                    table[word] = {}
+                    self._sorted_words.pop(elem.tagName, None)
+                table[word][elem] = None
+        self._stale_text = {}
+
+    def _words_with_prefix(self, tag, prefix, reverse):
+        """Return words in the tag's table (reversed if reverse) starting with prefix."""
+        if tag not in self._sorted_words:
+            words = sorted(self._by_word[tag])
+            self._sorted_words[tag] = (words, sorted(word[::-1] for word in words))
+        words = self._sorted_words[tag][reverse]
+        matches = []
+        for i in range(bisect_left(words, prefix), len(words)):
+            if not words[i].startswith(prefix):
+                break
+            matches.append(words[i])
+        return matches
+
+    def _build(self):
+        """Walk the DOM once to build the tag table."""
+        self._by_tag = {}
+        for elem in _iter_elements([self.dom.documentElement], deep=True):
+            self._by_tag.setdefault(elem.tagName, {})[elem] = None
+
+    def _tag_elements(self, tag):
+        if self._by_tag is None:
+            self._build()
+        if tag == "*":
+            return [elem for elems in self._by_tag.values() for elem in elems]
+        return self._by_tag.get(tag, ())
+
+    def _attr_table(self, tag, attr_name):
+        tables = self._by_attr.setdefault(tag, {})
+        if attr_name not in tables:
+            table = {}
+            for elem in self._tag_elements(tag):
+                table.setdefault(elem.getAttribute(attr_name), {})[elem] = None
+            tables[attr_name] = table
+        return tables[attr_name]
+
+    def _at_lines(self, line_number):
+        if not isinstance(self.dom, _PositionedDocument):
+            return ()
+        return self.dom.elements_at_lines(line_number)
+
+    def is_attached(self, node):
+        """Check that a node is part of the document."""
+        return self._is_live(node, "*")
+
+    def _is_live(self, elem, tag):
+        """Check that elem still has the tag and is attached to the document."""
+        if tag != "*" and elem.tagName != tag:
+            return False
+        node = elem.parentNode
+        while node is not None:
+            if node is self.dom:
+                return True
+            node = node.parentNode
+        return False
+
+
+# Kinds of DOM changes recorded by _PositionedDocument.track_changes()
+_DOM_INSERTED = 1  # node was inserted into a parent
+_DOM_ATTRIBUTES = 2  # element's attributes changed
+_DOM_CONTENT = 4  # children or text of the node were removed or changed
+
+
+def _record_change(node, kind):
+    """Record a change to node if its document is tracking changes."""
+    document = node.ownerDocument
+    if document is not None and document._changes is not None:
+        document._changes[node] = document._changes.get(node, 0) | kind
+
+
+class _PositionedElement(xml.dom.minidom.Element):
+    """
+    minidom Element whose parse position is kept by its owner document.
+
+    The only per-element state is an ordinal into the _PositionedDocument's
+    position arrays, stored in a slot. Setting parse_position as an attribute
+    would give every element a __dict__ and a tuple, which dominate memory on
+    large parts. Elements that were not parsed (created, cloned or imported
+    later) have no parse_position.
+    """
+
+    __slots__ = ("_ordinal",)
+
+    @property
+    def parse_position(self):
+        """(line, column) of the element's start tag in the parsed file."""
+        try:
+            ordinal = self._ordinal
+        except AttributeError:
+            raise AttributeError("element has no parse_position") from None
+        return self.ownerDocument.position(ordinal)
+
+    # Tree and attribute changes are reported to the owner document; a
+    # DocumentFragment is reported child by child as minidom moves them
+
+    def appendChild(self, node):
+        if node.nodeType != node.DOCUMENT_FRAGMENT_NODE:
+            _record_change(node, _DOM_INSERTED)
+        return super().appendChild(node)
+
+    def insertBefore(self, newChild, refChild):
+        if newChild.nodeType != newChild.DOCUMENT_FRAGMENT_NODE:
+            _record_change(newChild, _DOM_INSERTED)
+        return super().insertBefore(newChild, refChild)
+
+    def replaceChild(self, newChild, oldChild):
+        if newChild.nodeType != newChild.DOCUMENT_FRAGMENT_NODE:
+            _record_change(newChild, _DOM_INSERTED)
+        _record_change(self, _DOM_CONTENT)
+        return super().replaceChild(newChild, oldChild)
+
+    def removeChild(self, oldChild):
+        _record_change(self, _DOM_CONTENT)
+        return super().removeChild(oldChild)
+
+    def setAttribute(self, attname, value):
+        _record_change(self, _DOM_ATTRIBUTES)
+        super().setAttribute(attname, value)
+
+    def setAttributeNS(self, namespaceURI, qualifiedName, value):
+        _record_change(self, _DOM_ATTRIBUTES)
+        super().setAttributeNS(namespaceURI, qualifiedName, value)
+
+    def setAttributeNode(self, attr):
+        _record_change(self, _DOM_ATTRIBUTES)
+        return super().setAttributeNode(attr)
+
+    setAttributeNodeNS = setAttributeNode
+
+    def removeAttribute(self, name):
+        _record_change(self, _DOM_ATTRIBUTES)
+        super().removeAttribute(name)
+
+    def removeAttributeNS(self, namespaceURI, localName):
+        _record_change(self, _DOM_ATTRIBUTES)
+        super().removeAttributeNS(namespaceURI, localName)
+
+    def removeAttributeNode(self, node):
+        _record_change(self, _DOM_ATTRIBUTES)
+        return super().removeAttributeNode(node)
+
+    removeAttributeNodeNS = removeAttributeNode
+
+
+class _PositionedText(xml.dom.minidom.Text):
+    """minidom Text node that reports changes of its data to the owner document."""
+
+    __slots__ = ()
+
+    def _set_data(self, data):
+        self._data = data
+        if self.parentNode is not None:
+            _record_change(self.parentNode, _DOM_CONTENT)
+
+    data = nodeValue = property(xml.dom.minidom.Text._get_data, _set_data)
+
+
+class _PositionedDocument(xml.dom.minidom.Document):
+    """
+    minidom Document that records where each parsed element started.
+
+    Creates _PositionedElements. _create_line_tracking_parser() calls
+    add_position() for every element in document order, so the line array is
+    sorted and elements_at_lines() can bisect it.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._changes = None  # node -> _DOM_* flags, while tracking changes
+        self._positioned = []  # ordinal -> element
+        self._lines = array("I")  # ordinal -> line
+        self._columns = array("I")  # ordinal -> column
+
+    def createElement(self, tagName):
+        e = _PositionedElement(tagName)
+        e.ownerDocument = self
+        return e
+
+    def createElementNS(self, namespaceURI, qualifiedName):
+        # The SAX reader passes a new copy of the names for every element
+        qualifiedName = sys.intern(qualifiedName)
+        if namespaceURI is not None:
+            namespaceURI = sys.intern(namespaceURI)
+        prefix = qualifiedName.split(":", 1)[0] if ":" in qualifiedName else None
+        e = _PositionedElement(qualifiedName, namespaceURI, prefix)
+        e.ownerDocument = self
+        return e
+
+    def createTextNode(self, data):
+        if not isinstance(data, str):
+            raise TypeError("node contents must be a string")
+        t = _PositionedText()
+        t.data = data
+        t.ownerDocument = self
+        return t
+
+    def track_changes(self):
+        """
+        Start recording changes made through the DOM API, or restart recording.
+
+        Returns:
+            dict: Node -> _DOM_* flags of the changes recorded since the last
+            call (empty on the first call)
+        """
+        changes = self._changes or {}
+        self._changes = {}
+        return changes
+
+    def add_position(self, elem, line, column):
+        """Record the start position of the next parsed element."""
+        elem._ordinal = len(self._positioned)
+        self._positioned.append(elem)
+        self._lines.append(line)
+        self._columns.append(column)
+
+    def position(self, ordinal):
+        return self._lines[ordinal], self._columns[ordinal]
+
+    def shift_positions(self, line, line_offset, column_offset):
+        """
+        Move recorded positions as if the parsed text had been embedded elsewhere.
+
+        Adds column_offset to the columns of elements on the given line, then
+        line_offset to all lines. Positions must stay non-negative.
+        """
+        for ordinal, elem_line in enumerate(self._lines):
+            if elem_line == line:
+                self._columns[ordinal] += column_offset
+            self._lines[ordinal] = elem_line + line_offset
+
+    def elements_at_lines(self, line_number):
+        """
+        Return the parsed elements whose start tag is on a line (int) or in a
+        range of lines, in document order, whether or not still attached.
+        """
+        if isinstance(line_number, range):
+            start, stop = line_number.start, line_number.stop
+        else:
+            start, stop = line_number, line_number + 1
+        first = bisect_left(self._lines, start)
+        last = bisect_left(self._lines, stop, first)
+        return [
+            self._positioned[ordinal]
+            for ordinal in range(first, last)
+            if not isinstance(line_number, range) or self._lines[ordinal] in line_number
+        ]
+
+
+class _PositionedDOMImplementation(xml.dom.minidom.DOMImplementation):
+    def _create_document(self):
+        return _PositionedDocument()
+
+
+_PositionedDocument.implementation = _PositionedDOMImplementation()
+
+
+def _iter_elements(nodes, deep=True):
+    """Yield the element nodes in nodes and, if deep, all their descendants."""
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if node.nodeType != node.ELEMENT_NODE:
+            continue
+        yield node
+        if deep:
+            stack.extend(reversed(node.childNodes))
+
+
+@contextmanager
+def _replacing_file(path):
+    """
+    Open a binary file that replaces path once the block completes.
+
+    The content is written to a temporary file in the same directory and moved
+    over path with os.replace, so readers never see a partial file and other
+    hard links to the old file (e.g. Document's working tree) keep their content.
+    The old file's permission bits are kept.
+    """
+    path = Path(path)
+    fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+        if path.exists():
+            shutil.copymode(path, temp_name)
+        os.replace(temp_name, path)
+    except BaseException:
+        try:
+            os.unlink(temp_name)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# Placeholder for text content in fragment template keys
+_TEXT_SLOT = "\x00"
+
+# A start, end or empty-element tag; quoted attribute values may contain ">"
+_TAG_PATTERN = re.compile(r"""<(?:[^<>"']|"[^"]*"|'[^']*')*>""")
+_TAG_BYTES_PATTERN = re.compile(_TAG_PATTERN.pattern.encode("ascii"))
+
+# Text that only the XML parser can interpret correctly: entities other than the
+# predefined ones and character references, characters not allowed in XML, "]]>"
+_PARSER_ONLY_TEXT = re.compile(
+    r"&(?!(?:amp|lt|gt|quot|apos|#[0-9]+|#x[0-9a-fA-F]+);)|[<\x00-\x08\x0b\x0c\x0e-\x1f]|]]>"
+)
+
+
+def _split_fragment_text(content):
+    """
+    Split an XML fragment into a markup template key and its text content.
+
+    The key is the fragment with every text segment between tags replaced by
+    _TEXT_SLOT, so fragments that differ only in text share a key. Texts are
+    returned as the parser would produce them (line endings normalized,
+    references resolved).
+
+    Returns:
+        (key, texts), or (None, None) if the fragment contains comments, CDATA,
+        processing instructions or text that must go through the XML parser
+    """
+    if "<!" in content or "<?" in content:
+        return None, None
+    key_parts = []
+    texts = []
+    position = 0
+    for match in _TAG_PATTERN.finditer(content):
+        text = content[position : match.start()]
+        if text:
+            if _PARSER_ONLY_TEXT.search(text):
+                return None, None
+            key_parts.append(_TEXT_SLOT)
+            texts.append(text)
+        key_parts.append(match.group())
+        position = match.end()
+    text = content[position:]
+    if text:
+        if _PARSER_ONLY_TEXT.search(text):
+            return None, None
+        key_parts.append(_TEXT_SLOT)
+        texts.append(text)
+    texts = [
+        html.unescape(text.replace("\r\n", "\n").replace("\r", "\n"))
+        if "&" in text or "\r" in text
+        else text
+        for text in texts
+    ]
+    return "".join(key_parts), texts
+
+
+def _iter_text_nodes(nodes):
+    """Yield the text nodes in and below nodes, in document order."""
+    stack = list(reversed(nodes))
+    while stack:
+        node = stack.pop()
+        if node.nodeType == node.TEXT_NODE:
+            yield node
+        elif node.nodeType == node.ELEMENT_NODE:
+            stack.extend(reversed(node.childNodes))
+
+
+def _create_lxml_parser():
+    """
+    Create an lxml parser that is safe for untrusted documents.
+
+    Entities are not resolved and network access is disabled, matching the
+    protections defusedxml applies to the minidom parser. huge_tree lifts
+    libxml2's limits on very large text nodes and deep trees.
+
+    Returns:
+        lxml.etree.XMLParser: Configured parser
+    """
+    return lxml.etree.XMLParser(
+        resolve_entities=False, no_network=True, huge_tree=True
+    )
+
 
 def _create_line_tracking_parser():
     """
     Create a SAX parser that tracks line and column numbers for each element.
 
-    Monkey patches the SAX content handler to store the current line and column
-    position from the underlying expat parser onto each element as a parse_position
-    attribute (line, column) tuple.
+    Monkey patches the SAX content handler to build a _PositionedDocument and
+    record the current line and column from the underlying expat parser for each
+    element, available as its parse_position (line, column) tuple.
 
     Returns:
         defusedxml.sax.xmlreader.XMLReader: Configured SAX parser
@@ -359,11 +1978,13 @@ def _create_line_tracking_parser():
         def startElementNS(name, tagName, attrs):
             orig_start_cb(name, tagName, attrs)
             cur_elem = dom_handler.elementStack[-1]
-            cur_elem.parse_position = (
+            cur_elem.ownerDocument.add_position(
+                cur_elem,
                 parser._parser.CurrentLineNumber,  # type: ignore
                 parser._parser.CurrentColumnNumber,  # type: ignore
             )
 
+        dom_handler.documentFactory = _PositionedDocument.implementation
         orig_start_cb = dom_handler.startElementNS
         dom_handler.startElementNS = startElementNS
         orig_set_content_handler(dom_handler)
@@ -372,3 +1993,89 @@ def _create_line_tracking_parser():
     orig_set_content_handler = parser.setContentHandler
     parser.setContentHandler = set_content_handler  # type: ignore
     return parser
+
+
+class _ScanComplete(Exception):
+    """Raised by expat handlers to end a ReadOnlyXMLEditor scan early."""
+
+
+class _NamespaceScopes:
+    """
+    Namespace declarations in scope during a streaming scan.
+
+    start() and end() follow the element nesting. Each distinct set of
+    declarations in scope gets an id into markup, so an index can store one
+    small integer per element; documents have only a handful of such sets.
+    """
+
+    def __init__(self):
+        self.markup = [""]  # scope id -> xmlns declarations in scope as markup
+        self._ids = {(): 0}  # sorted (name, value) declarations -> scope id
+        self._stack = [({}, 0)]  # (declarations in scope, scope id), innermost last
+
+    def start(self, attributes):
+        """Enter an element with the given attributes and return its scope id."""
+        scope = self._stack[-1]
+        for name in attributes:
+            if name.startswith("xmlns"):
+                break
+        else:
+            # Most elements declare nothing
+            self._stack.append(scope)
+            return scope[1]
+
+        declarations, scope_id = scope
+        new = {
+            name: value
+            for name, value in attributes.items()
+            if name == "xmlns" or name.startswith("xmlns:")
+        }
+        if new:
+            declarations = {**declarations, **new}
+            key = tuple(sorted(declarations.items()))
+            scope_id = self._ids.get(key)
+            if scope_id is None:
+                scope_id = self._ids[key] = len(self.markup)
+                self.markup.append(
+                    " ".join(f'{name}="{html.escape(value)}"' for name, value in key)
+                )
+        self._stack.append((declarations, scope_id))
+        return scope_id
+
+    def end(self):
+        """Leave the innermost element."""
+        self._stack.pop()
+
+
+def _create_scanning_parser():
+    """
+    Create a raw expat parser for streaming scans of untrusted documents.
+
+    Entity declarations and external entity references raise the same errors as
+    the defusedxml parsers. Text is not buffered, so character data arrives in
+    the same pieces as the text nodes of _create_line_tracking_parser().
+
+    Returns:
+        xml.parsers.expat.XMLParserType: Parser without handlers for elements
+    """
+
+    def forbid_entity_declaration(
+        name, is_parameter, value, base, system_id, public_id, notation
+    ):
+        raise defusedxml.EntitiesForbidden(
+            name, value, base, system_id, public_id, notation
+        )
+
+    def forbid_unparsed_entity(name, base, system_id, public_id, notation):
+        raise defusedxml.EntitiesForbidden(
+            name, None, base, system_id, public_id, notation
+        )
+
+    def forbid_external_reference(context, base, system_id, public_id):
+        raise defusedxml.ExternalReferenceForbidden(context, base, system_id, public_id)
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.EntityDeclHandler = forbid_entity_declaration
+    parser.UnparsedEntityDeclHandler = forbid_unparsed_entity
+    parser.ExternalEntityRefHandler = forbid_external_reference
+    return parser
@@ -0,0 +1,210 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from scripts.utilities import LxmlXMLEditor, ReadOnlyXMLEditor, XMLEditor
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+# A paragraph with an inline image as Word writes it: the a: and pic: prefixes
+# are declared on inner elements, not on the document root
+INLINE_IMAGE_DOCUMENT = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{W_NAMESPACE}" \
+xmlns:wp="http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing" \
+xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">
+<w:body>
+<w:p><w:r><w:t>Before the image</w:t></w:r></w:p>
+<w:p>
+<w:r>
+<w:drawing>
+<wp:inline distT="0" distB="0" distL="0" distR="0">
+<wp:extent cx="914400" cy="914400"/>
+<wp:docPr id="1" name="Picture 1"/>
+<a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">
+<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">
+<pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">
+<pic:nvPicPr>
+<pic:cNvPr id="0" name="image1.png"/>
+<pic:cNvPicPr/>
+</pic:nvPicPr>
+<pic:blipFill><a:blip r:embed="rId4"/></pic:blipFill>
+</pic:pic>
+</a:graphicData>
+</a:graphic>
+</wp:inline>
+</w:drawing>
+</w:r>
+</w:p>
+</w:body>
+</w:document>
+"""
+
+
+def make_document_xml(paragraphs):
+    """Return a document.xml with one paragraph per text and one tracked insertion."""
+    body = "".join(
+        f'<w:p><w:r><w:t xml:space="preserve">{text}</w:t></w:r></w:p>\n'
+        for text in paragraphs
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NAMESPACE}">\n'
+        "<w:body>\n"
+        f"{body}"
+        '<w:p><w:ins w:id="0" w:author="A">'
+        "<w:r><w:t>inserted</w:t></w:r></w:ins></w:p>\n"
+        "</w:body>\n"
+        "</w:document>\n"
+    )
+
+
+class TestXMLEditorDirectDOMChanges(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "document.xml"
+        self.path.write_text(
+            make_document_xml(f"clause{i}. text" for i in range(300)), encoding="utf-8"
+        )
+        self.editor = XMLEditor(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_cloned_paragraph_is_found(self):
+        """A paragraph cloned and appended through the DOM makes get_node ambiguous"""
+        p = self.editor.get_node(tag="w:p", contains="clause5.")
+        p.parentNode.appendChild(p.cloneNode(True))
+
+        with self.assertRaisesRegex(ValueError, "Multiple nodes found"):
+            self.editor.get_node(tag="w:p", contains="clause5.")
+        self.assertEqual(len(self.editor.get_nodes(tag="w:p")), 302)
+
+    def test_cloned_insertion_is_found_by_attribute(self):
+        """A cloned w:ins is found by its attributes next to the original"""
+        ins = self.editor.get_node(tag="w:ins", attrs={"w:id": "0"})
+        ins.parentNode.insertBefore(ins.cloneNode(True), ins)
+
+        matches = self.editor.get_nodes(tag="w:ins", attrs={"w:id": "0"})
+        self.assertEqual(len(matches), 2)
+
+    def test_attribute_and_text_changes_are_found(self):
+        """setAttribute and Text.data changes made through the DOM are indexed"""
+        runs = self.editor.get_nodes(tag="w:r", contains="clause7.")
+        runs[0].setAttribute("w:rsidR", "00AB12CD")
+        runs[0].getElementsByTagName("w:t")[0].firstChild.data = "renamed clause"
+
+        self.assertEqual(
+            self.editor.get_nodes(tag="w:r", attrs={"w:rsidR": "00AB12CD"}), runs
+        )
+        self.assertEqual(len(self.editor.get_nodes(tag="w:p", contains="renamed")), 1)
+        self.assertEqual(self.editor.get_nodes(tag="w:p", contains="clause7."), [])
+
+    def test_dom_changes_are_found(self):
+        """Nodes added through the dom property are found"""
+        dom = self.editor.dom
+        body = dom.getElementsByTagName("w:body")[0]
+        body.appendChild(dom.getElementsByTagName("w:p")[0].cloneNode(True))
+
+        self.assertEqual(len(self.editor.get_nodes(tag="w:p")), 302)
+
+    def test_refresh_index_after_unreported_change(self):
+        """refresh_index() picks up changes minidom does not report"""
+        first = self.editor.get_node(tag="w:r", contains="clause8.")
+        second = self.editor.get_node(tag="w:r", contains="clause9.")
+        first.setAttribute("w:rsidR", "00FF00FF")
+        second.setAttribute("w:rsidR", "00000000")
+        self.editor.get_nodes(tag="w:r", attrs={"w:rsidR": "00FF00FF"})
+        second.getAttributeNode("w:rsidR").value = "00FF00FF"
+        self.editor.refresh_index()
+
+        self.assertEqual(
+            self.editor.get_nodes(tag="w:r", attrs={"w:rsidR": "00FF00FF"}),
+            [first, second],
+        )
+    def test_misses_are_answered_from_index(self):
+        """Lookups that find nothing do not scan the live tree"""
+        self.editor.get_nodes(tag="w:p", contains="clause1.")
+        with mock.patch.object(
+            self.editor, "_read_text", side_effect=AssertionError("tree scanned")
+        ):
+            self.assertEqual(
+                self.editor.get_nodes(tag="w:p", contains="clause999."), []
+            )
+            self.assertEqual(
+                self.editor.get_nodes(tag="w:ins", attrs={"w:id": "999"}), []
+            )
+
+
+
+class TestLxmlXMLEditor(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "document.xml"
+        self.path.write_text(
+            make_document_xml(f"clause{i}. text" for i in range(3)), encoding="utf-8"
+        )
+        self.editor = LxmlXMLEditor(self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_dom_points_to_tree(self):
+        """dom raises a TypeError naming tree instead of an AttributeError"""
+        with self.assertRaisesRegex(TypeError, "use tree"):
+            self.editor.dom
+        self.assertEqual(len(self.editor.get_nodes(tag="w:p")), 4)
+
+    def test_refresh_index(self):
+        """refresh_index() marks the file as modified"""
+        self.editor.refresh_index()
+        self.assertTrue(self.editor.modified)
+
+
+
+class TestReadOnlyXMLEditorNamespaces(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = Path(self.temp_dir) / "document.xml"
+        self.path.write_text(INLINE_IMAGE_DOCUMENT, encoding="utf-8")
+        self.editor = XMLEditor(self.path)
+        self.reader = ReadOnlyXMLEditor(self.path)
+
+    def tearDown(self):
+        self.reader.close()
+        shutil.rmtree(self.temp_dir)
+
+    def assertSameNode(self, expected, actual):
+        self.assertEqual(actual.toxml(), expected.toxml())
+        self.assertEqual(actual.parse_position, expected.parse_position)
+
+    def test_prefixes_declared_on_ancestors(self):
+        """Elements using prefixes declared below the root are parsed"""
+        for tag, attrs in [
+            ("a:graphicData", None),
+            ("pic:cNvPr", {"name": "image1.png"}),
+            ("a:blip", None),
+        ]:
+            with self.subTest(tag=tag):
+                self.assertSameNode(
+                    self.editor.get_node(tag=tag, attrs=attrs),
+                    self.reader.get_node(tag=tag, attrs=attrs),
+                )
+
+    def test_prefixes_declared_on_ancestors_by_line(self):
+        """line_number lookups parse elements using inner prefixes"""
+        for tag in ("pic:cNvPr", "w:drawing"):
+            with self.subTest(tag=tag):
+                expected = self.editor.get_node(tag=tag)
+                line = expected.parse_position[0]
+                self.assertSameNode(
+                    expected, self.reader.get_node(tag=tag, line_number=line)
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
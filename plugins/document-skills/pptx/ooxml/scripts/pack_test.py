@@ -0,0 +1,145 @@
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+from unittest import mock
+
+import defusedxml.minidom
+
+from pack import _write_compressed, condensed_xml, pack_document
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+        '  <Default Extension="xml" ContentType="application/xml"/>\n'
+        "</Types>\n"
+    ),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NAMESPACE}">\n'
+        "  <w:body>\n"
+        + "".join(
+            f"    <w:p>\n      <w:r>\n        <w:t>Clause {i}</w:t>\n"
+            "      </w:r>\n    </w:p>\n"
+            for i in range(50)
+        )
+        + "  </w:body>\n"
+        "</w:document>\n"
+    ),
+    "word/media/image1.png": b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 4,
+}
+
+
+class TestPackCache(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.input_dir = self.temp_dir / "unpacked"
+        for name, content in PARTS.items():
+            path = self.input_dir / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(content, str):
+                path.write_text(content, encoding="utf-8")
+            else:
+                path.write_bytes(content)
+        self.cache_dir = self.temp_dir / "cache"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def assertSameMembers(self, expected_file, actual_file):
+        with zipfile.ZipFile(expected_file) as expected, zipfile.ZipFile(
+            actual_file
+        ) as actual:
+            self.assertIsNone(actual.testzip())
+            self.assertEqual(actual.namelist(), expected.namelist())
+            for name in expected.namelist():
+                with self.subTest(name=name):
+                    self.assertEqual(actual.read(name), expected.read(name))
+
+    def pack(self, name, **kwargs):
+        output = self.temp_dir / name
+        pack_document(self.input_dir, output, **kwargs)
+        return output
+
+    def test_cached_pack_matches_uncached(self):
+        """Packs writing cached parts have the members of an uncached pack"""
+        uncached = self.pack("uncached.docx")
+        first = self.pack("first.docx", cache_dir=self.cache_dir)
+        second = self.pack("second.docx", cache_dir=self.cache_dir)
+
+        self.assertSameMembers(uncached, first)
+        self.assertSameMembers(uncached, second)
+
+    def test_cached_pack_without_zipfile_internals(self):
+        """Cached parts are written with writestr() if ZipFile internals change"""
+        uncached = self.pack("uncached.docx")
+        self.pack("first.docx", cache_dir=self.cache_dir)
+        with mock.patch("pack._ZIPFILE_INTERNALS", ("_no_such_attribute",)):
+            fallback = self.pack("fallback.docx", cache_dir=self.cache_dir)
+
+        self.assertSameMembers(uncached, fallback)
+
+    def test_write_compressed_with_open_member(self):
+        """Writing deflated data while a member is open fails like writestr()"""
+        with zipfile.ZipFile(self.temp_dir / "open.docx", "w") as zf:
+            with zf.open("word/document.xml", "w"):
+                with self.assertRaises(ValueError):
+                    _write_compressed(
+                        zf,
+                        zipfile.ZipInfo("word/media/image1.png"),
+                        0,
+                        0,
+                        b"",
+                    )
+
+
+class TestCondensedXml(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def condense(self, content):
+        path = self.temp_dir / "part.xml"
+        path.write_text(content, encoding="utf-8")
+        return condensed_xml(path)
+
+    def test_attribute_whitespace_survives_parsing(self):
+        """Newlines, returns and tabs in attribute values read back unchanged"""
+        condensed = self.condense(
+            f'<w:document xmlns:w="{W_NAMESPACE}">\n'
+            '  <w:p w:val="a&#10;b&#13;c&#9;d">\n    <w:t> x </w:t>\n  </w:p>\n'
+            "</w:document>\n"
+        )
+
+        dom = defusedxml.minidom.parseString(condensed)
+        p = dom.getElementsByTagName("w:p")[0]
+        self.assertEqual(p.getAttribute("w:val"), "a\nb\rc\td")
+
+    def test_doctype_fallback_matches_streaming(self):
+        """Files with a DOCTYPE are written with the same escaping"""
+        body = (
+            f'<w:document xmlns:w="{W_NAMESPACE}" w:val="&quot;a&#10;b&amp;">\n'
+            "  <!-- comment -->\n"
+            '  <w:p>\n    <w:t> "x" &lt; y </w:t>\n  </w:p>\n'
+            "</w:document>\n"
+        )
+        streamed = self.condense(f'<?xml version="1.0"?>\n{body}')
+        with_doctype = self.condense(
+            f'<?xml version="1.0"?>\n<!DOCTYPE document>\n{body}'
+        )
+
+        self.assertEqual(
+            with_doctype, streamed.replace(b"?>", b"?><!DOCTYPE document>", 1)
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,29 +1,154 @@
 #!/usr/bin/env python3
-"""Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)"""
+"""
+Unpack and format XML contents of Office files (.docx, .pptx, .xlsx)
 
+Example usage:
+    python unpack.py <office_file> <output_dir> [--jobs N] [--only GLOB]
+        [--max-pretty-size BYTES]
+"""
+
+import argparse
 import random
 import sys
 import defusedxml.minidom
 import zipfile
-from pathlib import Path
-
-# Get command line arguments
-assert len(sys.argv) == 3, "Usage: python unpack.py <office_file> <output_dir>"
-input_file, output_dir = sys.argv[1], sys.argv[2]
-
-# Extract and format
-output_path = Path(output_dir)
-output_path.mkdir(parents=True, exist_ok=True)
-zipfile.ZipFile(input_file).extractall(output_path)
-
-# Pretty print all XML files
-xml_files = list(output_path.rglob("*.xml")) + list(output_path.rglob("*.rels"))
-for xml_file in xml_files:
-    content = xml_file.read_text(encoding="utf-8")
-    dom = defusedxml.minidom.parseString(content)
-    xml_file.write_bytes(dom.toprettyxml(indent="  ", encoding="ascii"))
-
-# For .docx files, suggest an RSID for tracked changes
-if input_file.endswith(".docx"):
-    suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
-    print(f"Suggested RSID for edit session: {suggested_rsid}")
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Unpack an Office file")
+    parser.add_argument("office_file", help="Office file (.docx/.pptx/.xlsx)")
+    parser.add_argument("output_dir", help="Directory to unpack into")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for extracting and formatting parts (default: 1)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="GLOB",
+        help="Unpack only parts matching this name or glob, e.g. 'ppt/slides/*.xml'"
+        " (repeatable; * does not match /); a partial directory cannot be packed"
+        " back",
+    )
+    parser.add_argument(
+        "--max-pretty-size",
+        type=int,
+        metavar="BYTES",
+        help="Extract larger XML parts without pretty-printing them",
+    )
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    try:
+        names = unpack_document(
+            args.office_file,
+            args.output_dir,
+            jobs=args.jobs,
+            only=args.only,
+            max_pretty_size=args.max_pretty_size,
+        )
+    except ValueError as e:
+        sys.exit(f"Error: {e}")
+
+    # For .docx files, suggest an RSID for tracked changes
+    if args.office_file.endswith(".docx") and "word/document.xml" in names:
+        suggested_rsid = "".join(random.choices("0123456789ABCDEF", k=8))
+        print(f"Suggested RSID for edit session: {suggested_rsid}")
+
+
+def unpack_document(input_file, output_dir, jobs=1, only=None, max_pretty_size=None):
+    """Extract an Office file and pretty-print its XML and .rels parts.
+
+    Args:
+        input_file: Path to the .docx/.pptx/.xlsx file
+        output_dir: Directory to extract into (created if missing)
+        jobs: Number of worker processes extracting parts (default: 1)
+        only: Part names or glob patterns (e.g. "ppt/slides/*.xml"); if given,
+            only matching parts are extracted. Wildcards match within one path
+            segment, so "ppt/*.xml" does not match "ppt/slides/slide1.xml"
+        max_pretty_size: Size in bytes above which XML parts are extracted
+            without pretty-printing (default: no limit)
+
+    Returns:
+        list: Names of the extracted parts
+
+    Raises:
+        ValueError: If a pattern in only matches no part, or a part name points
+            outside the output directory
+    """
+    output_path = Path(output_dir)
+    with zipfile.ZipFile(input_file) as zf:
+        names = [name for name in zf.namelist() if not name.endswith("/")]
+    if only is not None:
+        selected = set()
+        unused = []
+        for pattern in only:
+            matches = {n for n in names if n == pattern or _part_matches(n, pattern)}
+            if not matches:
+                unused.append(pattern)
+            selected |= matches
+        if unused:
+            raise ValueError(f"No parts match: {', '.join(sorted(unused))}")
+        names = [name for name in names if name in selected]
+    for name in names:
+        part = PurePosixPath(name)
+        if part.is_absolute() or ".." in part.parts:
+            raise ValueError(f"{input_file} has a part outside the archive: {name}")
+
+    output_path.mkdir(parents=True, exist_ok=True)
+    workers = max(1, min(jobs, len(names)))
+    if workers == 1:
+        _unpack_parts(input_file, names, output_path, max_pretty_size)
+    else:
+        # Each worker opens the archive once and takes every workers-th part
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = [
+                executor.submit(
+                    _unpack_parts,
+                    input_file,
+                    names[i::workers],
+                    output_path,
+                    max_pretty_size,
+                )
+                for i in range(workers)
+            ]
+            for batch in batches:
+                batch.result()
+    return names
+
+
+def _part_matches(name, pattern):
+    """Return whether a part name matches a glob segment by segment."""
+    part = PurePosixPath(name)
+    return len(part.parts) == len(PurePosixPath(pattern).parts) and part.match(
+        pattern
+    )
+
+
+def _unpack_parts(input_file, names, output_path, max_pretty_size):
+    """Extract the named parts, pretty-printing XML parts within the size limit."""
+    with zipfile.ZipFile(input_file) as zf:
+        for name in names:
+            data = zf.read(name)
+            if name.endswith((".xml", ".rels")) and (
+                max_pretty_size is None or len(data) <= max_pretty_size
+            ):
+                data = pretty_xml(data)
+            target = output_path / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(data)
+
+
+def pretty_xml(data):
+    """Return a UTF-8 XML part indented for editing, with non-ASCII as references."""
+    dom = defusedxml.minidom.parseString(data.decode("utf-8"))
+    return dom.toprettyxml(indent="  ", encoding="ascii")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+import contextlib
+import io
+import shutil
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+from validation import DOCXSchemaValidator, ValidationManifest
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIPS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_RELATIONSHIPS = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+DOCUMENT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    f'<Relationships xmlns="{PACKAGE_RELATIONSHIPS}">\n'
+    "{relationships}"
+    "</Relationships>\n"
+)
+
+PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">\n'
+        '  <Default Extension="rels" '
+        'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>\n'
+        '  <Default Extension="xml" ContentType="application/xml"/>\n'
+        '  <Override PartName="/word/document.xml" ContentType="application/'
+        'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>\n'
+        "</Types>\n"
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<Relationships xmlns="{PACKAGE_RELATIONSHIPS}">\n'
+        f'  <Relationship Id="rId1" Type="{RELATIONSHIPS}/officeDocument" '
+        'Target="word/document.xml"/>\n'
+        "</Relationships>\n"
+    ),
+    "word/_rels/document.xml.rels": DOCUMENT_RELS.format(relationships=""),
+    "word/document.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        f'<w:document xmlns:w="{W_NAMESPACE}" xmlns:r="{RELATIONSHIPS}">\n'
+        "  <w:body>\n"
+        "    <w:p>\n      <w:r>\n        <w:t>Clause</w:t>\n      </w:r>\n    </w:p>\n"
+        "  </w:body>\n"
+        "</w:document>\n"
+    ),
+}
+
+
+class TestValidationManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.temp_dir = Path(tempfile.mkdtemp())
+        self.unpacked = self.temp_dir / "unpacked"
+        for name, content in PARTS.items():
+            path = self.unpacked / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content, encoding="utf-8")
+        self.original = self.temp_dir / "original.docx"
+        with zipfile.ZipFile(self.original, "w") as zf:
+            for name, content in PARTS.items():
+                zf.writestr(name, content)
+        self.manifest_path = self.temp_dir / "manifest.json"
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def validate(self, manifest=None):
+        """Return validate()'s result and output."""
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            valid = DOCXSchemaValidator(
+                self.unpacked, self.original, manifest=manifest
+            ).validate()
+        return valid, output.getvalue()
+
+    def validate_with_manifest(self):
+        """Validate with the saved manifest, check it against a run without, save it."""
+        manifest = ValidationManifest.load(self.manifest_path)
+        result = self.validate(manifest)
+        self.assertEqual(result, self.validate())
+        manifest.save(self.manifest_path)
+        self.assertEqual(
+            ValidationManifest.load(self.manifest_path).results, manifest.results
+        )
+        return result
+
+    def replace(self, name, old, new):
+        path = self.unpacked / name
+        content = path.read_text(encoding="utf-8")
+        self.assertIn(old, content)
+        path.write_text(content.replace(old, new), encoding="utf-8")
+
+    def test_changed_parts_are_validated_again(self):
+        """Each run with a reused manifest reports the current errors"""
+        valid, output = self.validate_with_manifest()
+        self.assertTrue(valid, output)
+        self.assertNotEqual(ValidationManifest.load(self.manifest_path).results, {})
+
+        self.replace("word/document.xml", "<w:r>", "<w:bogus/><w:r>")
+        valid, output = self.validate_with_manifest()
+        self.assertFalse(valid)
+        self.assertIn("bogus", output)
+
+        self.replace(
+            "word/_rels/document.xml.rels",
+            "</Relationships>",
+            f'  <Relationship Id="rId1" Type="{RELATIONSHIPS}/image" '
+            'Target="media/missing.png"/>\n</Relationships>',
+        )
+        valid, output = self.validate_with_manifest()
+        self.assertFalse(valid)
+        self.assertIn("bogus", output)
+        self.assertIn("Broken reference to media/missing.png", output)
+
+    def test_load_missing_or_outdated_manifest(self):
+        """A missing or outdated manifest file loads as an empty manifest"""
+        self.assertEqual(ValidationManifest.load(self.manifest_path).results, {})
+        self.manifest_path.write_text('{"version": 0, "results": {"x": {}}}')
+        self.assertEqual(ValidationManifest.load(self.manifest_path).results, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
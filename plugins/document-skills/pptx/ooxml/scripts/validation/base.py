@@ -2,12 +2,133 @@
 Base validator with common validation logic for document files.
 """
 
+import copy
+import hashlib
+import io
+import json
+import os
 import re
+import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import lxml.etree
 
 
+def read_original_parts(original):
+    """Load the XML and .rels parts of an original document.
+
+    Args:
+        original: Path to the original .docx/.pptx/.xlsx file, or a mapping of
+            part name (e.g. "word/document.xml") to bytes, which is used as is
+
+    Returns:
+        Mapping: Part name -> bytes
+    """
+    if isinstance(original, Mapping):
+        return original
+    with zipfile.ZipFile(original, "r") as zip_ref:
+        return {
+            name: zip_ref.read(name)
+            for name in zip_ref.namelist()
+            if name.endswith((".xml", ".rels"))
+        }
+
+
+class ValidationManifest:
+    """Check results of document parts, kept by content hash between validations.
+
+    A validator given a manifest reuses a part's stored result for a check as
+    long as the part and any other content the result depends on (such as its
+    .rels file or its original) are unchanged, and stores the results it
+    computes. Checks spanning several parts store facts per part (relationship
+    targets, root elements, content type declarations, IDs) and combine them
+    on every run, so only changed parts are parsed and checked again.
+
+    Example:
+        manifest = ValidationManifest.load("validation.json")
+        DOCXSchemaValidator(unpacked_dir, original, manifest=manifest).validate()
+        manifest.save("validation.json")
+    """
+
+    # Bump when checks change what they store
+    VERSION = 1
+
+    def __init__(self):
+        # Validator class name -> part name -> check -> [key, result]
+        self.results = {}
+
+    @classmethod
+    def load(cls, path):
+        """Read a saved manifest; a missing, invalid or outdated file reads as empty."""
+        manifest = cls()
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return manifest
+        if isinstance(data, dict) and data.get("version") == cls.VERSION:
+            manifest.results = data["results"]
+        return manifest
+
+    def save(self, path):
+        """Write the manifest to a file, replacing it atomically."""
+        path = Path(path)
+        partial = path.with_name(f".{path.name}.partial")
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "results": self.results}, f)
+        os.replace(partial, path)
+
+    def get(self, validator, part, check, key):
+        """Return a stored result, or None if there is none for this key."""
+        entry = self.results.get(validator, {}).get(part, {}).get(check)
+        if entry is not None and entry[0] == key:
+            return entry[1]
+        return None
+
+    def put(self, validator, part, check, key, result):
+        """Store a result, replacing the part's previous result for the check."""
+        parts = self.results.setdefault(validator, {})
+        parts.setdefault(part, {})[check] = [key, result]
+
+
+# Schema path -> compiled XMLSchema, shared by all validators in the process
+_schemas = {}
+
+# (validator class, part name, SHA-256 of content) -> XSD errors of an original
+# part, so repeated validations against the same original validate it once
+_original_errors = {}
+
+
+def _load_schema(schema_path):
+    """Return the compiled XMLSchema of an XSD file, compiling it once per process.
+
+    Compiled schemas cannot be serialized, so each process compiles a schema
+    the first time it validates a part against it.
+    """
+    schema_path = Path(schema_path)
+    schema = _schemas.get(schema_path)
+    if schema is None:
+        with open(schema_path, "rb") as xsd_file:
+            parser = lxml.etree.XMLParser()
+            xsd_doc = lxml.etree.parse(
+                xsd_file, parser=parser, base_url=str(schema_path)
+            )
+            schema = lxml.etree.XMLSchema(xsd_doc)
+        _schemas[schema_path] = schema
+    return schema
+
+
+def _validate_xsd_batch(validator, items):
+    """Worker process entry point: _validate_single_file_xsd() of (file, content)."""
+    unpacked_dir = validator.unpacked_dir.resolve()
+    return [
+        validator._validate_single_file_xsd(xml_file, unpacked_dir, content=content)
+        for xml_file, content in items
+    ]
+
+
 class BaseSchemaValidator:
     """Base validator with common validation logic for document files."""
 
@@ -103,10 +224,29 @@ class BaseSchemaValidator:
         "http://www.w3.org/XML/1998/namespace",
     }
 
-    def __init__(self, unpacked_dir, original_file, verbose=False):
+    def __init__(
+        self, unpacked_dir, original_file, verbose=False, workers=1, manifest=None
+    ):
+        """
+        Args:
+            unpacked_dir: Directory of the edited document
+            original_file: Path to the original document file, or a mapping of
+                part name to bytes as returned by read_original_parts()
+            verbose: Enable verbose output
+            workers: Number of processes validating parts against XSD schemas
+            manifest: ValidationManifest whose results of unchanged parts are
+                reused and which receives the new results (default: none)
+        """
         self.unpacked_dir = Path(unpacked_dir).resolve()
-        self.original_file = Path(original_file)
+        if isinstance(original_file, Mapping):
+            self.original_file = None
+            self._original_parts = original_file
+        else:
+            self.original_file = Path(original_file)
+            self._original_parts = None
         self.verbose = verbose
+        self.workers = workers
+        self.manifest = manifest
 
         # Set schemas directory
         self.schemas_dir = Path(__file__).parent.parent.parent / "schemas"
@@ -116,10 +256,88 @@ class BaseSchemaValidator:
         self.xml_files = [
             f for pattern in patterns for f in self.unpacked_dir.rglob(pattern)
         ]
+        # Path -> parsed tree, or the exception parsing it raised (see _parse)
+        self._trees = {}
+        # Path -> _validate_single_file_xsd() result computed by worker processes
+        self._xsd_results = {}
+        # Path -> SHA-256 of the file's content (see _content_hash)
+        self._hashes = {}
 
         if not self.xml_files:
             print(f"Warning: No XML files found in {self.unpacked_dir}")
 
+    def __getstate__(self):
+        # Sent to XSD worker processes, which are given part contents
+        # explicitly and parse files themselves
+        state = self.__dict__.copy()
+        state.update(_trees={}, _original_parts={}, _xsd_results={}, manifest=None)
+        return state
+
+    @property
+    def original_parts(self):
+        """Part name -> bytes of the original document, read on first use."""
+        if self._original_parts is None:
+            self._original_parts = read_original_parts(self.original_file)
+        return self._original_parts
+
+    def _parse(self, xml_file):
+        """Return the parsed tree of a file, parsing each file once per validator.
+
+        The tree is shared by all checks and must not be modified; checks that
+        modify it use _parse_copy(). A file that fails to parse raises the same
+        error on every call.
+        """
+        xml_file = Path(xml_file)
+        tree = self._trees.get(xml_file)
+        if tree is None:
+            try:
+                tree = lxml.etree.parse(str(xml_file))
+            except Exception as e:
+                tree = e
+            self._trees[xml_file] = tree
+        if isinstance(tree, Exception):
+            raise tree
+        return tree
+
+    def _parse_copy(self, xml_file):
+        """Return a private copy of a file's parsed tree that may be modified."""
+        return copy.deepcopy(self._parse(xml_file))
+
+    def _content_hash(self, path):
+        """Return the SHA-256 of a file's content, or "-" if there is no such file."""
+        digest = self._hashes.get(path)
+        if digest is None:
+            try:
+                digest = hashlib.sha256(Path(path).read_bytes()).hexdigest()
+            except FileNotFoundError:
+                digest = "-"
+            self._hashes[path] = digest
+        return digest
+
+    def _part_result(self, check, xml_file, compute, depends_on=()):
+        """Return compute(xml_file), or the stored result if its input is unchanged.
+
+        Args:
+            check: Name the result is stored under
+            xml_file: File the result is computed from
+            compute: Function of xml_file returning a JSON-serializable result
+            depends_on: Hashes of other content the result depends on
+        """
+        if self.manifest is None:
+            return compute(xml_file)
+        entry = self._manifest_entry(check, xml_file, depends_on)
+        result = self.manifest.get(*entry)
+        if result is None:
+            result = compute(xml_file)
+            self.manifest.put(*entry, result)
+        return result
+
+    def _manifest_entry(self, check, xml_file, depends_on=()):
+        """Return the (validator, part, check, key) a manifest stores a result under."""
+        part = xml_file.relative_to(self.unpacked_dir).as_posix()
+        key = ":".join((self._content_hash(xml_file), *depends_on))
+        return type(self).__name__, part, check, key
+
     def validate(self):
         """Run all validation checks and return True if all pass."""
         raise NotImplementedError("Subclasses must implement the validate method")
@@ -129,19 +347,7 @@ class BaseSchemaValidator:
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                # Try to parse the XML file
-                lxml.etree.parse(str(xml_file))
-            except lxml.etree.XMLSyntaxError as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Line {e.lineno}: {e.msg}"
-                )
-            except Exception as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                    f"Unexpected error: {str(e)}"
-                )
+            errors.extend(self._part_result("xml", xml_file, self._xml_errors))
 
         if errors:
             print(f"FAILED - Found {len(errors)} XML violations:")
@@ -153,26 +359,30 @@ class BaseSchemaValidator:
                 print("PASSED - All XML files are well-formed")
             return True
 
+    def _xml_errors(self, xml_file):
+        try:
+            # Try to parse the XML file
+            self._parse(xml_file)
+        except lxml.etree.XMLSyntaxError as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Line {e.lineno}: {e.msg}"
+            ]
+        except Exception as e:
+            return [
+                f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                f"Unexpected error: {str(e)}"
+            ]
+        return []
+
     def validate_namespaces(self):
         """Validate that namespace prefixes in Ignorable attributes are declared."""
         errors = []
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
-
-                for attr_val in [
-                    v for k, v in root.attrib.items() if k.endswith("Ignorable")
-                ]:
-                    undeclared = set(attr_val.split()) - declared
-                    errors.extend(
-                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                        f"Namespace '{ns}' in Ignorable but not declared"
-                        for ns in undeclared
-                    )
-            except lxml.etree.XMLSyntaxError:
-                continue
+            errors.extend(
+                self._part_result("namespaces", xml_file, self._namespace_errors)
+            )
 
         if errors:
             print(f"FAILED - {len(errors)} namespace issues:")
@@ -183,86 +393,51 @@ class BaseSchemaValidator:
             print("PASSED - All namespace prefixes properly declared")
         return True
 
+    def _namespace_errors(self, xml_file):
+        errors = []
+        try:
+            root = self._parse(xml_file).getroot()
+            declared = set(root.nsmap.keys()) - {None}  # Exclude default namespace
+
+            for attr_val in [
+                v for k, v in root.attrib.items() if k.endswith("Ignorable")
+            ]:
+                undeclared = set(attr_val.split()) - declared
+                errors.extend(
+                    f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                    f"Namespace '{ns}' in Ignorable but not declared"
+                    for ns in undeclared
+                )
+        except lxml.etree.XMLSyntaxError:
+            pass
+        return errors
+
     def validate_unique_ids(self):
         """Validate that specific IDs are unique according to OOXML requirements."""
         errors = []
         global_ids = {}  # Track globally unique IDs across all files
 
         for xml_file in self.xml_files:
-            try:
-                root = lxml.etree.parse(str(xml_file)).getroot()
-                file_ids = {}  # Track IDs that must be unique within this file
+            for event in self._part_result("ids", xml_file, self._id_events):
+                if event[0] == "error":
+                    errors.append(event[1])
+                    continue
 
-                # Remove all mc:AlternateContent elements from the tree
-                mc_elements = root.xpath(
-                    ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
-                )
-                for elem in mc_elements:
-                    elem.getparent().remove(elem)
-
-                # Now check IDs in the cleaned tree
-                for elem in root.iter():
-                    # Get the element name without namespace
-                    tag = (
-                        elem.tag.split("}")[-1].lower()
-                        if "}" in elem.tag
-                        else elem.tag.lower()
+                # Check global uniqueness
+                _, id_value, line, tag = event
+                if id_value in global_ids:
+                    prev_file, prev_line, prev_tag = global_ids[id_value]
+                    errors.append(
+                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                        f"Line {line}: Global ID '{id_value}' in <{tag}> "
+                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
+                    )
+                else:
+                    global_ids[id_value] = (
+                        xml_file.relative_to(self.unpacked_dir),
+                        line,
+                        tag,
                     )
-
-                    # Check if this element type has ID uniqueness requirements
-                    if tag in self.UNIQUE_ID_REQUIREMENTS:
-                        attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
-
-                        # Look for the specified attribute
-                        id_value = None
-                        for attr, value in elem.attrib.items():
-                            attr_local = (
-                                attr.split("}")[-1].lower()
-                                if "}" in attr
-                                else attr.lower()
-                            )
-                            if attr_local == attr_name:
-                                id_value = value
-                                break
-
-                        if id_value is not None:
-                            if scope == "global":
-                                # Check global uniqueness
-                                if id_value in global_ids:
-                                    prev_file, prev_line, prev_tag = global_ids[
-                                        id_value
-                                    ]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Global ID '{id_value}' in <{tag}> "
-                                        f"already used in {prev_file} at line {prev_line} in <{prev_tag}>"
-                                    )
-                                else:
-                                    global_ids[id_value] = (
-                                        xml_file.relative_to(self.unpacked_dir),
-                                        elem.sourceline,
-                                        tag,
-                                    )
-                            elif scope == "file":
-                                # Check file-level uniqueness
-                                key = (tag, attr_name)
-                                if key not in file_ids:
-                                    file_ids[key] = {}
-
-                                if id_value in file_ids[key]:
-                                    prev_line = file_ids[key][id_value]
-                                    errors.append(
-                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
-                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
-                                        f"(first occurrence at line {prev_line})"
-                                    )
-                                else:
-                                    file_ids[key][id_value] = elem.sourceline
-
-            except (lxml.etree.XMLSyntaxError, Exception) as e:
-                errors.append(
-                    f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"
-                )
 
         if errors:
             print(f"FAILED - Found {len(errors)} ID uniqueness violations:")
@@ -274,6 +449,77 @@ class BaseSchemaValidator:
                 print("PASSED - All required IDs are unique")
             return True
 
+    def _id_events(self, xml_file):
+        """List a file's ID problems and global IDs in document order.
+
+        Returns:
+            list: ["error", message] for duplicates within the file and errors,
+            ["global", id, line, tag] for IDs that must be globally unique
+        """
+        events = []
+        try:
+            # The copy has mc:AlternateContent removed below
+            root = self._parse_copy(xml_file).getroot()
+            file_ids = {}  # Track IDs that must be unique within this file
+
+            # Remove all mc:AlternateContent elements from the tree
+            mc_elements = root.xpath(
+                ".//mc:AlternateContent", namespaces={"mc": self.MC_NAMESPACE}
+            )
+            for elem in mc_elements:
+                elem.getparent().remove(elem)
+
+            # Now check IDs in the cleaned tree
+            for elem in root.iter():
+                # Get the element name without namespace
+                tag = (
+                    elem.tag.split("}")[-1].lower()
+                    if "}" in elem.tag
+                    else elem.tag.lower()
+                )
+
+                # Check if this element type has ID uniqueness requirements
+                if tag in self.UNIQUE_ID_REQUIREMENTS:
+                    attr_name, scope = self.UNIQUE_ID_REQUIREMENTS[tag]
+
+                    # Look for the specified attribute
+                    id_value = None
+                    for attr, value in elem.attrib.items():
+                        attr_local = (
+                            attr.split("}")[-1].lower() if "}" in attr else attr.lower()
+                        )
+                        if attr_local == attr_name:
+                            id_value = value
+                            break
+
+                    if id_value is not None:
+                        if scope == "global":
+                            events.append(["global", id_value, elem.sourceline, tag])
+                        elif scope == "file":
+                            # Check file-level uniqueness
+                            key = (tag, attr_name)
+                            if key not in file_ids:
+                                file_ids[key] = {}
+
+                            if id_value in file_ids[key]:
+                                prev_line = file_ids[key][id_value]
+                                events.append(
+                                    [
+                                        "error",
+                                        f"  {xml_file.relative_to(self.unpacked_dir)}: "
+                                        f"Line {elem.sourceline}: Duplicate {attr_name}='{id_value}' in <{tag}> "
+                                        f"(first occurrence at line {prev_line})",
+                                    ]
+                                )
+                            else:
+                                file_ids[key][id_value] = elem.sourceline
+
+        except (lxml.etree.XMLSyntaxError, Exception) as e:
+            events.append(
+                ["error", f"  {xml_file.relative_to(self.unpacked_dir)}: Error: {e}"]
+            )
+        return events
+
     def validate_file_references(self):
         """
         Validate that all .rels files properly reference files and that all files are referenced.
@@ -308,57 +554,50 @@ class BaseSchemaValidator:
 
         # Check each .rels file
         for rels_file in rels_files:
-            try:
-                # Parse relationships file
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-
-                # Get the directory where this .rels file is located
-                rels_dir = rels_file.parent
-
-                # Find all relationships and their targets
-                referenced_files = set()
-                broken_refs = []
-
-                for rel in rels_root.findall(
-                    ".//ns:Relationship",
-                    namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
-                ):
-                    target = rel.get("Target")
-                    if target and not target.startswith(
-                        ("http", "mailto:")
-                    ):  # Skip external URLs
-                        # Resolve the target path relative to the .rels file location
-                        if rels_file.name == ".rels":
-                            # Root .rels file - targets are relative to unpacked_dir
-                            target_path = self.unpacked_dir / target
-                        else:
-                            # Other .rels files - targets are relative to their parent's parent
-                            # e.g., word/_rels/document.xml.rels -> targets relative to word/
-                            base_dir = rels_dir.parent
-                            target_path = base_dir / target
-
-                        # Normalize the path and check if it exists
-                        try:
-                            target_path = target_path.resolve()
-                            if target_path.exists() and target_path.is_file():
-                                referenced_files.add(target_path)
-                                all_referenced_files.add(target_path)
-                            else:
-                                broken_refs.append((target, rel.sourceline))
-                        except (OSError, ValueError):
-                            broken_refs.append((target, rel.sourceline))
-
-                # Report broken references
-                if broken_refs:
-                    rel_path = rels_file.relative_to(self.unpacked_dir)
-                    for broken_ref, line_num in broken_refs:
-                        errors.append(
-                            f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
-                        )
+            error, targets = self._part_result(
+                "targets", rels_file, self._relationship_targets
+            )
+            if error is not None:
+                rel_path = rels_file.relative_to(self.unpacked_dir)
+                errors.append(f"  Error parsing {rel_path}: {error}")
+                continue
 
-            except Exception as e:
+            # Get the directory where this .rels file is located
+            rels_dir = rels_file.parent
+
+            # Find all relationships and their targets
+            referenced_files = set()
+            broken_refs = []
+
+            for target, line in targets:
+                # Resolve the target path relative to the .rels file location
+                if rels_file.name == ".rels":
+                    # Root .rels file - targets are relative to unpacked_dir
+                    target_path = self.unpacked_dir / target
+                else:
+                    # Other .rels files - targets are relative to their parent's parent
+                    # e.g., word/_rels/document.xml.rels -> targets relative to word/
+                    base_dir = rels_dir.parent
+                    target_path = base_dir / target
+
+                # Normalize the path and check if it exists
+                try:
+                    target_path = target_path.resolve()
+                    if target_path.exists() and target_path.is_file():
+                        referenced_files.add(target_path)
+                        all_referenced_files.add(target_path)
+                    else:
+                        broken_refs.append((target, line))
+                except (OSError, ValueError):
+                    broken_refs.append((target, line))
+
+            # Report broken references
+            if broken_refs:
                 rel_path = rels_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error parsing {rel_path}: {e}")
+                for broken_ref, line_num in broken_refs:
+                    errors.append(
+                        f"  {rel_path}: Line {line_num}: Broken reference to {broken_ref}"
+                    )
 
         # Check for unreferenced files (files that exist but are not referenced anywhere)
         unreferenced_files = set(all_files) - all_referenced_files
@@ -385,13 +624,29 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _relationship_targets(self, rels_file):
+        """Return [parse error or None, [[target, line], ...]] of internal targets."""
+        try:
+            rels_root = self._parse(rels_file).getroot()
+        except Exception as e:
+            return [str(e), []]
+        targets = []
+        for rel in rels_root.findall(
+            ".//ns:Relationship",
+            namespaces={"ns": self.PACKAGE_RELATIONSHIPS_NAMESPACE},
+        ):
+            target = rel.get("Target")
+            if target and not target.startswith(
+                ("http", "mailto:")
+            ):  # Skip external URLs
+                targets.append([target, rel.sourceline])
+        return [None, targets]
+
     def validate_all_relationship_ids(self):
         """
         Validate that all r:id attributes in XML files reference existing IDs
         in their corresponding .rels files, and optionally validate relationship types.
         """
-        import lxml.etree
-
         errors = []
 
         # Process each XML file that might contain r:id references
@@ -409,68 +664,14 @@ class BaseSchemaValidator:
             if not rels_file.exists():
                 continue
 
-            try:
-                # Parse the .rels file to get valid relationship IDs and their types
-                rels_root = lxml.etree.parse(str(rels_file)).getroot()
-                rid_to_type = {}
-
-                for rel in rels_root.findall(
-                    f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
-                ):
-                    rid = rel.get("Id")
-                    rel_type = rel.get("Type", "")
-                    if rid:
-                        # Check for duplicate rIds
-                        if rid in rid_to_type:
-                            rels_rel_path = rels_file.relative_to(self.unpacked_dir)
-                            errors.append(
-                                f"  {rels_rel_path}: Line {rel.sourceline}: "
-                                f"Duplicate relationship ID '{rid}' (IDs must be unique)"
-                            )
-                        # Extract just the type name from the full URL
-                        type_name = (
-                            rel_type.split("/")[-1] if "/" in rel_type else rel_type
-                        )
-                        rid_to_type[rid] = type_name
-
-                # Parse the XML file to find all r:id references
-                xml_root = lxml.etree.parse(str(xml_file)).getroot()
-
-                # Find all elements with r:id attributes
-                for elem in xml_root.iter():
-                    # Check for r:id attribute (relationship ID)
-                    rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
-                    if rid_attr:
-                        xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                        elem_name = (
-                            elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
-                        )
-
-                        # Check if the ID exists
-                        if rid_attr not in rid_to_type:
-                            errors.append(
-                                f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                f"<{elem_name}> references non-existent relationship '{rid_attr}' "
-                                f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
-                            )
-                        # Check if we have type expectations for this element
-                        elif self.ELEMENT_RELATIONSHIP_TYPES:
-                            expected_type = self._get_expected_relationship_type(
-                                elem_name
-                            )
-                            if expected_type:
-                                actual_type = rid_to_type[rid_attr]
-                                # Check if the actual type matches or contains the expected type
-                                if expected_type not in actual_type.lower():
-                                    errors.append(
-                                        f"  {xml_rel_path}: Line {elem.sourceline}: "
-                                        f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
-                                        f"but should point to a '{expected_type}' relationship"
-                                    )
-
-            except Exception as e:
-                xml_rel_path = xml_file.relative_to(self.unpacked_dir)
-                errors.append(f"  Error processing {xml_rel_path}: {e}")
+            errors.extend(
+                self._part_result(
+                    "relationship_ids",
+                    xml_file,
+                    self._relationship_id_errors,
+                    depends_on=(self._content_hash(rels_file),),
+                )
+            )
 
         if errors:
             print(f"FAILED - Found {len(errors)} relationship ID reference errors:")
@@ -483,6 +684,75 @@ class BaseSchemaValidator:
                 print("PASSED - All relationship ID references are valid")
             return True
 
+    def _relationship_id_errors(self, xml_file):
+        """Return the errors of a file's r:id references to its .rels file."""
+        rels_file = xml_file.parent / "_rels" / f"{xml_file.name}.rels"
+        errors = []
+
+        try:
+            # Parse the .rels file to get valid relationship IDs and their types
+            rels_root = self._parse(rels_file).getroot()
+            rid_to_type = {}
+
+            for rel in rels_root.findall(
+                f".//{{{self.PACKAGE_RELATIONSHIPS_NAMESPACE}}}Relationship"
+            ):
+                rid = rel.get("Id")
+                rel_type = rel.get("Type", "")
+                if rid:
+                    # Check for duplicate rIds
+                    if rid in rid_to_type:
+                        rels_rel_path = rels_file.relative_to(self.unpacked_dir)
+                        errors.append(
+                            f"  {rels_rel_path}: Line {rel.sourceline}: "
+                            f"Duplicate relationship ID '{rid}' (IDs must be unique)"
+                        )
+                    # Extract just the type name from the full URL
+                    type_name = (
+                        rel_type.split("/")[-1] if "/" in rel_type else rel_type
+                    )
+                    rid_to_type[rid] = type_name
+
+            # Parse the XML file to find all r:id references
+            xml_root = self._parse(xml_file).getroot()
+
+            # Find all elements with r:id attributes
+            for elem in xml_root.iter():
+                # Check for r:id attribute (relationship ID)
+                rid_attr = elem.get(f"{{{self.OFFICE_RELATIONSHIPS_NAMESPACE}}}id")
+                if rid_attr:
+                    xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+                    elem_name = (
+                        elem.tag.split("}")[-1] if "}" in elem.tag else elem.tag
+                    )
+
+                    # Check if the ID exists
+                    if rid_attr not in rid_to_type:
+                        errors.append(
+                            f"  {xml_rel_path}: Line {elem.sourceline}: "
+                            f"<{elem_name}> references non-existent relationship '{rid_attr}' "
+                            f"(valid IDs: {', '.join(sorted(rid_to_type.keys())[:5])}{'...' if len(rid_to_type) > 5 else ''})"
+                        )
+                    # Check if we have type expectations for this element
+                    elif self.ELEMENT_RELATIONSHIP_TYPES:
+                        expected_type = self._get_expected_relationship_type(
+                            elem_name
+                        )
+                        if expected_type:
+                            actual_type = rid_to_type[rid_attr]
+                            # Check if the actual type matches or contains the expected type
+                            if expected_type not in actual_type.lower():
+                                errors.append(
+                                    f"  {xml_rel_path}: Line {elem.sourceline}: "
+                                    f"<{elem_name}> references '{rid_attr}' which points to '{actual_type}' "
+                                    f"but should point to a '{expected_type}' relationship"
+                                )
+
+        except Exception as e:
+            xml_rel_path = xml_file.relative_to(self.unpacked_dir)
+            errors.append(f"  Error processing {xml_rel_path}: {e}")
+        return errors
+
     def _get_expected_relationship_type(self, element_name):
         """
         Get the expected relationship type for an element.
@@ -530,26 +800,13 @@ class BaseSchemaValidator:
             return False
 
         try:
-            # Parse and get all declared parts and extensions
-            root = lxml.etree.parse(str(content_types_file)).getroot()
-            declared_parts = set()
-            declared_extensions = set()
-
-            # Get Override declarations (specific files)
-            for override in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"
-            ):
-                part_name = override.get("PartName")
-                if part_name is not None:
-                    declared_parts.add(part_name.lstrip("/"))
-
-            # Get Default declarations (by extension)
-            for default in root.findall(
-                f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"
-            ):
-                extension = default.get("Extension")
-                if extension is not None:
-                    declared_extensions.add(extension.lower())
+            # Get all declared parts and extensions
+            declared_parts, declared_extensions = map(
+                set,
+                self._part_result(
+                    "declarations", content_types_file, self._declared_content_types
+                ),
+            )
 
             # Root elements that require content type declaration
             declarable_roots = {
@@ -592,18 +849,15 @@ class BaseSchemaValidator:
                 ):
                     continue
 
-                try:
-                    root_tag = lxml.etree.parse(str(xml_file)).getroot().tag
-                    root_name = root_tag.split("}")[-1] if "}" in root_tag else root_tag
-
-                    if root_name in declarable_roots and path_str not in declared_parts:
-                        errors.append(
-                            f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
-                        )
-
-                except Exception:
+                root_name = self._part_result("root", xml_file, self._root_name)
+                if root_name is None:
                     continue  # Skip unparseable files
 
+                if root_name in declarable_roots and path_str not in declared_parts:
+                    errors.append(
+                        f"  {path_str}: File with <{root_name}> root not declared in [Content_Types].xml"
+                    )
+
             # Check all non-XML files for Default extension declarations
             for file_path in all_files:
                 # Skip XML files and metadata files (already checked above)
@@ -638,6 +892,33 @@ class BaseSchemaValidator:
                 )
             return True
 
+    def _declared_content_types(self, content_types_file):
+        """Return [part names, extensions] declared in [Content_Types].xml."""
+        root = self._parse(content_types_file).getroot()
+        declared_parts = []
+        declared_extensions = []
+
+        # Get Override declarations (specific files)
+        for override in root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Override"):
+            part_name = override.get("PartName")
+            if part_name is not None:
+                declared_parts.append(part_name.lstrip("/"))
+
+        # Get Default declarations (by extension)
+        for default in root.findall(f".//{{{self.CONTENT_TYPES_NAMESPACE}}}Default"):
+            extension = default.get("Extension")
+            if extension is not None:
+                declared_extensions.append(extension.lower())
+        return [declared_parts, declared_extensions]
+
+    def _root_name(self, xml_file):
+        """Return the local name of a file's root element, or None if unparseable."""
+        try:
+            root_tag = self._parse(xml_file).getroot().tag
+        except Exception:
+            return None
+        return root_tag.split("}")[-1] if "}" in root_tag else root_tag
+
     def validate_file_against_xsd(self, xml_file, verbose=False):
         """Validate a single XML file against XSD schema, comparing with original.
 
@@ -652,10 +933,13 @@ class BaseSchemaValidator:
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
 
-        # Validate current file
-        is_valid, current_errors = self._validate_single_file_xsd(
-            xml_file, unpacked_dir
-        )
+        # Validate current file, unless a worker process already did
+        if xml_file in self._xsd_results:
+            is_valid, current_errors = self._xsd_results.pop(xml_file)
+        else:
+            is_valid, current_errors = self._validate_single_file_xsd(
+                xml_file, unpacked_dir
+            )
 
         if is_valid is None:
             return None, set()  # Skipped
@@ -692,10 +976,16 @@ class BaseSchemaValidator:
         valid_count = 0
         skipped_count = 0
 
+        if self.workers > 1:
+            self._validate_xsd_in_workers()
+
         for xml_file in self.xml_files:
             relative_path = str(xml_file.relative_to(self.unpacked_dir))
-            is_valid, new_file_errors = self.validate_file_against_xsd(
-                xml_file, verbose=False
+            is_valid, new_file_errors = self._part_result(
+                "xsd",
+                xml_file,
+                self._new_xsd_errors,
+                depends_on=self._xsd_depends_on(xml_file),
             )
 
             if is_valid is None:
@@ -738,6 +1028,59 @@ class BaseSchemaValidator:
                 print("\nPASSED - No new XSD validation errors introduced")
             return True
 
+    def _new_xsd_errors(self, xml_file):
+        """Return [is_valid, new errors] of validate_file_against_xsd() as lists."""
+        is_valid, new_errors = self.validate_file_against_xsd(xml_file, verbose=False)
+        return [is_valid, list(new_errors)]
+
+    def _xsd_depends_on(self, xml_file):
+        """Return the hash of a file's original part, which its new errors depend on."""
+        key, _ = self._original_part(Path(xml_file).resolve())
+        return (key[2].hex() if key is not None else "-",)
+
+    def _validate_xsd_in_workers(self):
+        """Validate parts, then the originals of failing parts, in worker processes.
+
+        Results are stored where validate_file_against_xsd() looks them up, so
+        reporting and its order are the same as when validating serially.
+        """
+        files = [
+            Path(f).resolve()
+            for f in self.xml_files
+            if self._get_schema_path(f)
+            and (
+                self.manifest is None
+                or self.manifest.get(
+                    *self._manifest_entry("xsd", f, self._xsd_depends_on(f))
+                )
+                is None
+            )
+        ]
+        if not files:
+            return
+        workers = min(self.workers, len(files))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = self._map_xsd(executor, workers, [(f, None) for f in files])
+            self._xsd_results.update(zip(files, results))
+
+            pending = {}
+            for xml_file, (is_valid, _) in self._xsd_results.items():
+                if is_valid is False:
+                    key, content = self._original_part(xml_file)
+                    if content is not None and key not in _original_errors:
+                        pending[key] = (xml_file, content)
+            results = self._map_xsd(executor, workers, list(pending.values()))
+            for key, (_, errors) in zip(pending, results):
+                _original_errors[key] = frozenset(errors or ())
+
+    def _map_xsd(self, executor, workers, items):
+        """Run _validate_single_file_xsd() on (file, content) pairs, in order."""
+        size = max(1, -(-len(items) // (workers * 4)))
+        batches = [items[i : i + size] for i in range(0, len(items), size)]
+        validators = [self] * len(batches)
+        for results in executor.map(_validate_xsd_batch, validators, batches):
+            yield from results
+
     def _get_schema_path(self, xml_file):
         """Determine the appropriate schema path for an XML file."""
         # Check exact filename match
@@ -823,24 +1166,24 @@ class BaseSchemaValidator:
 
         return xml_doc
 
-    def _validate_single_file_xsd(self, xml_file, base_path):
-        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set)."""
+    def _validate_single_file_xsd(self, xml_file, base_path, content=None):
+        """Validate a single XML file against XSD schema. Returns (is_valid, errors_set).
+
+        If content (bytes) is given it is validated instead of the file's own
+        content; xml_file and base_path then only select the schema.
+        """
         schema_path = self._get_schema_path(xml_file)
         if not schema_path:
             return None, None  # Skip file
 
         try:
-            # Load schema
-            with open(schema_path, "rb") as xsd_file:
-                parser = lxml.etree.XMLParser()
-                xsd_doc = lxml.etree.parse(
-                    xsd_file, parser=parser, base_url=str(schema_path)
-                )
-                schema = lxml.etree.XMLSchema(xsd_doc)
+            schema = _load_schema(schema_path)
 
-            # Load and preprocess XML
-            with open(xml_file, "r") as f:
-                xml_doc = lxml.etree.parse(f)
+            # Load and preprocess XML; preprocessing works on a copy
+            if content is not None:
+                xml_doc = lxml.etree.parse(io.BytesIO(content))
+            else:
+                xml_doc = self._parse(xml_file)
 
             xml_doc, _ = self._remove_template_tags_from_text_nodes(xml_doc)
             xml_doc = self._preprocess_for_mc_ignorable(xml_doc)
@@ -869,39 +1212,45 @@ class BaseSchemaValidator:
     def _get_original_file_errors(self, xml_file):
         """Get XSD validation errors from a single file in the original document.
 
+        The original part is validated from memory on first use; the result is
+        kept for the process by part name and content hash.
+
         Args:
             xml_file: Path to the XML file in unpacked_dir to check
 
         Returns:
             set: Set of error messages from the original file
         """
-        import tempfile
-        import zipfile
-
         # Resolve both paths to handle symlinks (e.g., /var vs /private/var on macOS)
         xml_file = Path(xml_file).resolve()
         unpacked_dir = self.unpacked_dir.resolve()
-        relative_path = xml_file.relative_to(unpacked_dir)
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            # Extract original file
-            with zipfile.ZipFile(self.original_file, "r") as zip_ref:
-                zip_ref.extractall(temp_path)
 
-            # Find corresponding file in original
-            original_xml_file = temp_path / relative_path
+        key, content = self._original_part(xml_file)
+        if content is None:
+            # File didn't exist in original, so no original errors
+            return set()
 
-            if not original_xml_file.exists():
-                # File didn't exist in original, so no original errors
-                return set()
-
-            # Validate the specific file in original
+        errors = _original_errors.get(key)
+        if errors is None:
+            # Validate the original content against the same schema
             is_valid, errors = self._validate_single_file_xsd(
-                original_xml_file, temp_path
+                xml_file, unpacked_dir, content=content
             )
-            return errors if errors else set()
+            errors = frozenset(errors or ())
+            _original_errors[key] = errors
+        return set(errors)
+
+    def _original_part(self, xml_file):
+        """Return (original errors memo key, content) of a file's original part.
+
+        Both are None if the part is not in the original document.
+        """
+        relative_path = xml_file.relative_to(self.unpacked_dir.resolve())
+        part_name = relative_path.as_posix()
+        content = self.original_parts.get(part_name)
+        if content is None:
+            return None, None
+        return (type(self), part_name, hashlib.sha256(content).digest()), content
 
     def _remove_template_tags_from_text_nodes(self, xml_doc):
         """Remove template tags from XML text nodes and collect warnings.